@@ -5,6 +5,8 @@ from routes.auth import auth_bp
 from routes.measset_gen import measset_gen_bp
 from routes.db_api import db_api_bp
 from routes.ml import ml_bp
+from routes.admin import admin_bp
+from routes.health import health_bp
 
 
 def create_app():
@@ -38,6 +40,13 @@ def create_app():
     app.register_blueprint(measset_gen_bp)
     app.register_blueprint(db_api_bp)
     app.register_blueprint(ml_bp)
+    app.register_blueprint(admin_bp)
+    app.register_blueprint(health_bp)
+
+    # 선택적 warm-up (WARMUP_ENABLED=true): ODBC 드라이버/DNS/연결 풀/모델 사전 준비
+    from utils.warmup import start_warmup
+
+    start_warmup()
 
     @app.teardown_appcontext
     def teardown_db(exception):
@@ -0,0 +1,107 @@
+"""
+중복 제거 + GroupIndex 벤치마크: 기존 RemoveDuplicate/GroupIdx 구현 vs DedupeGroupEngine
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_dedupe
+    python -m benchmarks.bench_dedupe --rows 10000 100000 1000000 --legacy-max-rows 1000000
+
+입력은 합성 시퀀스 파일을 실제와 같은 방식(loadfile, 축소된 타입)으로 읽은 DataFrame이며,
+일부 값에 결측을 넣어 Cb/D 결측 처리까지 비교합니다.
+각 크기마다 두 구현의 결과가 완전히 동일한지(assert_frame_equal) 함께 확인합니다.
+"""
+
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_sequence import make_raw_sequence
+from pkg_MeasSetGen.data_inout import loadfile, SEQUENCE_COLUMNS, SEQUENCE_DTYPES
+from pkg_MeasSetGen.dedupe_group import DedupeGroupEngine, DEDUPE_COLUMNS
+
+LAST_GROUP_IDX = 100
+
+
+def legacy_remove_duplicate(df):
+    """단일 패스 엔진 이전 RemoveDuplicate.remove_duplicate"""
+    df = df.loc[:, SEQUENCE_COLUMNS]
+
+    df_BM = df[df["Mode"].isin(["B", "M"])].reset_index(drop=True)
+    duplicated_mask = df_BM.duplicated(subset=DEDUPE_COLUMNS, keep=False)
+    df_BM["isDuplicate"] = duplicated_mask.astype(int)
+    df_BM = df_BM[(df_BM["isDuplicate"] != 1) | (df_BM["Mode"] != "M")]
+
+    df_CD = df[df["Mode"].isin(["Cb", "D"])].reset_index(drop=True)
+    df_CD = df_CD.fillna(
+        {c: 0 for c in df_CD.columns if not isinstance(df_CD[c].dtype, pd.CategoricalDtype)}
+    )
+    duplicated_mask = df_CD.duplicated(subset=DEDUPE_COLUMNS, keep=False)
+    df_CD["isDuplicate"] = duplicated_mask.astype(int)
+    df_CD = df_CD[(df_CD["isDuplicate"] != 1) | (df_CD["Mode"] != "D")]
+
+    df_CEUS = df[df["Mode"] == "Contrast"].copy()
+    if not df_CEUS.empty:
+        df_CEUS["isDuplicate"] = 0
+
+    return pd.concat([df_BM, df_CD, df_CEUS], ignore_index=True)
+
+
+def legacy_group(df, last_groupIdx):
+    """단일 패스 엔진 이전 GroupIdx.createGroupIdx + updateDuplicate"""
+    decreased = df["TxFocusLocCm"] < df["TxFocusLocCm"].shift()
+    df["GroupIndex"] = decreased.fillna(False).cumsum() + last_groupIdx + 1
+    df["isDuplicate"] = df.groupby("GroupIndex")["isDuplicate"].transform(
+        lambda x: 0 if 0 in x.values else 1
+    )
+    return df
+
+
+def load_sequence(n_rows, workdir, seed=0):
+    """합성 시퀀스 (결측 포함) → 파일 → loadfile"""
+    df = make_raw_sequence(n_rows, seed=seed, extra_columns=0)
+    df.loc[df.index[::11], "CpaDelayOffsetClk"] = np.nan
+    df.loc[df.index[5::13], "ElevAperIndex"] = np.nan
+    path = os.path.join(workdir, f"seq_{n_rows}.txt")
+    df.to_csv(path, sep="\t", index=False, encoding="cp949")
+    return loadfile(path, usecols=SEQUENCE_COLUMNS, dtype=SEQUENCE_DTYPES)
+
+
+def run_legacy(raw):
+    start = time.perf_counter()
+    result = legacy_group(legacy_remove_duplicate(raw), LAST_GROUP_IDX)
+    return result, time.perf_counter() - start
+
+
+def run_engine(raw):
+    start = time.perf_counter()
+    result = DedupeGroupEngine(LAST_GROUP_IDX).run(raw)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dedupe + GroupIndex engine benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--legacy-max-rows", type=int, default=1000000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'kept':>10} {'legacy(s)':>10} {'engine(s)':>10} {'speedup':>8}  identical")
+    with tempfile.TemporaryDirectory(prefix="aop_bench_") as workdir:
+        for n_rows in args.rows:
+            raw = load_sequence(n_rows, workdir)
+            engine_df, engine_sec = run_engine(raw)
+
+            if n_rows <= args.legacy_max_rows:
+                legacy_df, legacy_sec = run_legacy(raw)
+                pd.testing.assert_frame_equal(engine_df, legacy_df, check_exact=True)
+                print(
+                    f"{n_rows:>10} {len(engine_df):>10} {legacy_sec:>10.3f} {engine_sec:>10.3f} "
+                    f"{legacy_sec / engine_sec:>7.1f}x  yes"
+                )
+            else:
+                print(f"{n_rows:>10} {len(engine_df):>10} {'-':>10} {engine_sec:>10.3f} {'-':>8}  -")
+
+
+if __name__ == "__main__":
+    main()
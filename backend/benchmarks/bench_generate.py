@@ -0,0 +1,265 @@
+"""
+MeasSetGen.generate 전체 파이프라인 벤치마크 (DB / MLflow 스텁)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_generate
+    python -m benchmarks.bench_generate --rows 1000 5000 20000 --memory --json result.json
+    python -m benchmarks.bench_generate --rows 1000 --check-cache
+
+- 입력: benchmarks.synthetic_sequence 로 만든 합성 시퀀스 파일
+- DB: probe_geo 조회 / GroupIndex 구간 예약만 응답하는 스텁
+- 모델: intensity는 선형 스텁, temperature는 합성 데이터로 학습한 소형 XGBoost 아티팩트
+- 결과 CSV는 임시 디렉토리에 저장 후 삭제
+크기별 단계 계측(StageProfiler) 표를 출력하고, --json 지정 시 원본 계측 결과를 저장합니다.
+--check-cache 지정 시 캐시 미적중/적중 결과가 GroupIndex 구간만 다르고 나머지는 같은지 확인합니다.
+"""
+
+import os
+import json
+import argparse
+import tempfile
+from contextlib import ExitStack
+from unittest import mock
+
+import joblib
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+from flask import Flask, session
+
+from benchmarks.synthetic_sequence import write_sequence_file
+
+BENCH_DATABASE = "bench_db"
+BENCH_PROBE_ID = "9999"
+BENCH_PROBE_NAME = "BENCH"
+
+TEMPERATURE_FEATURES = [
+    "volt2",
+    "duty_approx",
+    "scan_inv",
+    "log_power_like_scan",
+    "numTxElements",
+    "txFrequencyHz",
+    "probePitchCm",
+]
+
+PROBE_GEOMETRY = {
+    "probePitchCm": 0.03,
+    "probeRadiusCm": 0.0,
+    "probeElevAperCm0": 0.4,
+    "probeElevAperCm1": 0.2,
+    "probeElevFocusRangCm": 2.0,
+    "probeElevFocusRangCm1": 0.0,
+    "probeNumElements": 192,
+}
+
+
+class StubSQL:
+    """MeasSetGen이 실행하는 조회만 응답하는 SQL 스텁"""
+
+    def __init__(self):
+        self.last_group_index = 0
+
+    def execute_output(self, query, params=None):
+        # GroupIndex 구간 예약: params = (probeid, probeid, probeid, size, probeid)
+        previous = self.last_group_index
+        self.last_group_index += params[3]
+        return pd.DataFrame({"previous": [previous]})
+
+    def execute_query(self, query, params=None, return_type=None):
+        sql = getattr(query, "sql", query)
+        if "probe_geo" in sql:
+            return pd.DataFrame([PROBE_GEOMETRY])
+        if "maxGroupIndex" in sql:
+            return pd.DataFrame({"maxGroupIndex": [0]})
+        raise NotImplementedError(f"bench stub: unexpected query {sql.strip()[:60]}")
+
+
+class StubIntensityModel:
+    """feature 행렬 → zt (선형 결합)"""
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=float)
+        weights = np.linspace(1e-7, 1e-3, X.shape[1])
+        return 2.0 + X @ weights / max(X.shape[1], 1)
+
+
+def build_temperature_artifact(path, seed=0, n_samples=5000):
+    """온도 예측용 소형 XGBoost 아티팩트 (Temp_Prr_predict.load_artifacts 형식)"""
+    rng = np.random.default_rng(seed)
+    volt = rng.uniform(5, 90, n_samples)
+    prf = np.exp(rng.uniform(np.log(100), np.log(30000), n_samples))
+    cycles = rng.integers(1, 8, n_samples)
+    freq = rng.uniform(1e6, 10e6, n_samples)
+    scan = rng.choice([0.0, 5.76], n_samples)
+    duty = cycles * prf / freq
+    scan_inv = np.where(scan == 0, 1.0, 1.0 / np.maximum(scan, 0.001))
+    X = pd.DataFrame(
+        {
+            "volt2": volt**2,
+            "duty_approx": duty,
+            "scan_inv": scan_inv,
+            "log_power_like_scan": np.log(volt**2 * duty * scan_inv + 0.001),
+            "numTxElements": rng.integers(1, 192, n_samples),
+            "txFrequencyHz": freq,
+            "probePitchCm": 0.03,
+        }
+    )[TEMPERATURE_FEATURES]
+    # TempRise ≈ 300·duty·scan_inv → g = TempRise / V²
+    y = 300.0 * duty * scan_inv / volt**2
+    booster = xgb.train(
+        {"max_depth": 6, "eta": 0.3, "objective": "reg:squarederror", "nthread": 1},
+        xgb.DMatrix(X, label=y, feature_names=TEMPERATURE_FEATURES),
+        num_boost_round=40,
+    )
+    joblib.dump({"booster": booster, "feature_columns": TEMPERATURE_FEATURES}, path)
+    return path
+
+
+def _stub_environment(stack, artifact_path):
+    """DB / MLflow / 온도 아티팩트 경로 스텁 적용"""
+    from pkg_MachineLearning.mlflow_integration import AOP_MLflowTracker
+    from pkg_MeasSetGen.probe_geometry import probe_geometry_repository
+
+    def tracker_init(self):
+        self.username = session.get("username")
+        self.password = session.get("password")
+        self.tracking_enabled = False
+        self.db = None
+
+    best_model = {"model": StubIntensityModel(), "model_name": "bench", "version_id": 0}
+    stub_sql = StubSQL()
+
+    stack.enter_context(mock.patch("utils.database_manager.get_db_connection", lambda db: stub_sql))
+    stack.enter_context(
+        mock.patch("pkg_MeasSetGen.create_groupidx.get_db_connection", lambda db: stub_sql)
+    )
+    stack.enter_context(mock.patch.object(AOP_MLflowTracker, "__init__", tracker_init))
+    stack.enter_context(
+        mock.patch.object(AOP_MLflowTracker, "load_best_model", lambda self, **kw: best_model)
+    )
+    stack.enter_context(
+        mock.patch.object(AOP_MLflowTracker, "log_prediction", lambda self, **kw: None)
+    )
+    stack.enter_context(
+        mock.patch.object(
+            AOP_MLflowTracker, "log_simple_prediction", staticmethod(lambda **kw: None)
+        )
+    )
+    stack.enter_context(
+        mock.patch("pkg_MeasSetGen.Temp_Prr_predict.artifact_path", lambda: artifact_path)
+    )
+    probe_geometry_repository.invalidate()
+
+
+def run_once(file_path, trace_memory):
+    from pkg_MeasSetGen.meas_generation import MeasSetGen
+
+    with mock.patch.dict(os.environ, {"MEASSET_PROFILE_MEMORY": str(trace_memory).lower()}):
+        meas_gen = MeasSetGen(BENCH_DATABASE, BENCH_PROBE_ID, BENCH_PROBE_NAME, file_path)
+        meas_gen.generate(use_cache=False)
+    return meas_gen.profile
+
+
+def check_cache(file_path, workdir):
+    """
+    같은 입력으로 generate 를 두 번 실행해 캐시 미적중(1회차)/적중(2회차) 결과 비교
+    - 2회차는 cache_hit 이고 1회차와 다른 파일에 저장
+    - GroupIndex 는 새로 예약한 구간으로 옮겨지고 나머지 값/컬럼은 동일
+    """
+    from pkg_MachineLearning.mlflow_integration import AOP_MLflowTracker
+    from pkg_MeasSetGen.generation_cache import generation_cache
+    from pkg_MeasSetGen.meas_generation import MeasSetGen
+
+    with ExitStack() as stack:
+        stack.enter_context(
+            mock.patch.object(generation_cache, "directory", os.path.join(workdir, "_cache"))
+        )
+        stack.enter_context(
+            mock.patch.object(
+                AOP_MLflowTracker, "get_production_fingerprint", classmethod(lambda cls: "bench")
+            )
+        )
+        stack.enter_context(mock.patch.dict(os.environ, {"MEASSET_CACHE_ENABLED": "true"}))
+
+        miss = MeasSetGen(BENCH_DATABASE, BENCH_PROBE_ID, BENCH_PROBE_NAME, file_path)
+        miss_csv = miss.generate()
+        hit = MeasSetGen(BENCH_DATABASE, BENCH_PROBE_ID, BENCH_PROBE_NAME, file_path)
+        hit_csv = hit.generate()
+
+    assert miss.profile["status"] == "succeeded", miss.profile["status"]
+    assert hit.profile["status"] == "cache_hit", hit.profile["status"]
+    assert miss_csv != hit_csv, "cache hit overwrote the cache-miss result"
+
+    expected = pd.read_csv(miss_csv)
+    actual = pd.read_csv(hit_csv)
+    # 스텁은 구간을 이어서 예약하므로 적중 결과는 미적중 결과 바로 다음 구간
+    assert actual["GroupIndex"].min() == expected["GroupIndex"].max() + 1
+    shift = int(actual["GroupIndex"].min() - expected["GroupIndex"].min())
+    expected["GroupIndex"] += shift
+    pd.testing.assert_frame_equal(actual, expected)
+    print(f"cache check: {len(actual):,} rows identical (GroupIndex +{shift})")
+
+
+def _print_profile(n_rows, profile):
+    print(f"\n[{n_rows:,} rows] total {profile['total_wall_s']:.3f}s")
+    print(
+        f"  {'stage':<20} {'wall (s)':>9} {'cpu (s)':>9} {'peak MB':>9} {'frame MB':>9}"
+        f" {'rows in':>10} {'rows out':>10}"
+    )
+    for record in profile["stages"]:
+        peak = "-" if record["peak_mem_mb"] is None else f"{record['peak_mem_mb']:.1f}"
+        frame = "-" if record.get("frame_mb") is None else f"{record['frame_mb']:.1f}"
+        rows_in = "-" if record["rows_in"] is None else f"{record['rows_in']:,}"
+        rows_out = "-" if record["rows_out"] is None else f"{record['rows_out']:,}"
+        print(
+            f"  {record['stage']:<20} {record['wall_s']:>9.3f} {record['cpu_s']:>9.3f}"
+            f" {peak:>9} {frame:>9} {rows_in:>10} {rows_out:>10}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 5_000])
+    parser.add_argument("--group-size", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=1, help="크기별 반복 횟수 (최소 시간 기록)")
+    parser.add_argument("--memory", action="store_true", help="tracemalloc 메모리 피크 측정")
+    parser.add_argument("--json", help="계측 결과 저장 경로")
+    parser.add_argument("--check-cache", action="store_true", help="캐시 적중 결과 확인")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="aop_bench_") as workdir, ExitStack() as stack:
+        artifact = build_temperature_artifact(os.path.join(workdir, "TempPRR_Predict.joblib"))
+        _stub_environment(stack, artifact)
+
+        app = Flask("aop_bench")
+        app.secret_key = "bench"
+        cwd = os.getcwd()
+        os.chdir(workdir)  # DataOut 결과 CSV를 임시 디렉토리에 저장
+        try:
+            with app.test_request_context():
+                session["username"], session["password"] = "bench", "bench"
+                for n_rows in args.rows:
+                    file_path = write_sequence_file(
+                        os.path.join(workdir, f"seq_{n_rows}.txt"),
+                        n_rows,
+                        group_size=args.group_size,
+                    )
+                    runs = [run_once(file_path, args.memory) for _ in range(args.repeat)]
+                    best = min(runs, key=lambda p: p["total_wall_s"])
+                    _print_profile(n_rows, best)
+                    results.append({"rows": n_rows, "profile": best})
+                    if args.check_cache:
+                        check_cache(file_path, workdir)
+        finally:
+            os.chdir(cwd)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nsaved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+SQL.insert_data 벤치마크: 기존 DataFrame.to_sql 경로 vs fast_executemany 배치 경로
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_insert --username USER --password PASS --database DB
+    python -m benchmarks.bench_insert --url sqlite:///bench.db   # 드라이버 없이 동작 확인용
+
+벤치마크 전용 테이블(aop_bench_insert)을 생성 후 삭제합니다.
+"""
+
+import argparse
+import os
+import time
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from config import Config
+from pkg_SQL.database import SQL
+
+BENCH_TABLE = "aop_bench_insert"
+
+
+def make_frame(n_rows, seed=0):
+    """meas_setting 과 유사한 컬럼 구성의 합성 데이터"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "GroupIndex": np.arange(n_rows) // 8 + 1,
+            "probeId": rng.integers(1, 100, n_rows),
+            "beamstyleIndex": rng.choice([0, 1, 5, 10, 15, 20], n_rows),
+            "TxFrequencyHz": rng.choice([2500000, 4000000, 5000000], n_rows),
+            "focusRangeCm": rng.uniform(0.5, 12, n_rows).round(2),
+            "numTxCycles": rng.uniform(1, 8, n_rows).round(2),
+            "AI_param": rng.uniform(1, 10, n_rows).round(1),
+            "measSetComments": rng.choice(["Beamstyle_A_Intensity", "Beamstyle_A_power"], n_rows),
+        }
+    )
+
+
+def _sql_for(args):
+    if args.url:
+        return SQL.from_url(args.url)
+    Config.load_config()
+    return SQL(args.username, args.password, args.database)
+
+
+def _reset_table(sql, df):
+    with sql.engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {BENCH_TABLE}"))
+    df.head(0).to_sql(BENCH_TABLE, sql.engine, index=False)
+
+
+def bench_to_sql(sql, df):
+    start = time.perf_counter()
+    with sql.engine.begin() as conn:
+        df.to_sql(BENCH_TABLE, conn, if_exists="append", index=False)
+    return time.perf_counter() - start
+
+
+def bench_insert_data(sql, df, batch_size):
+    start = time.perf_counter()
+    sql.insert_data(BENCH_TABLE, df, batch_size=batch_size, allowed_tables=(BENCH_TABLE,))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="SQLAlchemy URL (지정 시 SQL Server 접속 정보 무시)")
+    parser.add_argument("--username", default=os.environ.get("BENCH_DB_USER"))
+    parser.add_argument("--password", default=os.environ.get("BENCH_DB_PASSWORD"))
+    parser.add_argument("--database", default=os.environ.get("BENCH_DB_NAME"))
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    sql = _sql_for(args)
+    print(f"{'rows':>8} {'to_sql (s)':>12} {'rows/s':>10} {'bulk (s)':>10} {'rows/s':>10} {'speedup':>8}")
+    try:
+        for n_rows in args.rows:
+            df = make_frame(n_rows)
+            _reset_table(sql, df)
+            t_old = bench_to_sql(sql, df)
+            _reset_table(sql, df)
+            t_new = bench_insert_data(sql, df, args.batch_size)
+            print(
+                f"{n_rows:>8} {t_old:>12.3f} {n_rows / t_old:>10,.0f} "
+                f"{t_new:>10.3f} {n_rows / t_new:>10,.0f} {t_old / t_new:>7.1f}x"
+            )
+    finally:
+        with sql.engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {BENCH_TABLE}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+ParamGen.gen_sequence 벤치마크: 기존 행 단위 apply 구현 vs 컬럼 단위(벡터) 구현
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_paramgen
+    python -m benchmarks.bench_paramgen --rows 1000 10000 100000 1000000 --legacy-max-rows 100000
+
+각 크기마다 두 구현의 결과가 완전히 동일한지(assert_frame_equal) 함께 확인합니다.
+legacy-max-rows 보다 큰 입력은 기존 구현을 건너뛰고 신규 구현만 측정합니다.
+"""
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+from pkg_MeasSetGen.param_gen import ParamGen, FREQUENCY_TABLE, MODE_SUBMODE_MAP
+
+RLE_SAMPLES = ["1:-1", "1.5:-1.5", "2:-2:2", "0.5:-0.5", "1.25:-1.25:1.25:-1.25", "3:-3"]
+
+
+def make_sequence(n_rows, seed=0):
+    """RemoveDuplicate/GroupIdx 이후 단계와 유사한 컬럼 구성의 합성 시퀀스"""
+    rng = np.random.default_rng(seed)
+    keys = list(MODE_SUBMODE_MAP) + [("VTQ", 0), ("B", 9)]
+    picks = rng.integers(0, len(keys), n_rows)
+    return pd.DataFrame(
+        {
+            "Mode": [keys[i][0] for i in picks],
+            "SubModeIndex": [keys[i][1] for i in picks],
+            "BeamStyleIndex": rng.integers(0, 30, n_rows),
+            "SysTxFreqIndex": rng.integers(0, len(FREQUENCY_TABLE), n_rows),
+            "TxpgWaveformStyle": rng.integers(0, 3, n_rows),
+            "ProbeNumTxCycles": rng.integers(1, 8, n_rows),
+            "TxPulseRle": rng.choice(RLE_SAMPLES, n_rows),
+            "TxFocusLocCm": rng.uniform(0.5, 12, n_rows).round(2),
+            "NumTxElements": rng.integers(16, 192, n_rows),
+            "VTxIndex": rng.integers(0, 2, n_rows),
+            "isDuplicate": rng.integers(0, 2, n_rows),
+            "GroupIndex": np.arange(n_rows) // 4 + 1,
+        }
+    )
+
+
+class LegacyParamGen(ParamGen):
+    """벡터화 이전 구현 (행 단위 apply) — 결과 비교 기준"""
+
+    def findOrgIdx(self):
+        self.df["OrgBeamstyleIdx"] = self.df.apply(
+            lambda row: MODE_SUBMODE_MAP.get((row["Mode"], row["SubModeIndex"]), -1),
+            axis=1,
+        )
+        return self.df
+
+    def bsIdx(self):
+        def bsIndex(orgidx, duplicate):
+            if duplicate == 1:
+                return {0: 15, 1: 20, 5: 10}.get(orgidx, 0)
+            return 0
+
+        self.df["bsIndexTrace"] = self.df.apply(
+            lambda row: bsIndex(row["OrgBeamstyleIdx"], row["isDuplicate"]), axis=1
+        )
+        return self.df
+
+    def freqidx2Hz(self):
+        table = FREQUENCY_TABLE.tolist()
+        self.df["TxFrequencyHz"] = self.df["SysTxFreqIndex"].apply(lambda i: table[i])
+        return self.df
+
+    def cnt_cycle(self):
+        def calculate_cycle(waveform, rle, cycle):
+            if waveform == 0:
+                raw_rle = map(float, str(rle).split(":"))
+                calc = [
+                    round(value - 1, 4) if value > 1 else value
+                    for value in map(abs, raw_rle)
+                ]
+                return round(sum(calc), 2)
+            return cycle
+
+        self.df["ProbeNumTxCycles"] = self.df.apply(
+            lambda row: calculate_cycle(
+                row["TxpgWaveformStyle"], row["TxPulseRle"], row["ProbeNumTxCycles"]
+            ),
+            axis=1,
+        )
+        return self.df
+
+    def calc_profvolt(self):
+        def prof_tx_voltage(maxV, ceilV, totalpt, idx=2):
+            return round((min(maxV, ceilV)) ** ((totalpt - 1 - idx) / (totalpt - 1)), 2)
+
+        self.df["profTxVoltageVolt"] = self.df.apply(
+            lambda row: prof_tx_voltage(
+                row["maxTxVoltageVolt"], row["ceilTxVoltageVolt"], row["totalVoltagePt"]
+            ),
+            axis=1,
+        )
+        return self.df
+
+    def zMeasNum(self):
+        def z_meas_num(focus):
+            if focus <= 3:
+                return (5 - 0.5) * 10
+            elif focus <= 6:
+                return (8 - 0.5) * 10
+            elif focus <= 9:
+                return (12 - 0.5) * 10
+            else:
+                return (14 - 0.5) * 10
+
+        self.df["zMeasNum"] = self.df["TxFocusLocCm"].apply(z_meas_num)
+        return self.df
+
+
+def run(cls, df):
+    start = time.perf_counter()
+    result = cls(df.copy(), probeid=1, probename="BENCH").gen_sequence()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ParamGen vectorization benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--legacy-max-rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'legacy(s)':>10} {'vector(s)':>10} {'speedup':>8}  identical")
+    for n_rows in args.rows:
+        df = make_sequence(n_rows)
+        vector_df, vector_sec = run(ParamGen, df)
+
+        if n_rows <= args.legacy_max_rows:
+            legacy_df, legacy_sec = run(LegacyParamGen, df)
+            pd.testing.assert_frame_equal(vector_df, legacy_df, check_exact=True)
+            print(
+                f"{n_rows:>10} {legacy_sec:>10.3f} {vector_sec:>10.3f} "
+                f"{legacy_sec / vector_sec:>7.1f}x  yes"
+            )
+        else:
+            print(f"{n_rows:>10} {'-':>10} {vector_sec:>10.3f} {'-':>8}  (legacy skipped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,400 @@
+"""
+온도 PRR 탐색 벤치마크: 기존 입력별 탐색 vs 배치 solver (find_prr_for_temprise_batch)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_prr
+    python -m benchmarks.bench_prr --groups 1000 5000 20000 --legacy-max-groups 1000
+
+입력은 PredictML.temperature_PRF_est 가 만드는 형식의 합성 그룹 대표 행이며
+(scanRange 0 / full 쌍, 일부 중복 포함), 온도 모델은 원-핫 컬럼을 포함한 소형 XGBoost 아티팩트입니다.
+각 크기마다 두 구현의 결과(note, iters 일치 / best_prr, pred_temprise 허용 오차)를 비교합니다.
+"""
+
+import os
+import time
+import argparse
+import tempfile
+from typing import Dict, Any
+from unittest import mock
+
+import joblib
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+from benchmarks.bench_generate import TEMPERATURE_FEATURES, PROBE_GEOMETRY
+from pkg_MeasSetGen import Temp_Prr_predict
+from pkg_MeasSetGen.Temp_Prr_predict import (
+    DEFAULT_POLICY_PRF,
+    MAX_ALLOWED_PRR,
+    MIN_ALLOWED_PRR,
+    load_artifacts,
+    _extract_temprise,
+    _predict_temprise_one,
+    find_prr_for_temprise_batch,
+)
+
+TARGET_TR = 15.0
+## 원-핫 컬럼 (단일 행 / 배치 인코딩이 같은지 함께 확인)
+DUMMY_FEATURES = [
+    "elevAperIndex_0",
+    "elevAperIndex_1",
+    "isTxAperModulationEn_1",
+    "txpgWaveformStyle_0",
+]
+
+
+def build_artifact(path, seed=0, n_samples=5000):
+    """TEMPERATURE_FEATURES + 원-핫 컬럼으로 학습한 온도 예측 아티팩트"""
+    rng = np.random.default_rng(seed)
+    volt = rng.uniform(5, 90, n_samples)
+    prf = np.exp(rng.uniform(np.log(100), np.log(30000), n_samples))
+    cycles = rng.integers(1, 8, n_samples)
+    freq = rng.uniform(1e6, 10e6, n_samples)
+    scan = rng.choice([0.0, 5.76], n_samples)
+    elev = rng.integers(0, 2, n_samples)
+    modulation = rng.integers(0, 2, n_samples)
+    duty = cycles * prf / freq
+    scan_inv = np.where(scan == 0, 1.0, 1.0 / np.maximum(scan, 0.001))
+    X = pd.DataFrame(
+        {
+            "volt2": volt**2,
+            "duty_approx": duty,
+            "scan_inv": scan_inv,
+            "log_power_like_scan": np.log(volt**2 * duty * scan_inv + 0.001),
+            "numTxElements": rng.integers(1, 192, n_samples),
+            "txFrequencyHz": freq,
+            "probePitchCm": 0.03,
+            "elevAperIndex_0": elev == 0,
+            "elevAperIndex_1": elev == 1,
+            "isTxAperModulationEn_1": modulation == 1,
+            "txpgWaveformStyle_0": rng.integers(0, 2, n_samples) == 0,
+        }
+    )
+    feature_columns = TEMPERATURE_FEATURES + DUMMY_FEATURES
+    y = 300.0 * duty * scan_inv * (1 + 0.2 * elev) * (1 - 0.1 * modulation) / volt**2
+    booster = xgb.train(
+        {"max_depth": 6, "eta": 0.3, "objective": "reg:squarederror", "nthread": 1},
+        xgb.DMatrix(X[feature_columns].astype(float), label=y, feature_names=feature_columns),
+        num_boost_round=40,
+    )
+    joblib.dump({"booster": booster, "feature_columns": feature_columns}, path)
+    return path
+
+
+def make_inputs(n_groups, seed=0, duplicate_ratio=0.2):
+    """temperature_PRF_est 형식의 입력 (그룹별 scanRange 0 / full 2행)"""
+    rng = np.random.default_rng(seed)
+    n_unique = max(1, int(n_groups * (1 - duplicate_ratio)))
+    base = pd.DataFrame(
+        {
+            "numTxCycles": rng.choice([1.0, 2.0, 3.5, 4.0, 6.0], n_unique),
+            "numTxElements": rng.integers(16, 192, n_unique),
+            "txFrequencyHz": rng.choice([2000000, 3076900, 5000000, 8000000], n_unique),
+            "elevAperIndex": rng.integers(0, 3, n_unique),
+            "isTxAperModulationEn": rng.integers(0, 2, n_unique),
+            "txpgWaveformStyle": rng.integers(0, 2, n_unique),
+            "profTxVoltageVolt": np.round(rng.uniform(0, 90, n_unique), 2),
+            "VTxindex": rng.integers(0, 2, n_unique),
+        }
+    )
+    # 일부는 0 V (물리 가드 경로)
+    base.loc[base.index[::50], "profTxVoltageVolt"] = 0.0
+    groups = base.iloc[rng.integers(0, n_unique, n_groups)].reset_index(drop=True)
+    groups["probePitchCm"] = PROBE_GEOMETRY["probePitchCm"]
+    groups["probeRadiusCm"] = PROBE_GEOMETRY["probeRadiusCm"]
+    groups["probeElevAperCm0"] = PROBE_GEOMETRY["probeElevAperCm0"]
+
+    full = groups.copy()
+    full["scanRange"] = PROBE_GEOMETRY["probePitchCm"] * PROBE_GEOMETRY["probeNumElements"]
+    full["numTxCycles"] = 4
+    full["numTxElements"] = full["numTxElements"] // 10
+    zero = groups.copy()
+    zero["scanRange"] = 0
+    params = pd.concat([full, zero], ignore_index=True)
+    params["pulseRepetRate"] = 0
+
+    user_inputs = []
+    for user_input in params.to_dict("records"):
+        user_input["pulseVoltage"] = user_input.get("profTxVoltageVolt", 0)
+        user_inputs.append(user_input)
+    return user_inputs
+
+
+def legacy_find_prr_for_temprise_batch(
+    user_inputs: list[Dict[str, Any]],
+    target_tr: float,
+    prr_min: float = 100.0,
+    prr_max: float = 30000.0,
+    tol: float = 0.05,
+    max_iter: int = 8,  # 선형 보간 덕분에 20 → 8로 단축
+) -> list[Dict[str, Any]]:
+    """배치 solver 이전 find_prr_for_temprise_batch (입력 × PRF 마다 단일 행 predict)"""
+    booster, feature_columns = load_artifacts()  # 한 번만 로드
+    results = []
+
+    for user_input in user_inputs:
+        # 물리적 가드
+        V = float(user_input.get("pulseVoltage", 0) or 0)
+        cycles = float(user_input.get("numTxCycles", 0) or 0)
+        if V <= 0 or cycles <= 0:
+            results.append(
+                {
+                    "best_prr": DEFAULT_POLICY_PRF,
+                    "pred_temprise": 0.0,
+                    "iters": 0,
+                    "note": "0 V or 0 cycles",
+                }
+            )
+            continue
+
+        # PRF 범위 보정
+        prr_min_adj = max(float(prr_min), MIN_ALLOWED_PRR)
+        prr_max_adj = min(float(prr_max), MAX_ALLOWED_PRR)
+        if prr_min_adj >= prr_max_adj:
+            results.append(
+                {
+                    "best_prr": None,
+                    "pred_temprise": float("nan"),
+                    "iters": 0,
+                    "note": "invalid bracket after clipping",
+                }
+            )
+            continue
+
+        # 초기 로그 스케일 샘플링 (7개로 축소)
+        grid = np.geomspace(prr_min_adj, prr_max_adj, num=7)
+        preds = []
+        for g in grid:
+            u = dict(user_input)
+            u["pulseRepetRate"] = float(g)
+            y_dict = _predict_temprise_one(u, booster, feature_columns)
+            y_val = _extract_temprise(y_dict)
+            preds.append((float(g), float(y_val)))
+
+        ys = [p[1] for p in preds]
+
+        # 정책 1: 전 구간 차단
+        if max(ys) <= 0.0:
+            results.append(
+                {
+                    "best_prr": DEFAULT_POLICY_PRF,
+                    "pred_temprise": max(ys),
+                    "iters": 0,
+                    "note": "policy: all < MIN_VALID_TEMPRISE → fallback PRF",
+                }
+            )
+            continue
+
+        # 타깃이 범위 밖
+        if not (min(ys) <= target_tr <= max(ys)):
+            best = min(preds, key=lambda t: abs(t[1] - target_tr))
+            if best[1] <= 0.0:
+                results.append(
+                    {
+                        "best_prr": DEFAULT_POLICY_PRF,
+                        "pred_temprise": 0.0,
+                        "iters": 0,
+                        "note": "policy: no crossing & pred=0 → fallback PRF",
+                    }
+                )
+            else:
+                results.append(
+                    {
+                        "best_prr": min(float(best[0]), MAX_ALLOWED_PRR),
+                        "pred_temprise": best[1],
+                        "iters": 0,
+                        "note": "no crossing",
+                    }
+                )
+            continue
+
+        # ===== 선형 보간으로 초기 추정값 계산 =====
+        # target_tr을 감싸는 두 점 찾기
+        lo_idx, hi_idx = 0, len(preds) - 1
+        for i in range(len(preds) - 1):
+            if preds[i][1] <= target_tr <= preds[i + 1][1]:
+                lo_idx, hi_idx = i, i + 1
+                break
+            elif preds[i][1] >= target_tr >= preds[i + 1][1]:  # 역순인 경우
+                lo_idx, hi_idx = i + 1, i
+                break
+
+        # 선형 보간으로 초기 PRF 추정
+        x0, y0 = preds[lo_idx]
+        x1, y1 = preds[hi_idx]
+
+        if abs(y1 - y0) > 1e-6:  # 0으로 나누기 방지
+            # 선형 보간: x = x0 + (target - y0) / (y1 - y0) * (x1 - x0)
+            x_init = x0 + (target_tr - y0) / (y1 - y0) * (x1 - x0)
+            x_init = max(prr_min_adj, min(prr_max_adj, x_init))  # 범위 내로 클리핑
+        else:
+            x_init = 0.5 * (x0 + x1)
+
+        # 초기 추정값 평가
+        y_init = _extract_temprise(
+            _predict_temprise_one(
+                {**user_input, "pulseRepetRate": x_init}, booster, feature_columns
+            )
+        )
+
+        # 이미 충분히 가까우면 바로 반환
+        if abs(y_init - target_tr) <= tol * max(1.0, target_tr):
+            if y_init <= 0.0:
+                results.append(
+                    {
+                        "best_prr": DEFAULT_POLICY_PRF,
+                        "pred_temprise": 0.0,
+                        "iters": 1,
+                        "note": "policy: interpolation converged to 0 → fallback PRF",
+                    }
+                )
+            else:
+                results.append(
+                    {
+                        "best_prr": min(float(x_init), MAX_ALLOWED_PRR),
+                        "pred_temprise": y_init,
+                        "iters": 1,
+                        "note": "converged by interpolation",
+                    }
+                )
+            continue
+
+        # ===== 선형 보간 결과 주변에서 정밀 이분 탐색 =====
+        # 탐색 범위를 보간 결과 주변으로 좁힘
+        lo, hi = x0, x1
+        y_lo, y_hi = y0, y1
+
+        # 단조성 보정
+        if y_lo > y_hi:
+            lo, hi = hi, lo
+            y_lo, y_hi = y_hi, y_lo
+
+        iters = 1  # 이미 초기 평가 1회 수행
+        best = (x_init, y_init)  # 보간 결과로 초기화
+
+        while iters < max_iter:
+            mid = 0.5 * (lo + hi)
+            y_mid = _extract_temprise(
+                _predict_temprise_one(
+                    {**user_input, "pulseRepetRate": mid}, booster, feature_columns
+                )
+            )
+
+            if abs(y_mid - target_tr) < abs(best[1] - target_tr):
+                best = (mid, y_mid)
+
+            if abs(y_mid - target_tr) <= tol * max(1.0, target_tr):
+                if y_mid <= 0.0:
+                    results.append(
+                        {
+                            "best_prr": DEFAULT_POLICY_PRF,
+                            "pred_temprise": 0.0,
+                            "iters": iters + 1,
+                            "note": "policy: converged to 0 → fallback PRF",
+                        }
+                    )
+                else:
+                    results.append(
+                        {
+                            "best_prr": min(float(mid), MAX_ALLOWED_PRR),
+                            "pred_temprise": y_mid,
+                            "iters": iters + 1,
+                            "note": "converged",
+                        }
+                    )
+                break
+
+            if y_mid < target_tr:
+                lo, y_lo = mid, y_mid
+            else:
+                hi, y_hi = mid, y_mid
+            iters += 1
+        else:
+            # 최대 반복 도달
+            if best[0] is None:
+                results.append(
+                    {
+                        "best_prr": None,
+                        "pred_temprise": float("nan"),
+                        "iters": iters,
+                        "note": "no valid candidate",
+                    }
+                )
+            else:
+                final_prr, final_pred = best
+                results.append(
+                    {
+                        "best_prr": min(float(final_prr), MAX_ALLOWED_PRR),
+                        "pred_temprise": final_pred,
+                        "iters": iters,
+                        "note": "max_iter reached",
+                    }
+                )
+
+    return results
+
+
+
+def compare(legacy, batch, rtol=1e-6):
+    """note / iters 일치, 수치는 허용 오차 안 → 불일치 건수"""
+    mismatches = 0
+    for old, new in zip(legacy, batch):
+        same = old["note"] == new["note"] and old["iters"] == new["iters"]
+        for key in ("best_prr", "pred_temprise"):
+            a, b = old[key], new[key]
+            if a is None or b is None:
+                same &= a is None and b is None
+            else:
+                same &= bool(np.isclose(a, b, rtol=rtol, atol=1e-9, equal_nan=True))
+        mismatches += not same
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Temperature PRR search benchmark")
+    parser.add_argument("--groups", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--legacy-max-groups", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="aop_bench_") as workdir:
+        artifact = build_artifact(os.path.join(workdir, "TempPRR_Predict.joblib"))
+        with mock.patch.object(Temp_Prr_predict, "artifact_path", lambda: artifact):
+            print(
+                f"{'groups':>8} {'inputs':>8} {'legacy(s)':>10} {'batch(s)':>9}"
+                f" {'speedup':>8} {'predicts':>9}  match"
+            )
+            for n_groups in args.groups:
+                user_inputs = make_inputs(n_groups)
+
+                calls = []
+                original_call = Temp_Prr_predict._BatchTempRise.__call__
+
+                def counting_call(self, rows, prr):
+                    calls.append(len(rows))
+                    return original_call(self, rows, prr)
+
+                with mock.patch.object(Temp_Prr_predict._BatchTempRise, "__call__", counting_call):
+                    start = time.perf_counter()
+                    batch = find_prr_for_temprise_batch(user_inputs, target_tr=TARGET_TR)
+                    batch_sec = time.perf_counter() - start
+
+                if n_groups <= args.legacy_max_groups:
+                    start = time.perf_counter()
+                    legacy = legacy_find_prr_for_temprise_batch(user_inputs, target_tr=TARGET_TR)
+                    legacy_sec = time.perf_counter() - start
+                    mismatches = compare(legacy, batch)
+                    assert mismatches == 0, f"{mismatches} results differ from the legacy solver"
+                    print(
+                        f"{n_groups:>8} {len(user_inputs):>8} {legacy_sec:>10.2f} {batch_sec:>9.3f}"
+                        f" {legacy_sec / batch_sec:>7.0f}x {len(calls):>9}  yes"
+                    )
+                else:
+                    print(
+                        f"{n_groups:>8} {len(user_inputs):>8} {'-':>10} {batch_sec:>9.3f}"
+                        f" {'-':>8} {len(calls):>9}  -"
+                    )
+
+
+if __name__ == "__main__":
+    main()
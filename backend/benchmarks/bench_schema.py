@@ -0,0 +1,116 @@
+"""
+파이프라인 타입 스키마 메모리 리포트: 기본 타입(object/int64/float64) vs 축소 스키마(frame_schema)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_schema
+    python -m benchmarks.bench_schema --rows 100000 1000000
+
+단계별(load → dedupe → group_index → param_gen) 출력 DataFrame 의 메모리 사용량
+(memory_usage(deep=True))을 비교하고, 두 경로의 결과 CSV(DataOut)가 바이트 단위로
+같은지 확인합니다. 예측 단계는 param_gen 결과를 입력으로 쓰므로 입력 값이 같으면 결과도 같습니다.
+실행 전 SEQUENCE_DTYPES 정수 축소가 범위 밖/소수/결측 값을 바꾸지 않는지(check_int_dtypes) 확인합니다.
+"""
+
+import os
+import argparse
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_sequence import write_sequence_file
+from pkg_MeasSetGen.data_inout import loadfile, DataOut, SEQUENCE_COLUMNS, SEQUENCE_DTYPES
+from pkg_MeasSetGen.dedupe_group import DedupeGroupEngine
+from pkg_MeasSetGen.param_gen import ParamGen
+from pkg_MeasSetGen.frame_schema import compact_frame, frame_memory_mb
+
+STAGES = ["load", "dedupe", "group_index", "param_gen"]
+
+
+def run_pipeline(file_path, compact):
+    """load → param_gen 단계별 DataFrame 메모리 (MB) 와 결과 DataFrame 반환"""
+    memory = {}
+    raw = loadfile(file_path, usecols=SEQUENCE_COLUMNS, dtype=SEQUENCE_DTYPES if compact else None)
+    memory["load"] = frame_memory_mb(raw)
+
+    engine = DedupeGroupEngine(100)
+    df_total = engine.dedupe(raw)
+    memory["dedupe"] = frame_memory_mb(df_total)
+
+    selected_df = engine.assign_groups(df_total)
+    if compact:
+        selected_df = compact_frame(selected_df)
+    memory["group_index"] = frame_memory_mb(selected_df)
+
+    gen_df = ParamGen(data=selected_df, probeid="9999", probename="BENCH").gen_sequence()
+    if compact:
+        gen_df = compact_frame(gen_df)
+    memory["param_gen"] = frame_memory_mb(gen_df)
+    return memory, gen_df
+
+
+def check_int_dtypes(workdir):
+    """
+    SEQUENCE_DTYPES 정수 축소가 값을 바꾸지 않는지 확인 (일괄/청크 로드 모두)
+    - 범위 안 정수 → 축소 타입
+    - int8 범위 초과(200) / int16 범위 초과(40000) / 소수(1.5) / 결측 → 파싱된 타입 그대로
+    """
+    expected = pd.DataFrame(
+        {
+            "SubModeIndex": [0, 1, 2, 3],  # int8 적용
+            "SysTxFreqIndex": [1, 2, 200, 3],  # int8 범위 초과
+            "NumTxElements": [16, 64, 40000, 128],  # int16 범위 초과
+            "ElevAperIndex": [0, 1.5, 2, 1],  # 소수
+            "VTxIndex": [0, 1, None, 1],  # 결측
+        }
+    )
+    file_path = os.path.join(workdir, "int_dtypes.txt")
+    expected.to_csv(file_path, sep="\t", index=False, encoding="cp949")
+
+    for chunksize in (None, 2):
+        loaded = loadfile(file_path, dtype=SEQUENCE_DTYPES, chunksize=chunksize)
+        pd.testing.assert_frame_equal(loaded, expected, check_dtype=False)
+        assert loaded["SubModeIndex"].dtype == np.int8, loaded["SubModeIndex"].dtype
+        for column in ["SysTxFreqIndex", "NumTxElements", "ElevAperIndex", "VTxIndex"]:
+            assert loaded[column].dtype == expected[column].dtype, (column, loaded[column].dtype)
+    print("int dtype check: out-of-range / non-integral / missing values preserved")
+
+
+def save_csv(df, database):
+    dataout = DataOut(case=0, database=database, probename="BENCH", df1=df)
+    dataout.make_dir()
+    with open(dataout.save_excel(), "rb") as f:
+        return f.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline dtype schema memory report")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 500_000])
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="aop_bench_") as workdir:
+        os.chdir(workdir)
+        try:
+            check_int_dtypes(workdir)
+            for n_rows in args.rows:
+                file_path = write_sequence_file(os.path.join(workdir, f"seq_{n_rows}.txt"), n_rows)
+                default_mb, default_df = run_pipeline(file_path, compact=False)
+                compact_mb, compact_df = run_pipeline(file_path, compact=True)
+                identical = save_csv(default_df, "default") == save_csv(compact_df, "compact")
+                assert identical, "compact schema changed the generated CSV"
+
+                print(f"\n[{n_rows:,} rows] generated CSV identical: yes")
+                print(f"  {'stage':<12} {'default MB':>11} {'compact MB':>11} {'saved':>7}")
+                for stage in STAGES:
+                    saved = 1 - compact_mb[stage] / default_mb[stage] if default_mb[stage] else 0
+                    print(
+                        f"  {stage:<12} {default_mb[stage]:>11.2f} {compact_mb[stage]:>11.2f}"
+                        f" {saved:>6.0%}"
+                    )
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+합성 시퀀스 파일 생성기 (MeasSetGen 입력 형식: 탭 구분, cp949)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.synthetic_sequence out.txt --rows 100000
+
+- 빔 그룹(group_size 행) 단위로 TxFocusLocCm가 증가 → GroupIdx 그룹 구성과 동일
+- 그룹 설정을 pool_ratio 비율의 후보에서 뽑아 B/M, Cb/D 모드 간 중복이 자연스럽게 발생
+- 실제 파일처럼 사용하지 않는 컬럼(Extra*)을 extra_columns 개 추가
+"""
+
+import argparse
+import numpy as np
+import pandas as pd
+
+from pkg_MeasSetGen.data_inout import SEQUENCE_COLUMNS
+from pkg_MeasSetGen.param_gen import MODE_SUBMODE_MAP, FREQUENCY_TABLE
+
+RLE_SAMPLES = ["1:-1", "1.5:-1.5", "2:-2:2", "0.5:-0.5", "1.25:-1.25:1.25:-1.25", "3:-3"]
+
+
+def make_raw_sequence(n_rows, seed=0, group_size=8, pool_ratio=0.6, extra_columns=40):
+    """loadfile 이전의 원본 시퀀스와 같은 컬럼 구성의 DataFrame"""
+    rng = np.random.default_rng(seed)
+    n_groups = -(-n_rows // group_size)
+    n_pool = max(1, int(n_groups * pool_ratio))
+
+    # 그룹 설정 후보 (중복 판단 컬럼 포함)
+    mode_keys = list(MODE_SUBMODE_MAP)
+    pool_mode = rng.integers(0, len(mode_keys), n_pool)
+    pool = {
+        "Mode": np.array([mode_keys[i][0] for i in pool_mode], dtype=object),
+        "SubModeIndex": np.array([mode_keys[i][1] for i in pool_mode]),
+        "BeamStyleIndex": rng.integers(0, 30, n_pool),
+        "SysTxFreqIndex": rng.integers(0, len(FREQUENCY_TABLE), n_pool),
+        "TxpgWaveformStyle": rng.integers(0, 3, n_pool),
+        "NumTxElements": rng.integers(16, 192, n_pool),
+        "ProbeNumTxCycles": rng.integers(1, 8, n_pool),
+        "IsTxChannelModulationEn": rng.integers(0, 2, n_pool),
+        "IsPresetCpaEn": rng.integers(0, 2, n_pool),
+        "CpaDelayOffsetClk": rng.integers(0, 50, n_pool),
+        "ElevAperIndex": rng.integers(0, 3, n_pool),
+        "SystemPulserSel": rng.integers(0, 2, n_pool),
+        "VTxIndex": rng.integers(0, 2, n_pool),
+        "TxPulseRle": rng.choice(RLE_SAMPLES, n_pool),
+    }
+
+    group_pick = rng.integers(0, n_pool, n_groups)
+    row_group = np.arange(n_rows) // group_size
+    row_pick = group_pick[row_group]
+
+    data = {column: values[row_pick] for column, values in pool.items()}
+    # 같은 후보를 쓰는 그룹은 Mode만 B↔M, Cb↔D 로 바꿔 모드 간 중복 생성
+    swap = rng.random(n_groups)[row_group] < 0.5
+    data["Mode"] = np.where(
+        swap & (data["Mode"] == "B"),
+        "M",
+        np.where(swap & (data["Mode"] == "Cb"), "D", data["Mode"]),
+    )
+    focus_steps = np.round(np.linspace(0.5, 12, group_size), 2)
+    data["TxFocusLocCm"] = focus_steps[np.arange(n_rows) % group_size]
+
+    df = pd.DataFrame(data)[SEQUENCE_COLUMNS]
+    for i in range(extra_columns):
+        df[f"Extra{i}"] = rng.uniform(0, 1, n_rows).round(4)
+    return df
+
+
+def write_sequence_file(path, n_rows, seed=0, **kwargs):
+    make_raw_sequence(n_rows, seed=seed, **kwargs).to_csv(
+        path, sep="\t", index=False, encoding="cp949"
+    )
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--group-size", type=int, default=8)
+    parser.add_argument("--extra-columns", type=int, default=40)
+    args = parser.parse_args()
+    write_sequence_file(
+        args.path,
+        args.rows,
+        seed=args.seed,
+        group_size=args.group_size,
+        extra_columns=args.extra_columns,
+    )
+    print(f"wrote {args.rows} rows to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
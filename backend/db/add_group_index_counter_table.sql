@@ -0,0 +1,19 @@
+-- ===================================================
+-- GroupIndex 구간 예약용 카운터 테이블
+-- meas_setting 이 있는 각 데이터베이스(DATABASE_NAME 목록)에서 실행
+-- 초기값은 첫 예약 시 meas_setting 의 MAX(groupIndex)로 자동 설정됩니다.
+-- ===================================================
+
+IF OBJECT_ID('dbo.aop_group_index_counter', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.aop_group_index_counter (
+        probeid INT NOT NULL PRIMARY KEY,
+        last_group_index BIGINT NOT NULL,       -- 마지막으로 예약된 GroupIndex
+        updated_at DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME()
+    );
+    PRINT 'aop_group_index_counter 테이블이 생성되었습니다.';
+END
+GO
+
+-- 앱 계정에 예약 권한 부여 (계정/역할 이름은 환경에 맞게 수정)
+-- GRANT SELECT, INSERT, UPDATE ON dbo.aop_group_index_counter TO [aop_app_role];
@@ -4,7 +4,21 @@ import pandas as pd
 from pkg_SQL.database import SQL
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from flask import session, g
-from utils.database_manager import get_db_connection
+from utils.database_manager import get_db_connection, connection_budget
+from utils.error_handler import ConnectionBudgetExceeded
+
+# 학습 데이터 조인 결과의 실수형 컬럼 선언 (나머지는 커서 타입으로 결정)
+TRAINING_DATA_SCHEMA = {
+    "focusRangeCm": "float64",
+    "numTxCycles": "float64",
+    "probePitchCm": "float64",
+    "probeRadiusCm": "float64",
+    "probeElevAperCm0": "float64",
+    "probeElevAperCm1": "float64",
+    "probeElevFocusRangCm": "float64",
+    "probeElevFocusRangCm1": "float64",
+    "zt": "float64",
+}
 
 
 def fetchData():
@@ -27,11 +41,9 @@ def fetchData():
     list_database = databases_ML.split(",")
 
     def fetch_one_db(db, auth_username, auth_password):
-        sql_connection = None
         try:
-            # DatabaseManager를 직접 사용하지 않고 SQL 객체 직접 생성
-            from pkg_SQL.database import SQL
-
+            # 스레드에서는 Flask 컨텍스트가 없으므로 SQL 객체 직접 생성
+            # (엔진은 engine_registry에서 공유되므로 dispose 하지 않음)
             sql_connection = SQL(auth_username, auth_password, db)
 
             query = f"""
@@ -69,22 +81,26 @@ def fetchData():
                 where RankNo = 1
                 order by 1
                 """
-            Raw_data = sql_connection.execute_query(query)
+            # 컬럼 단위 numpy 버퍼로 직접 수신 (pd.read_sql의 행 튜플/object 추론 생략)
+            # 전역/사용자별 연결 예산 안에서만 조회 (초과 시 대기 후 503)
+            with connection_budget.slot(auth_username, db):
+                Raw_data = sql_connection.fetch_columnar(query, schema=TRAINING_DATA_SCHEMA)
 
             if Raw_data is None or Raw_data.empty:
                 return None
             else:
                 return Raw_data
 
+        except ConnectionBudgetExceeded:
+            raise
         except Exception as e:
             logging.warning(f"DB '{db}' 데이터 조회 실패: {e}")
             return None
-        finally:
-            if sql_connection and hasattr(sql_connection, "engine"):
-                sql_connection.engine.dispose()
 
     SQL_get_data = []
-    with ThreadPoolExecutor(max_workers=min(8, len(list_database))) as executor:
+    # 사용자별 연결 예산보다 많은 스레드를 띄우지 않음
+    max_workers = max(1, min(8, connection_budget.per_user_limit(), len(list_database)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # 인증 정보를 각 스레드에 전달
         future_to_db = {
             executor.submit(fetch_one_db, db, username, password): db
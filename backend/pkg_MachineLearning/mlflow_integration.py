@@ -5,8 +5,28 @@ import logging
 import sys
 import sklearn
 from flask import session
-from pkg_SQL.database import SQL
+from pkg_SQL.compiled_query import compile_query
 from utils.database_manager import get_mlflow_db
+from utils.error_handler import ConnectionBudgetExceeded
+
+# 예측마다 반복 실행되는 로깅 쿼리는 모듈 로드 시 한 번만 컴파일
+_LOG_PREDICTION_QUERY = compile_query(
+    """
+    INSERT INTO aop_prediction_logs (
+        model_version_id, input_features, prediction_result,
+        user_id, request_source, processing_time_ms, prediction_type
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+)
+_LOG_SIMPLE_PREDICTION_QUERY = compile_query(
+    """
+    INSERT INTO aop_prediction_logs
+    (input_features, prediction_result, prediction_type, user_id,
+     request_source, processing_time_ms)
+    VALUES (?, ?, ?, ?, ?, ?)
+    """
+)
 
 
 class AOP_MLflowTracker:
@@ -23,12 +43,12 @@ class AOP_MLflowTracker:
             raise ValueError("사용자 인증 정보가 없습니다.")
 
         try:
-            self.db = SQL(
-                username=self.username,
-                password=self.password,
-                database="AOP_MLflow_Tracking",
-            )
+            # 요청 단위 연결 캐시/연결 예산을 거치도록 DatabaseManager 사용
+            self.db = get_mlflow_db()
             self.tracking_enabled = True
+        except ConnectionBudgetExceeded:
+            # 예산 초과는 추적 비활성화로 숨기지 않고 503 으로 전달
+            raise
         except Exception as e:
             logging.warning(f"MLflow tracking disabled: {e}")
             self.tracking_enabled = False
@@ -816,6 +836,8 @@ class AOP_MLflowTracker:
                 self.logger.info(
                     f"Model registered in database: {normalized_model_name} v{version_number} (ID: {version_id})"
                 )
+                if stage == "Production":
+                    self._on_production_changed()
                 return version_id
             else:
                 return None
@@ -970,6 +992,7 @@ class AOP_MLflowTracker:
                 self.logger.info(
                     f"Promoted version_id {new_version_id} to Production (score: {new_test_score})"
                 )
+                self._on_production_changed()
 
         except Exception as e:
             self.logger.error(f"Failed to auto-promote model: {e}")
@@ -1013,16 +1036,8 @@ class AOP_MLflowTracker:
                 prediction_result_json = str(prediction_result)
 
             # 예측 로그 저장
-            log_query = """
-                INSERT INTO aop_prediction_logs (
-                    model_version_id, input_features, prediction_result,
-                    user_id, request_source, processing_time_ms, prediction_type
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """
-
             self.db.execute_query(
-                log_query,
+                _LOG_PREDICTION_QUERY,
                 (
                     model_version_id,
                     input_features_json,
@@ -1080,6 +1095,39 @@ class AOP_MLflowTracker:
             logging.error(f"Failed to get best model info: {e}")
             return None
 
+    @classmethod
+    def get_production_fingerprint(cls):
+        """
+        Production 모델 버전/체크섬 요약 문자열 (생성 결과 캐시 키용, 바이너리 미조회)
+        실패 시 None
+        """
+        try:
+            db = get_mlflow_db()
+            query = """
+                SELECT mv.prediction_type, mv.version_id, mv.checksum
+                FROM ml_model_versions mv
+                WHERE mv.stage = 'Production'
+                ORDER BY mv.prediction_type, mv.version_id
+            """
+            result = db.execute_query(query)
+            return "|".join(
+                f"{row.prediction_type}:{row.version_id}:{row.checksum}"
+                for row in result.itertuples(index=False)
+            )
+        except Exception as e:
+            logging.warning(f"Failed to get production model fingerprint: {e}")
+            return None
+
+    @staticmethod
+    def _on_production_changed():
+        """Production 모델 변경 시 MeasSetGen 생성 결과 캐시 무효화"""
+        try:
+            from pkg_MeasSetGen.generation_cache import generation_cache
+
+            generation_cache.invalidate_all()
+        except Exception as e:
+            logging.warning(f"Generation cache invalidation failed: {e}")
+
     @classmethod
     def get_model_by_name(cls, model_name, stage="Production"):
         """모델명으로 특정 스테이지의 모델 정보 조회"""
@@ -1090,9 +1138,7 @@ class AOP_MLflowTracker:
             if not username or not password:
                 return None
 
-            db = SQL(
-                username=username, password=password, database="AOP_MLflow_Tracking"
-            )
+            db = get_mlflow_db()
 
             query = """
                 SELECT TOP 1
@@ -1146,13 +1192,6 @@ class AOP_MLflowTracker:
                 else prediction_result
             )
 
-            query = """
-                INSERT INTO aop_prediction_logs 
-                (input_features, prediction_result, prediction_type, user_id, 
-                 request_source, processing_time_ms)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """
-
             # 기본값 설정
             request_source = f"{prediction_type}_calculation"
             processing_time_ms = 0  # 계산 기반이므로 0으로 설정
@@ -1160,7 +1199,7 @@ class AOP_MLflowTracker:
             username = session.get("username", "system")  # 기본값 설정
 
             db.execute_query(
-                query,
+                _LOG_SIMPLE_PREDICTION_QUERY,
                 (
                     input_features_json,
                     prediction_json,
@@ -1187,9 +1226,7 @@ class AOP_MLflowTracker:
             if not username or not password:
                 return None
 
-            db = SQL(
-                username=username, password=password, database="AOP_MLflow_Tracking"
-            )
+            db = get_mlflow_db()
 
             if model_name:
                 query = """
@@ -1,12 +1,16 @@
 import joblib
 import os
+import time
+import hashlib
 import logging
+import threading
 import numpy as np
 import pandas as pd
 import warnings
 import xgboost as xgb
 from typing import Dict, Any
 
+logger = logging.getLogger("TempPrrPredict")
 
 warnings.filterwarnings(
     "ignore",
@@ -34,19 +38,142 @@ MIN_ALLOWED_PRR: float = float(
 # 예측 TempRise 는 출력하되, PRF는 DEFAULT_POLICY_PRF 출력
 
 
+def artifact_path():
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, "Temperature_artifacts", "TempPRR_Predict.joblib")
+
+
+class TemperatureArtifactCache:
+    """
+    온도 모델 아티팩트(booster, feature_columns) 프로세스 캐시
+    - 키: 경로 + (크기, 수정 시각) + 내용 sha256
+    - 호출마다 os.stat 만 확인, 크기/수정 시각이 바뀌면 해시를 다시 계산해
+      내용이 달라졌을 때만 joblib.load (같은 내용으로 덮어쓴 경우 재로드 없음)
+    - 동시에 여러 스레드가 요청해도 로드는 한 번만 수행 (경로별 잠금)
+    XGBoost Booster.predict 는 스레드 간 공유해도 안전합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._path_locks = {}
+        # path → {"signature", "sha256", "booster", "feature_columns", "loaded_at"}
+        self._entries = {}
+        self.loads = 0
+
+    def _path_lock(self, path):
+        with self._lock:
+            return self._path_locks.setdefault(path, threading.Lock())
+
+    @staticmethod
+    def _signature(path):
+        stat = os.stat(path)
+        return (stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def _sha256(path, block_size=1024 * 1024):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _current(self, path, force=False):
+        """최신 내용의 캐시 항목 반환 (필요할 때만 해시 계산 / 로드)"""
+        try:
+            signature = self._signature(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                "모델 아티팩트가 없습니다. 먼저 train_pipeline()을 실행하세요."
+            ) from None
+
+        entry = self._entries.get(path)
+        if not force and entry is not None and entry["signature"] == signature:
+            return entry
+
+        with self._path_lock(path):
+            # 잠금 대기 중 다른 스레드가 이미 갱신했을 수 있음
+            entry = self._entries.get(path)
+            if not force and entry is not None and entry["signature"] == signature:
+                return entry
+
+            sha256 = self._sha256(path)
+            if not force and entry is not None and entry["sha256"] == sha256:
+                # 내용은 같음 (touch / 동일 파일 복사) → 재로드 없이 서명만 갱신
+                entry = {**entry, "signature": signature}
+            else:
+                art = joblib.load(path)
+                entry = {
+                    "signature": signature,
+                    "sha256": sha256,
+                    "booster": art["booster"],
+                    "feature_columns": art["feature_columns"],
+                    "loaded_at": time.time(),
+                }
+                self.loads += 1
+                logger.info(f"Temperature artifact loaded: {path} (sha256={sha256[:12]})")
+            self._entries[path] = entry
+            return entry
+
+    def get(self, path):
+        """(booster, feature_columns)"""
+        entry = self._current(path)
+        return entry["booster"], entry["feature_columns"]
+
+    def fingerprint(self, path):
+        """아티팩트 내용 해시 (없으면 'missing')"""
+        try:
+            return self._current(path)["sha256"]
+        except FileNotFoundError:
+            return "missing"
+
+    def reload(self, path):
+        """파일 상태와 관계없이 다시 로드"""
+        entry = self._current(path, force=True)
+        return entry["booster"], entry["feature_columns"]
+
+    def invalidate(self, path=None):
+        with self._lock:
+            keys = [key for key in self._entries if path is None or key == path]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def stats(self):
+        with self._lock:
+            entries = dict(self._entries)
+        return {
+            "loads": self.loads,
+            "artifacts": {
+                path: {
+                    "sha256": entry["sha256"],
+                    "size": entry["signature"][0],
+                    "mtime_ns": entry["signature"][1],
+                    "feature_columns": len(entry["feature_columns"]),
+                    "loaded_at": entry["loaded_at"],
+                }
+                for path, entry in entries.items()
+            },
+        }
+
+
+# 전역 싱글톤 인스턴스
+temperature_artifact_cache = TemperatureArtifactCache()
+
+
+def artifact_fingerprint():
+    """아티팩트 내용 sha256 (없으면 'missing')"""
+    return temperature_artifact_cache.fingerprint(artifact_path())
+
+
 # ==== 학습 모델 아티팩트 (Booster, feature_columns 등) 불러오기 ====
+# 프로세스 캐시에서 반환 (파일 내용이 바뀐 경우에만 다시 로드)
 def load_artifacts():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    art_path = os.path.join(
-        current_dir, "Temperature_artifacts", "TempPRR_Predict.joblib"
-    )
+    return temperature_artifact_cache.get(artifact_path())
 
-    if not os.path.exists(art_path):
-        raise FileNotFoundError(
-            "모델 아티팩트가 없습니다. 먼저 train_pipeline()을 실행하세요."
-        )
-    art = joblib.load(art_path)
-    return art["booster"], art["feature_columns"]
+
+def reload_artifacts():
+    """아티팩트 강제 재로드 (파일 교체 직후 등)"""
+    return temperature_artifact_cache.reload(artifact_path())
 
 
 # ===== 유틸리티 ======
@@ -403,6 +530,76 @@ def _add_physics_features(df: pd.DataFrame) -> pd.DataFrame:
 
 
 # ===== 배치 처리를 위한 함수 =====
+_CATEGORICAL_INPUTS = ["isTxAperModulationEn", "txpgWaveformStyle", "elevAperIndex"]
+
+
+def _feature_matrix(inputs: pd.DataFrame, feature_columns) -> pd.DataFrame:
+    """
+    _predict_temprise_one 과 같은 전처리(정수 변환 → 물리 feature → 원-핫 → 학습 컬럼 정렬)를
+    여러 행에 한 번에 적용 (모든 연산이 행 단위이므로 행별 결과는 단일 행 처리와 동일)
+    """
+    X = inputs.copy()
+    for c in _CATEGORICAL_INPUTS + ["VTxindex"]:
+        X[c] = pd.to_numeric(X.get(c, 0), errors="coerce").fillna(0).astype(int)
+    X["VTxindex"] = (
+        pd.to_numeric(X.get("VTxindex", 1), errors="coerce").fillna(1).astype(int)
+    )
+    X = _add_physics_features(X)
+    X = apply_one_hot_encoding(X, _CATEGORICAL_INPUTS)
+    # 누락 컬럼은 0 (훈련 시 컬럼과 동일 순서/집합 보장)
+    return X.reindex(columns=feature_columns, fill_value=0)
+
+
+class _BatchTempRise:
+    """입력 행 × PRF 조합의 TempRise 를 한 번의 booster.predict 로 계산"""
+
+    def __init__(self, user_inputs, booster, feature_columns):
+        self.booster = booster
+        self.feature_columns = feature_columns
+        self.inputs = pd.DataFrame(user_inputs).reset_index(drop=True)
+        # 물리 가드 값 (단일 행 처리와 같은 변환: None/0 → 0)
+        self.voltage = np.array(
+            [float(u.get("pulseVoltage", 0) or 0) for u in user_inputs], dtype=np.float64
+        )
+        self.cycles = np.array(
+            [float(u.get("numTxCycles", 0) or 0) for u in user_inputs], dtype=np.float64
+        )
+        self.predict_calls = 0
+
+    def __call__(self, rows, prr):
+        """rows 행(입력 위치)의 PRF=prr 에서의 TempRise (V² · g_hat, 가드 시 0)"""
+        rows = np.asarray(rows)
+        prr = np.asarray(prr, dtype=np.float64)
+        if len(rows) == 0:
+            return np.zeros(0)
+        frame = self.inputs.take(rows).reset_index(drop=True)
+        frame["pulseRepetRate"] = prr
+        X = _feature_matrix(frame, self.feature_columns)
+        g_hat = self.booster.predict(xgb.DMatrix(X, feature_names=self.feature_columns))
+        self.predict_calls += 1
+
+        voltage, cycles = self.voltage[rows], self.cycles[rows]
+        pred = (voltage**2) * g_hat.astype(np.float64)
+        return np.where((voltage <= 0) | (prr <= 0) | (cycles <= 0), 0.0, pred)
+
+
+def _dedupe_inputs(user_inputs):
+    """동일한 입력은 한 번만 계산: (고유 입력 목록, 입력별 고유 입력 위치)"""
+    positions = {}
+    unique_inputs, codes = [], []
+    for user_input in user_inputs:
+        try:
+            key = tuple(sorted(user_input.items()))
+            code = positions.setdefault(key, len(unique_inputs))
+        except TypeError:
+            # 해시 불가 값이 있으면 중복 제거 없이 계산
+            code = len(unique_inputs)
+        if code == len(unique_inputs):
+            unique_inputs.append(user_input)
+        codes.append(code)
+    return unique_inputs, codes
+
+
 def find_prr_for_temprise_batch(
     user_inputs: list[Dict[str, Any]],
     target_tr: float,
@@ -414,210 +611,180 @@ def find_prr_for_temprise_batch(
     """
     여러 user_input을 배치로 처리하여 성능 개선.
     하이브리드 방식: 선형 보간으로 초기 추정 → 정밀 이분 탐색
-    모델을 한 번만 로드하고 재사용.
+    - 동일한 입력은 한 번만 계산
+    - 초기 로그 스케일 샘플링: 전체 입력 × 7개 PRF 를 한 번의 predict 로 평가
+    - 보간/이분 탐색: 아직 수렴하지 않은 입력만 모아 단계마다 한 번의 predict
+    입력별 판단(정책/수렴 조건/반복 횟수)은 입력 하나씩 탐색하던 방식과 같습니다.
     """
+    if not user_inputs:
+        return []
+    unique_inputs, codes = _dedupe_inputs(user_inputs)
     booster, feature_columns = load_artifacts()  # 한 번만 로드
-    results = []
+    solved = _solve_prr_batch(
+        unique_inputs, booster, feature_columns, target_tr, prr_min, prr_max, tol, max_iter
+    )
+    return [dict(solved[code]) for code in codes]
 
-    for user_input in user_inputs:
-        # 물리적 가드
-        V = float(user_input.get("pulseVoltage", 0) or 0)
-        cycles = float(user_input.get("numTxCycles", 0) or 0)
-        if V <= 0 or cycles <= 0:
-            results.append(
-                {
-                    "best_prr": DEFAULT_POLICY_PRF,
-                    "pred_temprise": 0.0,
-                    "iters": 0,
-                    "note": "0 V or 0 cycles",
-                }
-            )
-            continue
-
-        # PRF 범위 보정
-        prr_min_adj = max(float(prr_min), MIN_ALLOWED_PRR)
-        prr_max_adj = min(float(prr_max), MAX_ALLOWED_PRR)
-        if prr_min_adj >= prr_max_adj:
-            results.append(
-                {
-                    "best_prr": None,
-                    "pred_temprise": float("nan"),
-                    "iters": 0,
-                    "note": "invalid bracket after clipping",
-                }
-            )
-            continue
-
-        # 초기 로그 스케일 샘플링 (7개로 축소)
-        grid = np.geomspace(prr_min_adj, prr_max_adj, num=7)
-        preds = []
-        for g in grid:
-            u = dict(user_input)
-            u["pulseRepetRate"] = float(g)
-            y_dict = _predict_temprise_one(u, booster, feature_columns)
-            y_val = _extract_temprise(y_dict)
-            preds.append((float(g), float(y_val)))
-
-        ys = [p[1] for p in preds]
-
-        # 정책 1: 전 구간 차단
-        if max(ys) <= 0.0:
-            results.append(
-                {
-                    "best_prr": DEFAULT_POLICY_PRF,
-                    "pred_temprise": max(ys),
-                    "iters": 0,
-                    "note": "policy: all < MIN_VALID_TEMPRISE → fallback PRF",
-                }
-            )
-            continue
-
-        # 타깃이 범위 밖
-        if not (min(ys) <= target_tr <= max(ys)):
-            best = min(preds, key=lambda t: abs(t[1] - target_tr))
-            if best[1] <= 0.0:
-                results.append(
-                    {
-                        "best_prr": DEFAULT_POLICY_PRF,
-                        "pred_temprise": 0.0,
-                        "iters": 0,
-                        "note": "policy: no crossing & pred=0 → fallback PRF",
-                    }
-                )
-            else:
-                results.append(
-                    {
-                        "best_prr": min(float(best[0]), MAX_ALLOWED_PRR),
-                        "pred_temprise": best[1],
-                        "iters": 0,
-                        "note": "no crossing",
-                    }
-                )
-            continue
-
-        # ===== 선형 보간으로 초기 추정값 계산 =====
-        # target_tr을 감싸는 두 점 찾기
-        lo_idx, hi_idx = 0, len(preds) - 1
-        for i in range(len(preds) - 1):
-            if preds[i][1] <= target_tr <= preds[i + 1][1]:
-                lo_idx, hi_idx = i, i + 1
-                break
-            elif preds[i][1] >= target_tr >= preds[i + 1][1]:  # 역순인 경우
-                lo_idx, hi_idx = i + 1, i
-                break
-
-        # 선형 보간으로 초기 PRF 추정
-        x0, y0 = preds[lo_idx]
-        x1, y1 = preds[hi_idx]
-
-        if abs(y1 - y0) > 1e-6:  # 0으로 나누기 방지
-            # 선형 보간: x = x0 + (target - y0) / (y1 - y0) * (x1 - x0)
-            x_init = x0 + (target_tr - y0) / (y1 - y0) * (x1 - x0)
-            x_init = max(prr_min_adj, min(prr_max_adj, x_init))  # 범위 내로 클리핑
-        else:
-            x_init = 0.5 * (x0 + x1)
 
-        # 초기 추정값 평가
-        y_init = _extract_temprise(
-            _predict_temprise_one(
-                {**user_input, "pulseRepetRate": x_init}, booster, feature_columns
-            )
-        )
+def _solve_prr_batch(
+    user_inputs, booster, feature_columns, target_tr, prr_min, prr_max, tol, max_iter
+):
+    n = len(user_inputs)
+    results = [None] * n
+    predict = _BatchTempRise(user_inputs, booster, feature_columns)
+    tolerance = tol * max(1.0, target_tr)
 
-        # 이미 충분히 가까우면 바로 반환
-        if abs(y_init - target_tr) <= tol * max(1.0, target_tr):
-            if y_init <= 0.0:
-                results.append(
-                    {
-                        "best_prr": DEFAULT_POLICY_PRF,
-                        "pred_temprise": 0.0,
-                        "iters": 1,
-                        "note": "policy: interpolation converged to 0 → fallback PRF",
-                    }
-                )
-            else:
-                results.append(
-                    {
-                        "best_prr": min(float(x_init), MAX_ALLOWED_PRR),
-                        "pred_temprise": y_init,
-                        "iters": 1,
-                        "note": "converged by interpolation",
-                    }
-                )
-            continue
-
-        # ===== 선형 보간 결과 주변에서 정밀 이분 탐색 =====
-        # 탐색 범위를 보간 결과 주변으로 좁힘
-        lo, hi = x0, x1
-        y_lo, y_hi = y0, y1
-
-        # 단조성 보정
-        if y_lo > y_hi:
-            lo, hi = hi, lo
-            y_lo, y_hi = y_hi, y_lo
-
-        iters = 1  # 이미 초기 평가 1회 수행
-        best = (x_init, y_init)  # 보간 결과로 초기화
-
-        while iters < max_iter:
-            mid = 0.5 * (lo + hi)
-            y_mid = _extract_temprise(
-                _predict_temprise_one(
-                    {**user_input, "pulseRepetRate": mid}, booster, feature_columns
-                )
-            )
+    def _fallback(rows, pred_temprise, iters, note):
+        for i, pred in zip(rows, np.broadcast_to(pred_temprise, len(rows))):
+            results[i] = {
+                "best_prr": DEFAULT_POLICY_PRF,
+                "pred_temprise": float(pred),
+                "iters": int(iters),
+                "note": note,
+            }
 
-            if abs(y_mid - target_tr) < abs(best[1] - target_tr):
-                best = (mid, y_mid)
-
-            if abs(y_mid - target_tr) <= tol * max(1.0, target_tr):
-                if y_mid <= 0.0:
-                    results.append(
-                        {
-                            "best_prr": DEFAULT_POLICY_PRF,
-                            "pred_temprise": 0.0,
-                            "iters": iters + 1,
-                            "note": "policy: converged to 0 → fallback PRF",
-                        }
-                    )
-                else:
-                    results.append(
-                        {
-                            "best_prr": min(float(mid), MAX_ALLOWED_PRR),
-                            "pred_temprise": y_mid,
-                            "iters": iters + 1,
-                            "note": "converged",
-                        }
-                    )
-                break
-
-            if y_mid < target_tr:
-                lo, y_lo = mid, y_mid
-            else:
-                hi, y_hi = mid, y_mid
-            iters += 1
-        else:
-            # 최대 반복 도달
-            if best[0] is None:
-                results.append(
-                    {
-                        "best_prr": None,
-                        "pred_temprise": float("nan"),
-                        "iters": iters,
-                        "note": "no valid candidate",
-                    }
-                )
-            else:
-                final_prr, final_pred = best
-                results.append(
-                    {
-                        "best_prr": min(float(final_prr), MAX_ALLOWED_PRR),
-                        "pred_temprise": final_pred,
-                        "iters": iters,
-                        "note": "max_iter reached",
-                    }
-                )
+    def _found(rows, prr, pred_temprise, iters, note):
+        for i, x, pred in zip(rows, prr, pred_temprise):
+            results[i] = {
+                "best_prr": min(float(x), MAX_ALLOWED_PRR),
+                "pred_temprise": float(pred),
+                "iters": int(iters),
+                "note": note,
+            }
+
+    # 물리적 가드
+    guard = (predict.voltage <= 0) | (predict.cycles <= 0)
+    _fallback(np.flatnonzero(guard), 0.0, 0, "0 V or 0 cycles")
+    active = np.flatnonzero(~guard)
+
+    # PRF 범위 보정
+    prr_min_adj = max(float(prr_min), MIN_ALLOWED_PRR)
+    prr_max_adj = min(float(prr_max), MAX_ALLOWED_PRR)
+    if prr_min_adj >= prr_max_adj:
+        for i in active:
+            results[i] = {
+                "best_prr": None,
+                "pred_temprise": float("nan"),
+                "iters": 0,
+                "note": "invalid bracket after clipping",
+            }
+        return results
+    if len(active) == 0:
+        return results
+
+    # 초기 로그 스케일 샘플링 (7개로 축소): 입력 × grid 를 한 번에 평가
+    grid = np.geomspace(prr_min_adj, prr_max_adj, num=7)
+    n_grid = len(grid)
+    ys = predict(np.repeat(active, n_grid), np.tile(grid, len(active))).reshape(
+        len(active), n_grid
+    )
+    y_max, y_min = ys.max(axis=1), ys.min(axis=1)
+
+    # 정책 1: 전 구간 차단
+    blocked = y_max <= 0.0
+    _fallback(
+        active[blocked],
+        y_max[blocked],
+        0,
+        "policy: all < MIN_VALID_TEMPRISE → fallback PRF",
+    )
+
+    # 타깃이 범위 밖: 타깃에 가장 가까운 grid 점 (동률이면 앞쪽)
+    outside = ~blocked & ~((y_min <= target_tr) & (target_tr <= y_max))
+    nearest = np.abs(ys - target_tr).argmin(axis=1)
+    nearest_y = ys[np.arange(len(active)), nearest]
+    no_crossing_zero = outside & (nearest_y <= 0.0)
+    _fallback(
+        active[no_crossing_zero], 0.0, 0, "policy: no crossing & pred=0 → fallback PRF"
+    )
+    no_crossing = outside & ~no_crossing_zero
+    _found(
+        active[no_crossing],
+        grid[nearest[no_crossing]],
+        nearest_y[no_crossing],
+        0,
+        "no crossing",
+    )
+
+    search = ~blocked & ~outside
+    rows = active[search]
+    if len(rows) == 0:
+        return results
+    ys = ys[search]
+
+    # ===== 선형 보간으로 초기 추정값 계산 =====
+    # target_tr을 감싸는 첫 번째 인접 구간 (정순 구간을 역순보다 먼저 확인)
+    ascending = (ys[:, :-1] <= target_tr) & (target_tr <= ys[:, 1:])
+    descending = (ys[:, :-1] >= target_tr) & (target_tr >= ys[:, 1:])
+    crossing = ascending | descending
+    first = crossing.argmax(axis=1)
+    has_crossing = crossing.any(axis=1)
+    is_ascending = ascending[np.arange(len(rows)), first]
+    lo_idx = np.where(has_crossing, np.where(is_ascending, first, first + 1), 0)
+    hi_idx = np.where(has_crossing, np.where(is_ascending, first + 1, first), n_grid - 1)
+
+    row_pos = np.arange(len(rows))
+    x0, y0 = grid[lo_idx], ys[row_pos, lo_idx]
+    x1, y1 = grid[hi_idx], ys[row_pos, hi_idx]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_interp = x0 + (target_tr - y0) / (y1 - y0) * (x1 - x0)
+    x_interp = np.maximum(prr_min_adj, np.minimum(prr_max_adj, x_interp))
+    x_init = np.where(np.abs(y1 - y0) > 1e-6, x_interp, 0.5 * (x0 + x1))
+
+    # 초기 추정값 평가
+    y_init = predict(rows, x_init)
+
+    # 이미 충분히 가까우면 바로 반환
+    converged = np.abs(y_init - target_tr) <= tolerance
+    converged_zero = converged & (y_init <= 0.0)
+    _fallback(
+        rows[converged_zero], 0.0, 1, "policy: interpolation converged to 0 → fallback PRF"
+    )
+    converged_ok = converged & ~converged_zero
+    _found(
+        rows[converged_ok],
+        x_init[converged_ok],
+        y_init[converged_ok],
+        1,
+        "converged by interpolation",
+    )
+
+    # ===== 선형 보간 결과 주변에서 정밀 이분 탐색 =====
+    # 탐색 범위를 보간 결과 주변으로 좁힘 (단조성 보정: y_lo > y_hi 이면 교환)
+    keep = ~converged
+    rows = rows[keep]
+    swap = y0[keep] > y1[keep]
+    lo = np.where(swap, x1[keep], x0[keep])
+    hi = np.where(swap, x0[keep], x1[keep])
+    best_x, best_y = x_init[keep], y_init[keep]  # 보간 결과로 초기화
+
+    iters = 1  # 이미 초기 평가 1회 수행
+    while iters < max_iter and len(rows):
+        mid = 0.5 * (lo + hi)
+        y_mid = predict(rows, mid)
+
+        better = np.abs(y_mid - target_tr) < np.abs(best_y - target_tr)
+        best_x = np.where(better, mid, best_x)
+        best_y = np.where(better, y_mid, best_y)
+
+        done = np.abs(y_mid - target_tr) <= tolerance
+        done_zero = done & (y_mid <= 0.0)
+        _fallback(rows[done_zero], 0.0, iters + 1, "policy: converged to 0 → fallback PRF")
+        done_ok = done & ~done_zero
+        _found(rows[done_ok], mid[done_ok], y_mid[done_ok], iters + 1, "converged")
+
+        below = y_mid < target_tr
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+
+        keep = ~done
+        rows, lo, hi = rows[keep], lo[keep], hi[keep]
+        best_x, best_y = best_x[keep], best_y[keep]
+        iters += 1
 
+    # 최대 반복 도달
+    _found(rows, best_x, best_y, iters, "max_iter reached")
     return results
 
 
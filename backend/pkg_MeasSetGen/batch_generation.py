@@ -0,0 +1,219 @@
+"""
+다중 프로브 MeasSetGen 일괄 생성
+(file, probeId, probeName) 목록을 프로세스 풀로 분산 실행하고 결과 manifest를 반환합니다.
+
+- 워커 프로세스는 시작 시 한 번 설정 로드 / 온도 모델 아티팩트 로드 / 프로브 형상 선조회를 수행하고
+  이후 할당되는 모든 프로브 작업에서 재사용합니다.
+- 각 작업은 워커 내부 Flask 요청 컨텍스트(제출자 세션 자격증명)에서 실행되어
+  기존 session / g 기반 DB 연결 코드를 그대로 사용합니다.
+- DB 연결 예산: 항목 하나를 처리하는 동안 MLflow 추적 DB(캐시 키의 Production 모델 fingerprint)와
+  프로브 DB(GroupIndex 예약)를 동시에 사용하므로, 부모 프로세스의 connection_budget 에서
+  워커당 CONNECTIONS_PER_WORKER(2)슬롯을 배치 동안 예약하고 (즉시 예약 가능한 만큼만 워커 생성),
+  워커는 프로세스별 상한 CONNECTIONS_PER_WORKER 로 실행합니다.
+  → 워커 수와 관계없이 전역/사용자별 연결 상한을 넘지 않음
+- 프로세스 풀은 배치마다 생성합니다. 워커 initializer 가 제출자 자격증명과 해당 배치의
+  프로브 형상을 받으므로 사용자/배치 간에 풀을 공유하지 않습니다 (spawn 비용은 배치당 1회).
+
+설정: BATCH_MAX_PROCESSES (기본: CPU 코어 수), BATCH_MAX_ITEMS (기본 100)
+"""
+
+import os
+import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+logger = logging.getLogger("BatchGeneration")
+
+# 워커 프로세스 전역 상태 (initializer에서 설정)
+_worker_app = None
+_worker_credentials = None
+
+# 워커가 항목 처리 중 동시에 여는 DB 연결 수 (MLflow 추적 DB + 프로브 DB)
+CONNECTIONS_PER_WORKER = 2
+
+
+def max_processes():
+    try:
+        value = int(os.environ.get("BATCH_MAX_PROCESSES", 0))
+    except ValueError:
+        value = 0
+    return value if value > 0 else (os.cpu_count() or 1)
+
+
+def max_items():
+    try:
+        return int(os.environ.get("BATCH_MAX_ITEMS", 100))
+    except ValueError:
+        return 100
+
+
+def _reserve_budget(username, wanted, per_worker=CONNECTIONS_PER_WORKER):
+    """
+    부모 프로세스 연결 예산에서 워커용 슬롯을 워커당 per_worker 개씩 예약
+    첫 워커 몫은 예산 대기 시간만큼 기다리고(초과 시 ConnectionBudgetExceeded),
+    나머지 워커 몫은 즉시 가능한 만큼만 (한 워커 몫을 다 못 채우면 그 워커 몫은 반납)
+    Returns: (connection_budget, 워커별 ticket 목록의 목록)
+    """
+    from utils.database_manager import connection_budget
+    from utils.error_handler import ConnectionBudgetExceeded
+
+    def reserve(timeout=None):
+        tickets = []
+        try:
+            for _ in range(per_worker):
+                tickets.append(connection_budget.acquire(username, "batch", timeout=timeout))
+        except ConnectionBudgetExceeded:
+            for ticket in tickets:
+                connection_budget.release(ticket)
+            raise
+        return tickets
+
+    reserved = [reserve()]
+    while len(reserved) < wanted:
+        try:
+            reserved.append(reserve(timeout=0))
+        except ConnectionBudgetExceeded:
+            break
+    return connection_budget, reserved
+
+
+def _prefetch_geometries(items):
+    """배치에 포함된 (database, probeId)별 프로브 형상을 부모 프로세스에서 한 번씩 조회"""
+    from pkg_MeasSetGen.probe_geometry import probe_geometry_repository
+
+    geometries = []
+    for database, probe_id in dict.fromkeys((i["database"], i["probeId"]) for i in items):
+        try:
+            geometries.append(probe_geometry_repository.get(database, probe_id))
+        except Exception as e:
+            # 조회 실패 시 워커에서 개별 조회
+            logger.warning(f"Probe geometry prefetch failed ({database}, {probe_id}): {e}")
+    return geometries
+
+
+def _init_worker(username, password, environ, geometries=()):
+    """워커 프로세스 초기화: 설정/앱 컨텍스트 준비, 모델 사전 로드 및 프로브 형상 캐시 등록"""
+    global _worker_app, _worker_credentials
+    os.environ.update(environ)
+
+    from flask import Flask
+    from config import Config
+    from utils.database_manager import DatabaseManager
+
+    app = Flask("aop_batch_worker")
+    app.secret_key = Config.FLASK_SECRET_KEY
+
+    @app.teardown_appcontext
+    def teardown_db(exception):
+        DatabaseManager.close_connections()
+
+    _worker_app = app
+    _worker_credentials = (username, password)
+
+    try:
+        # 워커 프로세스 캐시에 미리 로드 (항목마다 다시 읽지 않음)
+        from pkg_MeasSetGen.Temp_Prr_predict import load_artifacts
+
+        load_artifacts()
+    except Exception as e:
+        logger.warning(f"Worker {os.getpid()}: temperature artifacts preload failed: {e}")
+
+    if geometries:
+        from pkg_MeasSetGen.probe_geometry import probe_geometry_repository
+
+        probe_geometry_repository.prime(geometries)
+
+
+def _run_item(item):
+    """워커에서 프로브 1건 생성 → manifest 항목 반환"""
+    from flask import session
+    from pkg_MeasSetGen.meas_generation import MeasSetGen
+
+    start = time.perf_counter()
+    entry = {
+        "file": item["filename"],
+        "database": item["database"],
+        "probeId": item["probeId"],
+        "probeName": item["probeName"],
+        "status": "failed",
+        "csv_key": None,
+        "error": None,
+        "worker_pid": os.getpid(),
+    }
+    try:
+        with _worker_app.test_request_context():
+            session["username"], session["password"] = _worker_credentials
+            meas_gen = MeasSetGen(
+                item["database"], item["probeId"], item["probeName"], item["file_path"]
+            )
+            try:
+                entry["csv_key"] = meas_gen.generate(incremental=item.get("incremental", False))
+            finally:
+                entry["profile"] = meas_gen.profile
+        entry["status"] = "succeeded"
+    except Exception as e:
+        entry["error"] = str(e)
+    entry["seconds"] = round(time.perf_counter() - start, 3)
+    return entry
+
+
+def run_batch(items, username, password, progress=None):
+    """
+    items: [{"file_path", "filename", "database", "probeId", "probeName", "incremental"(선택)}, ...]
+    progress: 선택적 콜백 progress(done, total)
+    Returns: 입력 순서대로 정렬된 manifest 항목 목록
+    """
+    if not items:
+        return []
+
+    # 설정값(AOP_config.cfg → 환경변수)을 워커에 그대로 전달
+    environ = {k: v for k, v in os.environ.items() if k.isupper()}
+    # 워커는 항목을 하나씩 처리하고 항목당 DB 연결을 최대 CONNECTIONS_PER_WORKER 개 동시에 사용
+    # (MLflow 추적 DB + 프로브 DB) → 부모가 워커별로 예약한 슬롯 안에서 실행
+    environ["DB_BUDGET_GLOBAL_LIMIT"] = str(CONNECTIONS_PER_WORKER)
+    environ["DB_BUDGET_PER_USER_LIMIT"] = str(CONNECTIONS_PER_WORKER)
+    geometries = _prefetch_geometries(items)
+    context = multiprocessing.get_context("spawn")
+
+    budget, reserved = _reserve_budget(username, min(max_processes(), len(items)))
+    workers = len(reserved)
+    manifest = [None] * len(items)
+    done = 0
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(username, password, environ, geometries),
+        ) as executor:
+            futures = {executor.submit(_run_item, item): idx for idx, item in enumerate(items)}
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    manifest[idx] = future.result()
+                except Exception as e:
+                    # 워커 프로세스 비정상 종료 등
+                    item = items[idx]
+                    manifest[idx] = {
+                        "file": item["filename"],
+                        "database": item["database"],
+                        "probeId": item["probeId"],
+                        "probeName": item["probeName"],
+                        "status": "failed",
+                        "csv_key": None,
+                        "error": str(e),
+                    }
+                done += 1
+                if progress is not None:
+                    progress(done, len(items))
+    finally:
+        for tickets in reserved:
+            for ticket in tickets:
+                budget.release(ticket)
+
+    logger.info(
+        f"Batch generation finished: {sum(e['status'] == 'succeeded' for e in manifest)}"
+        f"/{len(items)} succeeded with {workers} process(es)"
+    )
+    return manifest
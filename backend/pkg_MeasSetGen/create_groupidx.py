@@ -2,6 +2,8 @@ import logging
 import pandas as pd
 from flask import session
 from utils.database_manager import get_db_connection
+from pkg_MeasSetGen.dedupe_group import DedupeGroupEngine
+from pkg_MeasSetGen.group_index_allocator import group_index_allocator
 
 # Pandas 다운캐스팅 옵션 설정
 pd.set_option("future.no_silent_downcasting", True)
@@ -19,38 +21,33 @@ class GroupIdx:
         self.database = database
 
     def getGroupIdx(self):
-        ## 데이터베이스에서 마지막 groupIndex 값 load
-        try:
-            connect = get_db_connection(self.database)
-            query = """
-                SELECT MAX(groupIndex) AS maxGroupIndex from meas_setting
-                where probeid = ?
-            """
-            maxGroupIdx_df = connect.execute_query(query, (self.probeId,))
-            maxGroupIdx = maxGroupIdx_df["maxGroupIndex"].iloc[0]
-
-            return maxGroupIdx if maxGroupIdx is not None else 0
-
-        except Exception as e:
-            # 오류 발생 시 0을 반환하여 1부터 시작하도록 함
-            logger.warning(f"getGroupIdx 오류 발생, 기본값 0 반환: {e}")
-            return 0
-
-    def createGroupIdx(self, df):
-        # GroupIndex 열 생성 — 벡터화 방식 (for 루프 대비 10x+ 빠름)
-        last_groupIdx = self.getGroupIdx()
+        ## 데이터베이스에서 마지막 groupIndex 값 load (조회 전용 — 번호 할당에는 reserveGroupIdx 사용)
+        # 조회 실패 시 0으로 대체하지 않고 예외 발생 (1부터 다시 매기면 기존 GroupIndex와 겹침)
+        connect = get_db_connection(self.database)
+        query = """
+            SELECT MAX(groupIndex) AS maxGroupIndex from meas_setting
+            where probeid = ?
+        """
+        maxGroupIdx_df = connect.execute_query(query, (self.probeId,))
+        maxGroupIdx = maxGroupIdx_df["maxGroupIndex"].iloc[0] if not maxGroupIdx_df.empty else None
+
+        return 0 if maxGroupIdx is None or pd.isna(maxGroupIdx) else int(maxGroupIdx)
+
+    def reserveGroupIdx(self, count):
+        ## count 개의 GroupIndex 구간을 원자적으로 예약 → 구간 직전 번호(last_groupIdx) 반환
+        # 예약 실패 시 0으로 대체하지 않고 예외 발생 (다른 생성 작업과 번호가 겹치지 않도록)
+        start = group_index_allocator.reserve(self.database, self.probeId, count)
+        return start - 1
+
+    def createGroupIdx(self, df, last_groupIdx=None):
+        # GroupIndex 열 생성 — 벡터화 방식 (DedupeGroupEngine)
+        # last_groupIdx: 이미 예약한 구간의 직전 번호 (None이면 그룹 수만큼 구간 예약)
+        if last_groupIdx is None:
+            last_groupIdx = self.reserveGroupIdx(DedupeGroupEngine.group_count(df))
 
         # TxFocusLocCm이 이전 값보다 작아지는 지점에서 그룹 증가
-        decreased = df["TxFocusLocCm"] < df["TxFocusLocCm"].shift()
-        df["GroupIndex"] = decreased.fillna(False).cumsum() + last_groupIdx + 1
-
-        return df
+        return DedupeGroupEngine(last_groupIdx).assign_group_index(df)
 
     def updateDuplicate(self, df):
         # 각 GroupIndex 내에서 하나라도 isDuplicate가 0이면 해당 그룹의 모든 isDuplicate를 0으로 설정
-
-        df["isDuplicate"] = df.groupby("GroupIndex")["isDuplicate"].transform(
-            lambda x: 0 if 0 in x.values else 1
-        )
-
-        return df
+        return DedupeGroupEngine.merge_group_duplicates(df)
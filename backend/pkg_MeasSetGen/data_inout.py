@@ -1,13 +1,204 @@
 import logging
 import os
+import threading
 import numpy as np
 import pandas as pd
 from datetime import datetime
+from pandas.api.types import union_categoricals
 
 
-def loadfile(file_path):
-    encoding_data = pd.read_csv(file_path, sep="\t", encoding="cp949")
-    return encoding_data
+logger = logging.getLogger("DataInOut")
+
+## MeasSetGen 결과 CSV 저장 위치 (DB별 하위 디렉토리)
+RESULT_DIR = "./1_uploads/0_MeasSetGen_files"
+
+## 시퀀스 파일에서 실제로 사용하는 컬럼 (RemoveDuplicate 선택 컬럼과 동일)
+SEQUENCE_COLUMNS = [
+    "Mode",
+    "SubModeIndex",
+    "BeamStyleIndex",
+    "SysTxFreqIndex",
+    "TxpgWaveformStyle",
+    "TxFocusLocCm",
+    "NumTxElements",
+    "ProbeNumTxCycles",
+    "IsTxChannelModulationEn",
+    "IsPresetCpaEn",
+    "CpaDelayOffsetClk",
+    "ElevAperIndex",
+    "SystemPulserSel",
+    "VTxIndex",
+    "TxPulseRle",
+]
+
+## 컬럼 타입: Mode는 category, 인덱스/플래그는 작은 정수
+## (정수 타입은 값이 그대로 유지될 때만 적용 — 결측/범위 초과/소수가 있으면 파싱된 타입 유지)
+SEQUENCE_DTYPES = {
+    "Mode": "category",
+    "SubModeIndex": "int8",
+    "BeamStyleIndex": "int16",
+    "SysTxFreqIndex": "int8",
+    "TxpgWaveformStyle": "int8",
+    "NumTxElements": "int16",
+    "IsTxChannelModulationEn": "int8",
+    "IsPresetCpaEn": "int8",
+    "ElevAperIndex": "int8",
+    "SystemPulserSel": "int8",
+    "VTxIndex": "int8",
+}
+
+
+def _split_dtypes(dtype):
+    """파싱 시 적용할 타입 / 파싱 후 결측 확인 뒤 적용할 정수 타입 분리"""
+    parse_dtypes, int_dtypes = {}, {}
+    for column, column_dtype in (dtype or {}).items():
+        if column_dtype != "category" and np.dtype(column_dtype).kind in "iu":
+            int_dtypes[column] = column_dtype
+        else:
+            parse_dtypes[column] = column_dtype
+    return parse_dtypes, int_dtypes
+
+
+def _apply_int_dtypes(df, int_dtypes):
+    """
+    정수 타입 축소: 결측이 없고, 모두 정수이며, 대상 타입 범위 안일 때만 적용
+    (그대로 astype 하면 200 → int8 -56, 1.5 → 1 처럼 값이 바뀜)
+    """
+    # frame_schema 가 이 모듈을 import 하므로 함수 안에서 가져옴
+    from pkg_MeasSetGen.frame_schema import _castable
+
+    for column, column_dtype in int_dtypes.items():
+        if column not in df.columns:
+            continue
+        values = df[column]
+        dtype = np.dtype(column_dtype)
+        if values.dtype == dtype:
+            continue
+        if _castable(values, dtype):
+            df[column] = values.astype(dtype)
+        elif not values.isna().any():
+            # 결측은 흔하지만 범위 초과/소수는 예상 밖의 입력이므로 남겨 둠
+            logger.warning(f"{column}: {values.dtype} 유지 ({column_dtype} 범위 밖이거나 정수가 아닌 값 포함)")
+    return df
+
+
+def _resolve_engine(engine, chunksize):
+    """pyarrow 엔진은 설치되어 있고 청크 모드가 아닐 때만 사용"""
+    if engine != "pyarrow":
+        return engine or "c"
+    if chunksize:
+        return "c"
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        logger.warning("pyarrow is not installed; falling back to the C parser")
+        return "c"
+    return "pyarrow"
+
+
+def iter_loadfile(file_path, usecols=None, dtype=None, engine=None, chunksize=200000):
+    """
+    시퀀스 파일을 chunksize 행 단위 DataFrame으로 순차 반환 (타입 축소 적용)
+    """
+    parse_dtypes, int_dtypes = _split_dtypes(dtype)
+    reader = pd.read_csv(
+        file_path,
+        sep="\t",
+        encoding="cp949",
+        usecols=usecols,
+        dtype=parse_dtypes or None,
+        engine=_resolve_engine(engine, chunksize),
+        chunksize=chunksize,
+    )
+    with reader:
+        for chunk in reader:
+            yield _apply_int_dtypes(chunk, int_dtypes)
+
+
+def loadfile(file_path, usecols=None, dtype=None, engine=None, chunksize=None):
+    """
+    탭 구분 cp949 시퀀스 파일 로드
+    - usecols: 읽을 컬럼 목록 (None이면 전체 컬럼)
+    - dtype: 컬럼별 타입 (예: SEQUENCE_DTYPES)
+    - engine: "c"(기본) 또는 "pyarrow" (미설치 시 c로 대체)
+    - chunksize: 지정 시 청크 단위로 읽어 타입 축소 후 결합 (대용량 파일의 피크 메모리 절감)
+    """
+    if not chunksize:
+        parse_dtypes, int_dtypes = _split_dtypes(dtype)
+        encoding_data = pd.read_csv(
+            file_path,
+            sep="\t",
+            encoding="cp949",
+            usecols=usecols,
+            dtype=parse_dtypes or None,
+            engine=_resolve_engine(engine, None),
+        )
+        return _apply_int_dtypes(encoding_data, int_dtypes)
+
+    chunks = list(iter_loadfile(file_path, usecols, dtype, engine, chunksize))
+    if not chunks:
+        return pd.DataFrame(columns=usecols)
+
+    # 청크마다 category 목록이 다르면 concat 시 object로 풀리므로 공통 category로 맞춤
+    for column, column_dtype in (dtype or {}).items():
+        if column_dtype == "category" and column in chunks[0].columns:
+            categories = union_categoricals([chunk[column] for chunk in chunks]).categories
+            for chunk in chunks:
+                chunk[column] = chunk[column].cat.set_categories(categories)
+
+    encoding_data = pd.concat(chunks, ignore_index=True)
+    del chunks
+
+    # 일부 청크에만 결측이 있었던 정수 컬럼은 결합 후 다시 확인
+    _, int_dtypes = _split_dtypes(dtype)
+    return _apply_int_dtypes(encoding_data, int_dtypes)
+
+
+## 결과 CSV와 같은 내용의 컬럼 포맷 (pyarrow 필요)
+COLUMNAR_FORMATS = {
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+    "feather": (".feather", "application/vnd.apache.arrow.file"),
+}
+
+
+def columnar_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def columnar_path(csv_path, fmt):
+    return os.path.splitext(str(csv_path))[0] + COLUMNAR_FORMATS[fmt][0]
+
+
+def export_columnar(csv_path, fmt):
+    """
+    결과 CSV를 parquet/feather로 변환해 같은 위치에 저장 후 경로 반환
+    이미 변환된 파일이 CSV보다 최신이면 재사용
+    """
+    target = columnar_path(csv_path, fmt)
+    try:
+        if os.path.getmtime(target) >= os.path.getmtime(csv_path):
+            return target
+    except OSError:
+        pass
+
+    df = pd.read_csv(csv_path)
+    # 같은 파일을 동시에 변환하는 요청(스레드/프로세스)끼리 임시 파일이 겹치지 않도록
+    tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        if fmt == "parquet":
+            df.to_parquet(tmp_path, index=False)
+        else:
+            df.to_feather(tmp_path)
+        os.replace(tmp_path, target)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return target
 
 
 def arrangeParam(func):
@@ -94,7 +285,7 @@ class DataOut:
         if self.case == 0:
             ## MeasSetGen_files
             self.df = df1
-            self.directory = f"./1_uploads/0_MeasSetGen_files/{self.database}"
+            self.directory = f"{RESULT_DIR}/{self.database}"
 
         elif self.case == 1:
             ## Verification_reports
@@ -108,12 +299,32 @@ class DataOut:
                 logging.getLogger("DataOut").warning(f"Failed to create directory {self.directory}: {e}")
                 raise
 
+    def result_path(self):
+        ## meas_setting 결과 CSV 경로
+        return f"{self.directory}/meas_setting_{self.probename}_{self.formatted_datetime}_result.csv"
+
+    def save_result(self):
+        """
+        이미 결과 CSV 형식(컬럼명/순서)인 DataFrame을 그대로 저장 (캐시된 결과 재사용용)
+        save_excel 은 arrangeParam/renameColumns 를 다시 적용해 바뀐 컬럼이 비게 되므로 사용하지 않음
+        같은 분에 만든 결과 파일이 있으면 덮어쓰지 않고 _1, _2 … 를 붙임
+        """
+        self.make_dir()
+        file_path = self.result_path()
+        stem, suffix = os.path.splitext(file_path)
+        n = 1
+        while os.path.exists(file_path):
+            file_path = f"{stem}_{n}{suffix}"
+            n += 1
+        self.df.to_csv(file_path, index=False)
+        return file_path
+
     @arrangeParam
     @renameColumns
     def save_excel(self):
         ## meas_setting 알고리즘
         if self.case == 0:
-            file_path = f"{self.directory}/meas_setting_{self.probename}_{self.formatted_datetime}_result.csv"
+            file_path = self.result_path()
 
             self.df.to_csv(file_path, index=False)
 
@@ -0,0 +1,120 @@
+"""
+중복 제거 + GroupIndex 부여 엔진 (컬럼 단위 단일 패스)
+기존 RemoveDuplicate(모드별 3개 복사본 → duplicated → concat)와
+GroupIdx.createGroupIdx / updateDuplicate(groupby + Python lambda)를 대체합니다.
+
+동작은 기존과 동일:
+- B/M, Cb/D 모드 묶음 안에서 DEDUPE_COLUMNS 가 같은 행을 중복(isDuplicate=1)으로 표시
+- 중복인 M / D 모드 행은 삭제, Contrast 행은 isDuplicate=0, 그 외 모드는 제외
+- Cb/D 행의 결측은 0으로 채움 (category 컬럼 제외)
+- 결과 순서: B/M → Cb/D → Contrast (각 묶음 안에서는 원래 순서)
+- TxFocusLocCm 가 이전 행보다 작아지는 지점마다 GroupIndex 증가,
+  그룹 안에 isDuplicate=0 행이 하나라도 있으면 그룹 전체 0
+"""
+
+import numpy as np
+import pandas as pd
+
+from pkg_MeasSetGen.data_inout import SEQUENCE_COLUMNS
+
+## 중복 판단 컬럼
+DEDUPE_COLUMNS = [
+    "SysTxFreqIndex",
+    "TxpgWaveformStyle",
+    "ProbeNumTxCycles",
+    "IsTxChannelModulationEn",
+    "IsPresetCpaEn",
+    "ElevAperIndex",
+    "TxFocusLocCm",
+    "NumTxElements",
+]
+
+## Mode → 중복 판단 묶음 (0: B/M, 1: Cb/D, 2: Contrast — 중복 판단 없음)
+MODE_PARTITIONS = {"B": 0, "M": 0, "Cb": 1, "D": 1, "Contrast": 2}
+## 중복일 때 삭제되는 모드
+DROP_ON_DUPLICATE = ["M", "D"]
+
+
+def _row_codes(columns):
+    """여러 컬럼 값 조합 → 조합별 정수 코드 (결측끼리는 같은 값으로 취급, duplicated와 동일)"""
+    codes = np.zeros(len(columns[0]), dtype=np.int64)
+    for column in columns:
+        column_codes, column_uniques = pd.factorize(column, use_na_sentinel=False)
+        codes = codes * len(column_uniques) + column_codes
+        # 조합 코드를 다시 0..k-1 로 압축해 컬럼 수가 늘어도 int64 범위 유지
+        codes = pd.factorize(codes)[0]
+    return codes
+
+
+class DedupeGroupEngine:
+    """
+    engine = DedupeGroupEngine(last_group_idx)
+    df_total = engine.dedupe(raw_data)       # RemoveDuplicate.remove_duplicate 대체
+    selected_df = engine.assign_groups(df_total)  # createGroupIdx + updateDuplicate 대체
+    (group_count(df_total) 로 그룹 수를 먼저 구해 GroupIndex 구간을 예약한 뒤 last_group_idx 지정 가능)
+    """
+
+    def __init__(self, last_group_idx=0):
+        self.last_group_idx = last_group_idx
+
+    def dedupe(self, df):
+        df = df.loc[:, SEQUENCE_COLUMNS]
+        mode = df["Mode"]
+        partition = (
+            mode.map(MODE_PARTITIONS).astype("float64").fillna(-1).to_numpy(dtype=np.int8)
+        )
+
+        # Cb/D 행의 결측만 0으로 채움 (결측이 있는 컬럼만 처리)
+        is_cd = partition == 1
+        for column in df.columns:
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                continue
+            fill_rows = is_cd & df[column].isna().to_numpy()
+            if fill_rows.any():
+                df.loc[fill_rows, column] = 0
+
+        # 묶음 번호 + 중복 판단 컬럼으로 한 번에 조합 코드 계산 → 조합별 행 수
+        codes = _row_codes([partition] + [df[c].to_numpy() for c in DEDUPE_COLUMNS])
+        counts = np.bincount(codes)
+        is_duplicate = (counts[codes] > 1) & (partition <= 1)
+
+        drop = is_duplicate & mode.isin(DROP_ON_DUPLICATE).to_numpy()
+        keep = np.flatnonzero((partition >= 0) & ~drop)
+        # B/M → Cb/D → Contrast 순서 (묶음 안에서는 원래 순서 유지)
+        order = keep[np.argsort(partition[keep], kind="stable")]
+
+        df_total = df.take(order).reset_index(drop=True)
+        df_total["isDuplicate"] = is_duplicate[order].astype(np.int64)
+        return df_total
+
+    @staticmethod
+    def group_count(df):
+        """assign_group_index 가 만들 그룹 수 (GroupIndex 구간 예약용)"""
+        if df.empty:
+            return 0
+        focus = df["TxFocusLocCm"].to_numpy()
+        return int(np.count_nonzero(focus[1:] < focus[:-1])) + 1
+
+    def assign_group_index(self, df):
+        """TxFocusLocCm 가 이전 행보다 작아지는 지점마다 GroupIndex 증가"""
+        focus = df["TxFocusLocCm"].to_numpy()
+        decreased = np.zeros(len(df), dtype=bool)
+        if len(df) > 1:
+            decreased[1:] = focus[1:] < focus[:-1]
+        df["GroupIndex"] = pd.Series(np.cumsum(decreased, dtype=np.int64), index=df.index) + self.last_group_idx + 1
+        return df
+
+    @staticmethod
+    def merge_group_duplicates(df):
+        """그룹 안에 isDuplicate=0 행이 하나라도 있으면 그룹 전체 0, 아니면 1"""
+        if len(df):
+            group_codes = pd.factorize(df["GroupIndex"])[0]
+            non_duplicate = np.bincount(group_codes, weights=(df["isDuplicate"].to_numpy() == 0))
+            df["isDuplicate"] = np.where(non_duplicate[group_codes] > 0, 0, 1).astype(np.int64)
+        return df
+
+    def assign_groups(self, df):
+        return self.merge_group_duplicates(self.assign_group_index(df))
+
+    def run(self, df):
+        return self.assign_groups(self.dedupe(df))
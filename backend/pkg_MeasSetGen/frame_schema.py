@@ -0,0 +1,102 @@
+"""
+MeasSetGen 파이프라인 DataFrame 타입 스키마
+- 로드: data_inout.SEQUENCE_DTYPES (Mode category, 인덱스/플래그 int8/int16)
+- 중복 제거/GroupIndex, ParamGen 이후: PIPELINE_DTYPES 로 축소 (compact_frame)
+
+축소는 값이 바뀌지 않을 때만 적용합니다.
+- 정수: 결측이 없고 값이 대상 타입 범위 안일 때
+- float32: float32로 바꿨다 되돌려도 값이 같을 때 (0.5, 93 등) — 모델 입력/결과 CSV 값 유지
+- category: 문자열(object) 컬럼
+그 외에는 원래 타입을 유지하므로 결과 CSV는 축소 여부와 관계없이 동일합니다.
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+
+from pkg_MeasSetGen.data_inout import SEQUENCE_DTYPES
+
+logger = logging.getLogger("FrameSchema")
+
+## 파이프라인 중간 DataFrame 컬럼 타입 (SEQUENCE_DTYPES + 생성 컬럼)
+PIPELINE_DTYPES = {
+    **SEQUENCE_DTYPES,
+    "isDuplicate": "int8",
+    "GroupIndex": "int64",
+    "OrgBeamstyleIdx": "int8",
+    "bsIndexTrace": "int8",
+    "TxFrequencyHz": "int32",
+    "totalVoltagePt": "int8",
+    "numMeasVoltage": "int8",
+    "DTxFreqIndex": "int8",
+    "zStartDistCm": "float32",
+    "zMeasNum": "float32",
+    "maxTxVoltageVolt": "float32",
+    "ceilTxVoltageVolt": "float32",
+    "probeId": "category",
+    "probeName": "category",
+    "dumpSwVersion": "category",
+    "measSetComments": "category",
+}
+
+
+def _castable(values, dtype):
+    """values 를 dtype 으로 바꿔도 값이 그대로인지"""
+    if dtype.kind in "iu":
+        if values.dtype.kind not in "iuf" or values.isna().any():
+            return False
+        if values.empty:
+            return True
+        info = np.iinfo(dtype)
+        if values.min() < info.min or values.max() > info.max:
+            return False
+        # 소수부가 있는 실수는 제외
+        return values.dtype.kind != "f" or bool((values % 1 == 0).all())
+    if dtype.kind == "f":
+        if values.dtype.kind not in "iuf":
+            return False
+        array = values.to_numpy(dtype="float64")
+        return bool(np.array_equal(array.astype(dtype).astype("float64"), array, equal_nan=True))
+    return False
+
+
+def compact_frame(df, schema=None):
+    """
+    스키마에 있는 컬럼을 축소 타입으로 변환 (변환 시 값이 바뀌는 컬럼은 유지)
+    df 를 직접 수정하고 반환
+    """
+    schema = PIPELINE_DTYPES if schema is None else schema
+    for column, column_dtype in schema.items():
+        if column not in df.columns:
+            continue
+        values = df[column]
+        if column_dtype == "category":
+            if values.dtype == object:
+                df[column] = values.astype("category")
+            continue
+        dtype = np.dtype(column_dtype)
+        if values.dtype == dtype:
+            continue
+        if _castable(values, dtype):
+            df[column] = values.astype(dtype)
+        else:
+            logger.debug(f"{column}: {values.dtype} 유지 ({column_dtype} 변환 시 값 손실)")
+    return df
+
+
+def fill_missing(df, value=-1):
+    """
+    결측을 value 로 채움 (category 컬럼은 결측이 있을 때만 value 를 category 로 추가)
+    """
+    skip = []
+    for column in df.select_dtypes("category").columns:
+        if not df[column].isna().any():
+            skip.append(column)
+        elif value not in df[column].cat.categories:
+            df[column] = df[column].cat.add_categories([value])
+    return df.fillna({column: value for column in df.columns if column not in skip})
+
+
+def frame_memory_mb(df):
+    """DataFrame 메모리 사용량 (object 문자열 포함, MB)"""
+    return round(df.memory_usage(deep=True).sum() / (1024 * 1024), 3)
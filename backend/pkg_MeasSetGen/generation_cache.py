@@ -0,0 +1,197 @@
+"""
+MeasSetGen.generate 결과 캐시 (content-addressed)
+키 = sha256(업로드 파일 해시, database, probeId, probeName,
+           Production 모델 버전/체크섬, 온도 모델 아티팩트 fingerprint)
+값 = 결과 CSV 사본 (<CACHE_DIR>/<key>.csv) — 파일명이 곧 키이므로 재시작 후에도 유지
+     생성 시각은 <key>.created 에 따로 기록 (만료 기준), 파일 mtime 은 최근 사용 시각 (LRU 기준)
+     — os.utime 은 ctime 도 갱신하므로 ctime 으로는 생성 시각을 알 수 없음
+     GroupIndex 는 캐시 적중 시 새로 예약한 구간으로 옮겨 사용 (MeasSetGen._rebase_cached)
+
+설정 (AOP_config.cfg [MeasSet_Cache]):
+    ENABLED          캐시 사용 여부 (기본 true)
+    MAX_ENTRIES      최대 항목 수 (기본 200)
+    MAX_MB           최대 총 크기 MB (기본 500)
+    MAX_AGE_SEC      최대 보관 시간 초 (기본 7일)
+모델이 Production으로 승격되면 invalidate_all()로 전체 무효화합니다.
+"""
+
+import os
+import time
+import shutil
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger("GenerationCache")
+
+# 캐시 키 형식/생성 로직이 바뀌면 증가 (이전 항목 자동 무효화)
+CACHE_VERSION = 2
+CACHE_DIR = "./1_uploads/0_MeasSetGen_files/_cache"
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def file_sha256(file_path, block_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class GenerationCache:
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    # ----- 설정 -----
+    @staticmethod
+    def enabled():
+        return os.environ.get("MEASSET_CACHE_ENABLED", "true").lower() == "true"
+
+    @staticmethod
+    def max_entries():
+        return _env_number("MEASSET_CACHE_MAX_ENTRIES", 200)
+
+    @staticmethod
+    def max_bytes():
+        return _env_number("MEASSET_CACHE_MAX_MB", 500, float) * 1024 * 1024
+
+    @staticmethod
+    def max_age():
+        return _env_number("MEASSET_CACHE_MAX_AGE_SEC", 7 * 24 * 3600)
+
+    # ----- 키 -----
+    @staticmethod
+    def make_key(file_hash, database, probe_id, probe_name, model_fingerprint):
+        parts = [
+            f"v{CACHE_VERSION}",
+            file_hash,
+            str(database),
+            str(probe_id),
+            str(probe_name),
+            str(model_fingerprint),
+        ]
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.csv")
+
+    @staticmethod
+    def _created_path(path):
+        return f"{os.path.splitext(path)[0]}.created"
+
+    def _created(self, path):
+        """항목 생성 시각 (기록이 없거나 읽을 수 없으면 None → 만료로 취급)"""
+        try:
+            with open(self._created_path(path), encoding="utf-8") as f:
+                return float(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _expired(self, created, now=None):
+        return created is None or (now or time.time()) - created > self.max_age()
+
+    # ----- 조회/저장 -----
+    def get(self, key):
+        """캐시된 결과 CSV 경로 (없거나 만료 시 None). 조회 시 최근 사용 시각 갱신"""
+        path = self._path(key)
+        with self._lock:
+            if not os.path.exists(path):
+                return None
+            if self._expired(self._created(path)):
+                self._remove(path)
+                return None
+            os.utime(path, None)  # LRU 순서용 mtime 갱신
+        return path
+
+    def put(self, key, csv_path):
+        """결과 CSV 사본을 캐시에 저장 후 캐시 경로 반환"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        suffix = f"{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_path = f"{path}.{suffix}"
+        created_tmp = f"{self._created_path(path)}.{suffix}"
+        shutil.copyfile(csv_path, tmp_path)
+        with open(created_tmp, "w", encoding="utf-8") as f:
+            f.write(repr(time.time()))
+        with self._lock:
+            # 생성 시각을 먼저 교체 → 새 CSV 가 보이는 시점에는 항상 새 생성 시각이 있음
+            os.replace(created_tmp, self._created_path(path))
+            os.replace(tmp_path, path)
+            self._evict()
+        return path
+
+    # ----- 정리 -----
+    def _entries(self):
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for name in os.listdir(self.directory):
+            if not name.endswith(".csv"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, self._created(path), stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        """만료 항목 제거 후, 항목 수/총 크기 상한을 넘으면 오래 사용되지 않은 순으로 제거"""
+        now = time.time()
+        entries = []
+        for mtime, created, size, path in self._entries():
+            if self._expired(created, now):
+                self._remove(path)
+            else:
+                entries.append((mtime, size, path))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries() or total > self.max_bytes()):
+            _, size, path = entries.pop(0)
+            total -= size
+            self._remove(path)
+
+    def invalidate_all(self):
+        """전체 무효화 (모델 승격 시)"""
+        with self._lock:
+            removed = 0
+            for _, _, _, path in self._entries():
+                self._remove(path)
+                removed += 1
+        if removed:
+            logger.info(f"Generation cache invalidated ({removed} entries)")
+        return removed
+
+    @staticmethod
+    def _remove(path):
+        # 생성 시각 기록과 결과 전달 시 만들어진 parquet/feather 사본도 함께 제거
+        stem = os.path.splitext(path)[0]
+        for target in (path, f"{stem}.created", f"{stem}.parquet", f"{stem}.feather"):
+            try:
+                os.remove(target)
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        entries = self._entries()
+        return {
+            "enabled": self.enabled(),
+            "entries": len(entries),
+            "bytes": sum(size for _, _, size, _ in entries),
+            "max_entries": self.max_entries(),
+            "max_bytes": int(self.max_bytes()),
+            "max_age_sec": self.max_age(),
+        }
+
+
+# 전역 싱글톤 인스턴스
+generation_cache = GenerationCache()
@@ -0,0 +1,147 @@
+"""
+프로브별 GroupIndex 구간 예약
+- 카운터 테이블(aop_group_index_counter, db/add_group_index_counter_table.sql)에서
+  연속된 구간을 원자적으로 할당 (UPDLOCK/HOLDLOCK 트랜잭션 1회 왕복)
+- 처음 예약하는 프로브는 meas_setting 의 MAX(groupIndex)로 카운터를 초기화 (프로브당 1회)
+- 프로세스 내 high-water 캐시: DB에서 MEASSET_GROUP_INDEX_BLOCK 단위로 미리 받아 두고
+  이후 예약은 DB 왕복 없이 처리 (0이면 매번 필요한 만큼만 DB에서 예약)
+
+동시에 실행되는 생성 작업(스레드/프로세스/서버)끼리 GroupIndex 구간이 겹치지 않습니다.
+사용하지 않은 구간은 번호가 비는 것으로 끝나며 재사용하지 않습니다.
+카운터 테이블이 없는 DB에서는 예약하지 않고 예외를 발생시킵니다 (MAX 조회로는 다른 프로세스와의
+중복을 막을 수 없으므로 대체하지 않음).
+"""
+
+import os
+import threading
+import logging
+
+from pkg_SQL.compiled_query import compile_query
+
+logger = logging.getLogger("GroupIndexAllocator")
+
+COUNTER_TABLE = "aop_group_index_counter"
+
+_RESERVE_QUERY = compile_query(
+    f"""
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+    BEGIN TRAN;
+    IF NOT EXISTS (SELECT 1 FROM {COUNTER_TABLE} WITH (UPDLOCK, HOLDLOCK) WHERE probeid = ?)
+        INSERT INTO {COUNTER_TABLE} (probeid, last_group_index)
+        SELECT ?, ISNULL(MAX(groupIndex), 0) FROM meas_setting WHERE probeid = ?;
+    UPDATE {COUNTER_TABLE}
+    SET last_group_index = last_group_index + ?, updated_at = SYSUTCDATETIME()
+    OUTPUT DELETED.last_group_index AS previous
+    WHERE probeid = ?;
+    COMMIT;
+    """
+)
+
+# SQL Server "Invalid object name" (SQLSTATE 42S02, 오류 번호 208)
+_MISSING_OBJECT_STATE = "42S02"
+_MISSING_OBJECT_NUMBER = "(208)"
+
+
+class CounterTableMissing(RuntimeError):
+    """카운터 테이블(aop_group_index_counter)이 없는 DB"""
+
+
+def _is_missing_counter_table(error):
+    """pyodbc 오류(또는 SQLAlchemy 래핑)가 카운터 테이블에 대한 Invalid object name 인지"""
+    error = getattr(error, "orig", None) or error
+    args = getattr(error, "args", ())
+    state = str(args[0]) if args else ""
+    message = " ".join(str(arg) for arg in args)
+    return (
+        state == _MISSING_OBJECT_STATE
+        and _MISSING_OBJECT_NUMBER in message
+        and COUNTER_TABLE in message
+    )
+
+
+def _block_size():
+    try:
+        return max(0, int(os.environ.get("MEASSET_GROUP_INDEX_BLOCK", 256)))
+    except ValueError:
+        return 0
+
+
+class GroupIndexAllocator:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        # (database, probeId) → [다음에 줄 번호, 미리 받은 구간의 끝(포함)]
+        self._blocks = {}
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def reserve(self, database, probe_id, count, connection=None):
+        """
+        count 개의 연속된 GroupIndex 예약 → 첫 번호 반환 (구간: start .. start + count - 1)
+        connection: SQL 객체 (None이면 세션 자격증명으로 get_db_connection)
+        """
+        count = max(int(count), 1)
+        key = (str(database), str(probe_id))
+        with self._key_lock(key):
+            block = self._blocks.get(key)
+            if block is not None and block[1] - block[0] + 1 >= count:
+                start = block[0]
+                block[0] += count
+                return start
+
+            if connection is None:
+                from utils.database_manager import get_db_connection
+
+                connection = get_db_connection(database)
+
+            # 남은 구간으로는 연속 할당이 불가하므로 새 구간 예약 (남은 번호는 버림)
+            size = max(count, _block_size())
+            start = self._reserve_db(connection, key, probe_id, size)
+            self._blocks[key] = [start + count, start + size - 1]
+            return start
+
+    def _reserve_db(self, connection, key, probe_id, size):
+        try:
+            result = connection.execute_output(
+                _RESERVE_QUERY, (probe_id, probe_id, probe_id, size, probe_id)
+            )
+        except Exception as e:
+            if not _is_missing_counter_table(e):
+                raise
+            # 테이블 적용 후에는 다음 예약부터 바로 동작 (결과를 캐시하지 않음)
+            logger.error(f"{COUNTER_TABLE} 테이블 없음 (database={key[0]})")
+            raise CounterTableMissing(
+                f"GroupIndex 예약용 {COUNTER_TABLE} 테이블이 {key[0]} 데이터베이스에 없습니다. "
+                "db/add_group_index_counter_table.sql 을 적용해 주세요."
+            ) from e
+        return int(result["previous"].iloc[0]) + 1
+
+    def discard(self, database=None, probe_id=None):
+        """프로세스 내 미리 받은 구간 폐기 (다음 예약은 DB에서)"""
+        with self._lock:
+            keys = [
+                key
+                for key in self._blocks
+                if (database is None or key[0] == str(database))
+                and (probe_id is None or key[1] == str(probe_id))
+            ]
+            for key in keys:
+                del self._blocks[key]
+        return len(keys)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "block_size": _block_size(),
+                "cached_blocks": {
+                    f"{db}/{probe}": {"next": block[0], "limit": block[1]}
+                    for (db, probe), block in self._blocks.items()
+                },
+            }
+
+
+# 전역 싱글톤 인스턴스
+group_index_allocator = GroupIndexAllocator()
@@ -1,12 +1,31 @@
-from pkg_MeasSetGen.data_inout import loadfile
-from pkg_MeasSetGen.remove_duplicate import RemoveDuplicate
+from pkg_MeasSetGen.data_inout import loadfile, SEQUENCE_COLUMNS, SEQUENCE_DTYPES
+from pkg_MeasSetGen.dedupe_group import DedupeGroupEngine
 from pkg_MeasSetGen.param_gen import ParamGen
 from pkg_MeasSetGen.predictML import PredictML
 from pkg_MeasSetGen.create_groupidx import GroupIdx
 from pkg_MeasSetGen.data_inout import DataOut
+from pkg_MeasSetGen.generation_cache import generation_cache, file_sha256
+from pkg_MeasSetGen.previous_predictions import load_previous_predictions
+from pkg_MeasSetGen.stage_profiler import StageProfiler
+from pkg_MeasSetGen.frame_schema import compact_frame, fill_missing
+import os
 import pandas as pd
 import logging
 
+## generate 단계 (작업 진행률 보고용)
+GENERATION_STAGES = [
+    "cache_lookup",
+    "load",
+    "dedupe",
+    "group_index",
+    "param_gen",
+    "previous_predictions",
+    "predict_intensity",
+    "predict_power",
+    "predict_temperature",
+    "save",
+]
+
 
 class MeasSetGen:
     """
@@ -20,66 +39,200 @@ class MeasSetGen:
         self.probeId = probeId
         self.probeName = probeName
         self.file_path = file_path
+        # 마지막 generate 실행의 단계별 계측 결과 (StageProfiler.summary)
+        self.profile = None
 
         # self.sql = SQL(username, password, self.database)
 
-    def generate(self):
+    def _load_options(self):
+        """
+        시퀀스 파일 로드 옵션 (AOP_config.cfg [MeasSet])
+        - CSV_ENGINE: c / pyarrow
+        - CHUNK_THRESHOLD_MB 이상 파일은 CHUNKSIZE 행 단위 청크 모드로 로드
+        """
+        try:
+            threshold_mb = float(os.environ.get("MEASSET_CHUNK_THRESHOLD_MB", 100))
+            chunksize = int(os.environ.get("MEASSET_CHUNKSIZE", 200000))
+        except ValueError:
+            threshold_mb, chunksize = 100.0, 200000
+        file_mb = os.path.getsize(self.file_path) / (1024 * 1024)
+        return {
+            "usecols": SEQUENCE_COLUMNS,
+            "dtype": SEQUENCE_DTYPES,
+            "engine": os.environ.get("MEASSET_CSV_ENGINE", "c"),
+            "chunksize": chunksize if file_mb >= threshold_mb else None,
+        }
+
+    def _cache_key(self):
+        """생성 결과 캐시 키 (모델 정보를 확인할 수 없으면 None → 캐시 미사용)"""
+        from pkg_MachineLearning.mlflow_integration import AOP_MLflowTracker
+        from pkg_MeasSetGen.Temp_Prr_predict import artifact_fingerprint
+
+        production = AOP_MLflowTracker.get_production_fingerprint()
+        if production is None:
+            return None
+        return generation_cache.make_key(
+            file_sha256(self.file_path),
+            self.database,
+            self.probeId,
+            self.probeName,
+            f"{production}|temperature_artifact:{artifact_fingerprint()}",
+        )
+
+    def _rebase_cached(self, cached_csv, group_idx):
+        """
+        캐시된 결과의 GroupIndex 를 새로 예약한 구간으로 옮겨 결과 파일로 저장
+        캐시 파일은 이미 결과 CSV 형식이므로 GroupIndex 만 바꿔 그대로 저장 (save_excel 미사용)
+        """
+        df = pd.read_csv(cached_csv)
+        if not df.empty:
+            first = int(df["GroupIndex"].min())
+            last_group_idx = group_idx.reserveGroupIdx(int(df["GroupIndex"].max()) - first + 1)
+            df["GroupIndex"] = df["GroupIndex"] - first + last_group_idx + 1
+        return DataOut(
+            case=0, database=self.database, probename=self.probeName, df1=df
+        ).save_result()
+
+    def generate(self, progress=None, use_cache=True, incremental=False):
+        """
+        progress: 선택적 콜백 progress(stage) — 각 단계(GENERATION_STAGES) 시작 시 호출
+        use_cache: 동일 입력(파일/프로브/DB/모델 버전)의 이전 결과 재사용
+        incremental: 증분 재생성 — meas_setting 의 최신 행과 키/모델 입력이 같은 행은
+                     저장된 예측값을 재사용하고 신규/변경 행만 예측 (결과는 캐시에 저장하지 않음)
+                     probe_geo 형상 변경은 판단하지 않으므로 형상 수정 후에는 전체 재생성 사용
+        실행 후 self.profile 에 단계별 계측 결과가 남습니다.
+        """
+        profiler = StageProfiler(progress)
+        status = "failed"
+
         try:
-            # Step 1: 파일 로드
-            raw_data = loadfile(self.file_path)
+            # Step 0: 생성 결과 캐시 확인
+            group_idx = GroupIdx(probeId=self.probeId, database=self.database)
+            with profiler.stage("cache_lookup") as st:
+                cache_key = None
+                cached_csv = None
+                if use_cache and generation_cache.enabled():
+                    cache_key = self._cache_key()
+                    cached_csv = generation_cache.get(cache_key) if cache_key else None
+                st["hit"] = bool(cached_csv)
+                if cached_csv:
+                    result_csv = self._rebase_cached(cached_csv, group_idx)
+            if cached_csv:
+                logging.info(f"MeasSetGen cache hit: {cached_csv}")
+                status = "cache_hit"
+                return result_csv
+
+            # Step 1: 파일 로드 (사용 컬럼만, 축소된 타입으로)
+            with profiler.stage("load") as st:
+                raw_data = loadfile(self.file_path, **self._load_options())
+                profiler.output(st, raw_data)
             if raw_data.empty:
                 raise ValueError(
                     "Loaded file contains no data or is not properly formatted."
                 )
             logging.info("Raw data successfully loaded.")
 
-            # Step 2: 중복 데이터 제거 및 인덱스 생성
-            remove_duplicate = RemoveDuplicate(raw_data)
-            df_total = remove_duplicate.remove_duplicate()
+            # Step 2: 중복 데이터 제거 및 인덱스 생성 (컬럼 단위 단일 패스)
+            engine = DedupeGroupEngine()
+            with profiler.stage("dedupe", rows_in=len(raw_data)) as st:
+                df_total = engine.dedupe(raw_data)
+                profiler.output(st, df_total)
 
-            group_idx = GroupIdx(probeId=self.probeId, database=self.database)
-            df_total = group_idx.createGroupIdx(df_total)
-            selected_df = group_idx.updateDuplicate(df_total)
+            # 그룹 수만큼 GroupIndex 구간을 원자적으로 예약 (동시 생성 작업과 겹치지 않음)
+            with profiler.stage("group_index", rows_in=len(df_total)) as st:
+                engine.last_group_idx = group_idx.reserveGroupIdx(engine.group_count(df_total))
+                # 파이프라인 타입 스키마로 축소 (isDuplicate 등 int8)
+                selected_df = compact_frame(engine.assign_groups(df_total))
+                profiler.output(st, selected_df)
 
             logging.info("Duplicate data processing completed.")
 
             # Step 3: Parameter 생성
-            param_gen = ParamGen(
-                data=selected_df, probeid=self.probeId, probename=self.probeName
-            )
-            gen_df = param_gen.gen_sequence()
+            with profiler.stage("param_gen", rows_in=len(selected_df)) as st:
+                param_gen = ParamGen(
+                    data=selected_df, probeid=self.probeId, probename=self.probeName
+                )
+                # 생성 컬럼(상수 문자열 → category, 인덱스 → int8/int32 등) 축소
+                gen_df = compact_frame(param_gen.gen_sequence())
+                profiler.output(st, gen_df)
             logging.info("Parameter generation completed.")
 
-            # Step 4: 머신러닝 예측
+            # Step 3-1: 증분 재생성 — 이전 예측값 조회
+            with profiler.stage("previous_predictions") as st:
+                previous = None
+                if incremental:
+                    previous = load_previous_predictions(self.database, self.probeId)
+                st["incremental"] = incremental
+                st["found"] = bool(previous is not None and not previous.empty)
+
+            # Step 4: 머신러닝 예측 (증분 재생성 시 신규/변경 행만)
             predictionML = PredictML(
                 df=gen_df,
                 probeId=self.probeId,
                 probeName=self.probeName,
                 database=self.database,
+                previous=previous,
             )
-            gen_df_inten = predictionML.intensity_zt_est()
-            gen_df_power = predictionML.power_PRF_est()
-            gen_df_temp = predictionML.temperature_PRF_est()
+            with profiler.stage("predict_intensity", rows_in=len(gen_df)) as st:
+                gen_df_inten = predictionML.intensity_zt_est()
+                profiler.output(st, gen_df_inten)
+                if previous is not None:
+                    st.update(previous.stats["intensity"])
+            with profiler.stage("predict_power", rows_in=len(gen_df)) as st:
+                gen_df_power = predictionML.power_PRF_est()
+                profiler.output(st, gen_df_power)
+            with profiler.stage("predict_temperature", rows_in=len(gen_df)) as st:
+                gen_df_temp = predictionML.temperature_PRF_est()
+                profiler.output(st, gen_df_temp)
+                if previous is not None:
+                    st.update(previous.stats["temperature"])
 
             df_total = pd.concat(
                 [gen_df_inten, gen_df_power, gen_df_temp], axis=0, ignore_index=True
             )
-            df_total = df_total.fillna(-1)
+            # category 컬럼은 결측이 있을 때만 -1을 category로 추가한 뒤 결측 처리
+            df_total = fill_missing(df_total, -1)
             logging.info("Machine learning predictions completed.")
 
             # Step 5: 데이터 저장
-            dataout = DataOut(
-                case=0,
-                database=self.database,
-                probename=self.probeName,
-                df1=df_total,
-            )
-            dataout.make_dir()
-            csv_data = dataout.save_excel()
+            with profiler.stage("save", rows_in=len(df_total)) as st:
+                dataout = DataOut(
+                    case=0,
+                    database=self.database,
+                    probename=self.probeName,
+                    df1=df_total,
+                )
+                dataout.make_dir()
+                csv_data = dataout.save_excel()
+                profiler.output(st, df_total)
             logging.info(f"Generated file saved as CSV_file.")
 
+            # 증분 결과는 DB에 저장된 예측값에 의존하므로 캐시하지 않음
+            if cache_key and not incremental:
+                try:
+                    generation_cache.put(cache_key, csv_data)
+                except OSError as e:
+                    logging.warning(f"MeasSetGen cache store failed: {e}")
+
+            status = "succeeded"
             return csv_data
 
         except Exception as e:
             logging.error(f"Error during MeasSetGen.generate: {str(e)}", exc_info=True)
             raise RuntimeError(f"Failed to generate MeasSet: {str(e)}")
+
+        finally:
+            profiler.finish(status)
+            self.profile = profiler.summary()
+            profiler.log(
+                database=self.database,
+                probeId=self.probeId,
+                probeName=self.probeName,
+                file_mb=self._file_mb(),
+            )
+
+    def _file_mb(self):
+        try:
+            return round(os.path.getsize(self.file_path) / (1024 * 1024), 3)
+        except OSError:
+            return None
@@ -1,5 +1,124 @@
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
+## (Mode, SubModeIndex) → OrgBeamstyleIdx
+MODE_SUBMODE_MAP = {
+    ("B", 0): 0,
+    ("B", 1): 1,
+    ("B", 2): 1,
+    ("B", 3): 1,
+    ("B", 4): 1,
+    ("Cb", 0): 5,
+    ("Cb", 1): 5,
+    ("Cb", 3): 5,
+    ("D", 0): 10,
+    ("M", 0): 15,
+    ("M", 1): 20,
+    ("Contrast", 4): 4,
+    # ("VTQ")
+}
+
+## 중복(isDuplicate == 1) 행의 OrgBeamstyleIdx → bsIndexTrace
+BS_INDEX_TRACE_MAP = {0: 15, 1: 20, 5: 10}
+
+## SysTxFreqIndex → TxFrequencyHz
+FREQUENCY_TABLE = np.array(
+    [
+        1000000,
+        1111100,
+        1250000,
+        1333300,
+        1428600,
+        1538500,
+        1666700,
+        1818200,
+        2000000,
+        2222200,
+        2500000,
+        2666700,
+        2857100,
+        3076900,
+        3333300,
+        3636400,
+        3809500,
+        4000000,
+        4210500,
+        4444400,
+        4705900,
+        5000000,
+        5333300,
+        5714300,
+        6153800,
+        6666700,
+        7272700,
+        8000000,
+        8888900,
+        10000000,
+        11428600,
+        13333333,
+        16000000,
+        20000000,
+        26666667,
+        11428600,
+        11428600,
+        11428600,
+        11428600,
+        11428600,
+        11428600,
+        11428600,
+        11428600,
+        11428600,
+        11428600,
+        11428600,
+        11428600,
+        11428600,
+        11428600,
+    ],
+    dtype=np.int64,
+)
+
+## TxFocusLocCm 구간 상한 → zMeasNum (마지막 구간은 그 외 전체)
+Z_MEAS_FOCUS_BINS = (3, 6, 9)
+Z_MEAS_NUM_VALUES = ((5 - 0.5) * 10, (8 - 0.5) * 10, (12 - 0.5) * 10, (14 - 0.5) * 10)
+
+
+def calculate_cycle(rle):
+    ## TxPulseRle("a:b:c") → cycle 수 (절대값 1 초과 구간은 1을 뺌)
+    raw_rle = map(float, str(rle).split(":"))
+    calc = [round(value - 1, 4) if value > 1 else value for value in map(abs, raw_rle)]
+    return round(sum(calc), 2)
+
+
+def prof_tx_voltage(maxV, ceilV, totalpt, idx=2):
+    return round((min(maxV, ceilV)) ** ((totalpt - 1 - idx) / (totalpt - 1)), 2)
+
+
+def _map_unique(func, *columns):
+    """
+    고유한 값 조합에만 func를 적용한 뒤 행 단위로 펼침
+    (행별 apply와 동일한 Python 연산 결과를 유지하면서 호출 횟수를 고유값 수로 줄임)
+    """
+    # 컬럼별 factorize 코드를 하나의 정수 키로 합친 뒤 고유 조합 추출
+    combined = np.zeros(len(columns[0]), dtype=np.int64)
+    for column in columns:
+        column_codes, column_uniques = pd.factorize(column, use_na_sentinel=False)
+        combined = combined * len(column_uniques) + column_codes
+        # 조합 코드를 다시 0..k-1 로 압축해 컬럼 수가 늘어도 int64 범위 유지 (dedupe_group._row_codes 와 동일)
+        combined = pd.factorize(combined)[0]
+    _, first_rows, codes = np.unique(combined, return_index=True, return_inverse=True)
+
+    # numpy 스칼라 → Python 스칼라 (행별 apply와 동일한 round/pow 동작)
+    results = [
+        func(*(_to_python(column[row]) for column in columns)) for row in first_rows
+    ]
+    return pd.Series(results).to_numpy()[codes]
+
+
+def _to_python(value):
+    return value.item() if isinstance(value, np.generic) else value
+
 
 class ParamGen:
     def __init__(self, data, probeid, probename):
@@ -19,6 +138,7 @@ class ParamGen:
         self.df["measSetComments"] = f"Beamstyle_{self.probename}_Intensity"
 
     def gen_sequence(self):
+        ## 모든 단계는 컬럼 단위(벡터) 연산으로 처리
         self.numvoltpt()
         self.findOrgIdx()
         self.bsIdx()
@@ -38,122 +158,62 @@ class ParamGen:
         return self.df
 
     def findOrgIdx(self):
-        ## find freq index
-
-        mode_submode_map = {
-            ("B", 0): 0,
-            ("B", 1): 1,
-            ("B", 2): 1,
-            ("B", 3): 1,
-            ("B", 4): 1,
-            ("Cb", 0): 5,
-            ("Cb", 1): 5,
-            ("Cb", 3): 5,
-            ("D", 0): 10,
-            ("M", 0): 15,
-            ("M", 1): 20,
-            ("Contrast", 4): 4,
-            # ("VTQ")
-        }
-
-        self.df["OrgBeamstyleIdx"] = self.df.apply(
-            lambda row: mode_submode_map.get((row["Mode"], row["SubModeIndex"]), -1),
-            axis=1,
-        )
+        ## find freq index: Mode 별 비교 마스크를 한 번씩만 만들고 np.select로 조회
+
+        mode = self.df["Mode"].to_numpy()
+        submode = self.df["SubModeIndex"].to_numpy()
+
+        mode_masks = {}
+        conditions = []
+        choices = []
+        for (mode_name, submode_idx), org_idx in MODE_SUBMODE_MAP.items():
+            if mode_name not in mode_masks:
+                mode_masks[mode_name] = mode == mode_name
+            conditions.append(mode_masks[mode_name] & (submode == submode_idx))
+            choices.append(org_idx)
+
+        self.df["OrgBeamstyleIdx"] = np.select(conditions, choices, default=-1).astype(np.int64)
         return self.df
 
     def bsIdx(self):
         ## bsIndexTrace algorithm
 
-        def bsIndex(orgidx, duplicate):
-            if duplicate == 1:
-                return {0: 15, 1: 20, 5: 10}.get(orgidx, 0)
-            return 0
+        org_idx = self.df["OrgBeamstyleIdx"].to_numpy()
+        trace = np.zeros(len(self.df), dtype=np.int64)
+        for idx, value in BS_INDEX_TRACE_MAP.items():
+            trace[org_idx == idx] = value
 
-        self.df["bsIndexTrace"] = self.df.apply(
-            lambda row: bsIndex(row["OrgBeamstyleIdx"], row["isDuplicate"]), axis=1
-        )
+        self.df["bsIndexTrace"] = np.where(self.df["isDuplicate"].to_numpy() == 1, trace, 0)
         return self.df
 
     def freqidx2Hz(self):
-        ## FrequencyIndex to FrequencyHz
-
-        frequencyTable = [
-            1000000,
-            1111100,
-            1250000,
-            1333300,
-            1428600,
-            1538500,
-            1666700,
-            1818200,
-            2000000,
-            2222200,
-            2500000,
-            2666700,
-            2857100,
-            3076900,
-            3333300,
-            3636400,
-            3809500,
-            4000000,
-            4210500,
-            4444400,
-            4705900,
-            5000000,
-            5333300,
-            5714300,
-            6153800,
-            6666700,
-            7272700,
-            8000000,
-            8888900,
-            10000000,
-            11428600,
-            13333333,
-            16000000,
-            20000000,
-            26666667,
-            11428600,
-            11428600,
-            11428600,
-            11428600,
-            11428600,
-            11428600,
-            11428600,
-            11428600,
-            11428600,
-            11428600,
-            11428600,
-            11428600,
-            11428600,
-            11428600,
-        ]
-
-        self.df["TxFrequencyHz"] = self.df["SysTxFreqIndex"].apply(
-            lambda i: frequencyTable[i]
-        )
+        ## FrequencyIndex to FrequencyHz (index 배열로 테이블 조회)
+
+        freq_idx = self.df["SysTxFreqIndex"]
+        if freq_idx.dtype.kind in "iu":
+            self.df["TxFrequencyHz"] = FREQUENCY_TABLE[freq_idx.to_numpy()]
+        else:
+            # 정수형이 아닌 경우 기존과 동일하게 list 인덱싱 (잘못된 값은 그대로 예외)
+            table = FREQUENCY_TABLE.tolist()
+            self.df["TxFrequencyHz"] = freq_idx.apply(lambda i: table[i])
         return self.df
 
     def cnt_cycle(self):
-        ## Calc_cycle for RLE code
-
-        def calculate_cycle(waveform, rle, cycle):
-            if waveform == 0:
-                raw_rle = map(float, str(rle).split(":"))
-                calc = [
-                    round(value - 1, 4) if value > 1 else value
-                    for value in map(abs, raw_rle)
-                ]
-                return round(sum(calc), 2)
-            return cycle
-
-        self.df["ProbeNumTxCycles"] = self.df.apply(
-            lambda row: calculate_cycle(
-                row["TxpgWaveformStyle"], row["TxPulseRle"], row["ProbeNumTxCycles"]
-            ),
-            axis=1,
-        )
+        ## Calc_cycle for RLE code: 고유 TxPulseRle 문자열만 파싱
+
+        mask = (self.df["TxpgWaveformStyle"] == 0).to_numpy()
+        if not mask.any():
+            return self.df
+
+        cycles = self.df["ProbeNumTxCycles"]
+        parsed = _map_unique(calculate_cycle, self.df["TxPulseRle"].to_numpy()[mask])
+
+        if mask.all():
+            result = parsed.astype(np.float64)
+        else:
+            result = cycles.to_numpy().astype(np.float64)
+            result[mask] = parsed
+        self.df["ProbeNumTxCycles"] = result
         return self.df
 
     def maxVolt_ceilVolt(self):
@@ -168,31 +228,22 @@ class ParamGen:
         return self.df
 
     def calc_profvolt(self):
-        ## function: calc_profTxVoltage 구현
-
-        def prof_tx_voltage(maxV, ceilV, totalpt, idx=2):
-            return round((min(maxV, ceilV)) ** ((totalpt - 1 - idx) / (totalpt - 1)), 2)
-
-        self.df["profTxVoltageVolt"] = self.df.apply(
-            lambda row: prof_tx_voltage(
-                row["maxTxVoltageVolt"], row["ceilTxVoltageVolt"], row["totalVoltagePt"]
-            ),
-            axis=1,
-        )
+        ## function: calc_profTxVoltage 구현 (고유 전압 조합만 계산)
+
+        self.df["profTxVoltageVolt"] = _map_unique(
+            prof_tx_voltage,
+            self.df["maxTxVoltageVolt"].to_numpy(),
+            self.df["ceilTxVoltageVolt"].to_numpy(),
+            self.df["totalVoltagePt"].to_numpy(),
+        ).astype(np.float64)
         return self.df
 
     def zMeasNum(self):
-        ## function: calc zMeasNum 구현
-
-        def z_meas_num(focus):
-            if focus <= 3:
-                return (5 - 0.5) * 10
-            elif focus <= 6:
-                return (8 - 0.5) * 10
-            elif focus <= 9:
-                return (12 - 0.5) * 10
-            else:
-                return (14 - 0.5) * 10
-
-        self.df["zMeasNum"] = self.df["TxFocusLocCm"].apply(z_meas_num)
+        ## function: calc zMeasNum 구현 (focus 구간별 np.select)
+
+        focus = self.df["TxFocusLocCm"].to_numpy()
+        conditions = [focus <= upper for upper in Z_MEAS_FOCUS_BINS]
+        self.df["zMeasNum"] = np.select(
+            conditions, Z_MEAS_NUM_VALUES[:-1], default=Z_MEAS_NUM_VALUES[-1]
+        )
         return self.df
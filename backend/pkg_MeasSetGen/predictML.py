@@ -4,8 +4,8 @@ import numpy as np
 import time
 from flask import session
 from pkg_MachineLearning.mlflow_integration import AOP_MLflowTracker
-from utils.database_manager import get_db_connection
 from pkg_MeasSetGen.Temp_Prr_predict import find_prr_for_temprise
+from pkg_MeasSetGen.probe_geometry import probe_geometry_repository
 
 logger = logging.getLogger("PredictML")
 
@@ -21,11 +21,13 @@ class PredictML:
     3) Power case: find to set-up PRF for preventing of transducer damage
     """
 
-    def __init__(self, df, probeId, probeName, database):
+    def __init__(self, df, probeId, probeName, database, previous=None):
         self.df = df
         self.probeId = probeId
         self.probeName = probeName
         self.database = database
+        # 증분 재생성: 이전 예측값 (PreviousPredictions) — 재사용 가능한 행은 예측 생략
+        self.previous = previous
 
         self.username = session.get("username")
         self.password = session.get("password")
@@ -33,6 +35,15 @@ class PredictML:
         if not self.username or not self.password:
             raise ValueError("User not authenticated")
 
+        self._geometry = None
+
+    @property
+    def geometry(self):
+        """probe_geo 형상 (생성 1회당 한 번 조회, 요청 간 TTL 캐시 공유)"""
+        if self._geometry is None:
+            self._geometry = probe_geometry_repository.get(self.database, self.probeId)
+        return self._geometry
+
     def _paramForIntensity(self):
         ## take parameters for ML from measSet_gen file.
         estParams = self.df[
@@ -47,29 +58,18 @@ class PredictML:
             ]
         ].copy()
 
-        ## load parameters from SQL database
-        connect = get_db_connection(self.database)
-        query = """
-            SELECT [probePitchCm], [probeRadiusCm], [probeElevAperCm0], [probeElevAperCm1], [probeElevFocusRangCm], [probeElevFocusRangCm1]
-            FROM probe_geo 
-            WHERE probeid = ?
-            ORDER BY 1
-            """
-
-        probeGeo_df = connect.execute_query(query, (self.probeId,))
-        probeGeo_df = probeGeo_df.fillna(0).infer_objects()
-
-        if len(probeGeo_df) == 1:
-            probeGeo_df = pd.concat([probeGeo_df] * len(estParams), ignore_index=True)
-
-        # Assigning est_geo columns to est_params, broadcasting if necessary
+        ## probe 형상 컬럼 broadcast (행 복제 없이 컬럼 단위로 채움)
         estParams = estParams.assign(
-            probePitchCm=probeGeo_df["probePitchCm"].values,
-            probeRadiusCm=probeGeo_df["probeRadiusCm"].values,
-            probeElevAperCm0=probeGeo_df["probeElevAperCm0"].values,
-            probeElevAperCm1=probeGeo_df["probeElevAperCm1"].values,
-            probeElevFocusRangCm=probeGeo_df["probeElevFocusRangCm"].values,
-            probeElevFocusRangCm1=probeGeo_df["probeElevFocusRangCm1"].values,
+            **self.geometry.broadcast(
+                [
+                    "probePitchCm",
+                    "probeRadiusCm",
+                    "probeElevAperCm0",
+                    "probeElevAperCm1",
+                    "probeElevFocusRangCm",
+                    "probeElevFocusRangCm1",
+                ]
+            )
         )
 
         # # Check the final DataFrame before saving to CSV
@@ -80,6 +80,12 @@ class PredictML:
         # print("CSV file saved as measSetGen_df.csv")
         return estParams
 
+    def _reused(self, kind, df):
+        """이전 예측값 중 재사용 가능한 값 (없으면 NaN)"""
+        if self.previous is None:
+            return np.full(len(df), np.nan)
+        return self.previous.lookup(kind, df)
+
     def _paramForTemperature(self):
         ## take parameters for ML from measSet_gen file.
 
@@ -119,30 +125,15 @@ class PredictML:
             }
         )
 
-        ## load parameters from SQL database
-        connect = get_db_connection(self.database)
-        query = """
-            SELECT [probePitchCm], [probeRadiusCm], [probeElevAperCm0], [probeNumElements]            
-            FROM probe_geo 
-            WHERE probeid = ?
-            ORDER BY 1
-            """
-
-        probeGeo_df = connect.execute_query(query, (self.probeId,))
-        probeGeo_df = probeGeo_df.fillna(0).infer_objects()
-
-        if len(probeGeo_df) == 1:
-            probeGeo_df = pd.concat([probeGeo_df] * len(estParams), ignore_index=True)
-
-        probePitch = probeGeo_df["probePitchCm"].iloc[0]
-        probeNumElements = probeGeo_df["probeNumElements"].iloc[0]
+        ## probe 형상 (결측은 0으로 채운 값 사용)
+        geometry = self.geometry
+        probePitch = geometry.first("probePitchCm")
+        probeNumElements = geometry.first("probeNumElements")
         fullScanRange = probePitch * probeNumElements
 
-        # Assigning est_geo columns to est_params, broadcasting if necessary
+        # 형상 컬럼 broadcast (행 복제 없이 컬럼 단위로 채움)
         estParams = estParams.assign(
-            probePitchCm=probeGeo_df["probePitchCm"].values,
-            probeRadiusCm=probeGeo_df["probeRadiusCm"].values,
-            probeElevAperCm0=probeGeo_df["probeElevAperCm0"].values,
+            **geometry.broadcast(["probePitchCm", "probeRadiusCm", "probeElevAperCm0"])
         )
 
         # Create two copies: one with fullScanRange, one with 0
@@ -169,6 +160,15 @@ class PredictML:
 
         estParams = self._paramForIntensity()
 
+        # 증분 재생성: 이전 예측값이 있는 행은 예측 생략
+        reused = self._reused("intensity", self.df)
+        predict_rows = np.flatnonzero(np.isnan(reused))
+        if len(predict_rows) < len(estParams):
+            if len(predict_rows) == 0:
+                self.df["AI_param"] = pd.Series(reused, index=self.df.index).round(1)
+                return self.df
+            estParams = estParams.iloc[predict_rows]
+
         # Load model from database using MLflow integration
         mlflow_tracker = AOP_MLflowTracker()
 
@@ -177,7 +177,9 @@ class PredictML:
 
         if model_info is None:
             # 대안: 클래스 메서드로 로깅하고 기본값 사용
-            self.df["AI_param"] = pd.Series([5.0] * len(self.df), name="AI_param")
+            self.df["AI_param"] = pd.Series(
+                np.where(np.isnan(reused), 5.0, reused), index=self.df.index, name="AI_param"
+            )
             try:
                 AOP_MLflowTracker.log_simple_prediction(
                     input_features={"fallback": "no_model_found"},
@@ -217,8 +219,13 @@ class PredictML:
         except Exception as e:
             logger.debug(f"MLflow prediction logging skipped: {e}")
 
+        # 재사용한 행과 예측한 행 결합
+        if len(predict_rows) < len(self.df):
+            reused[predict_rows] = zt_est
+            zt_est = reused
+
         # AI_param을 Series로 변환하고 이름을 지정
-        self.df["AI_param"] = pd.Series(zt_est, name="AI_param")
+        self.df["AI_param"] = pd.Series(zt_est, index=self.df.index, name="AI_param")
 
         # 반올림 적용
         self.df["AI_param"] = self.df["AI_param"].round(1)
@@ -228,17 +235,10 @@ class PredictML:
     def power_PRF_est(self):
         ## predict PRF by ML model.
 
-        ## load parameters from SQL database for transducer pitch
-        connect = get_db_connection(self.database)
-        query = """
-            SELECT [probePitchCm]
-            FROM probe_geo 
-            WHERE probeid = ?
-            ORDER BY 1
-            """
-
-        pitchCm_df = connect.execute_query(query, (self.probeId,))
-        oneCmElement = np.ceil(1 / pitchCm_df["probePitchCm"].iloc[0])
+        ## transducer pitch (probe_geo 원본 값)
+        geometry = self.geometry
+        probePitchCm = geometry.first("probePitchCm", filled=False)
+        oneCmElement = np.ceil(1 / probePitchCm)
 
         # 각 GroupIndex 내에서 최대 TxFocusLocCm 값을 찾기
         max_values = self.df.groupby("GroupIndex")["TxFocusLocCm"].transform("max")
@@ -262,9 +262,7 @@ class PredictML:
 
             input_features = {
                 "probePitch": (
-                    float(pitchCm_df["probePitchCm"].iloc[0])
-                    if not pitchCm_df.empty
-                    else None
+                    float(probePitchCm) if not geometry.empty else None
                 ),
                 "maxTxFocusLoc": (
                     float(max_values.max()) if len(max_values) > 0 else None
@@ -288,9 +286,40 @@ class PredictML:
 
         return power_df
 
+    def _predict_prr(self, estParams, target_tr, reused=None):
+        """
+        행별 목표 온도 상승 PRR 예측 (find_prr_for_temprise_batch)
+        reused: 이전 예측값 (NaN이 아닌 행은 예측 생략)
+        """
+        from pkg_MeasSetGen.Temp_Prr_predict import find_prr_for_temprise_batch
+
+        ai_params = np.full(len(estParams), np.nan)
+        predict_rows = (
+            np.arange(len(estParams)) if reused is None else np.flatnonzero(np.isnan(reused))
+        )
+        if reused is not None:
+            ai_params[:] = reused
+
+        # iterrows 대신 to_dict('records')로 변환 (100x+ 빠름)
+        records = estParams.to_dict("records")
+        user_inputs = []
+        for row in predict_rows:
+            user_input = records[row]
+            # ML 모델 입력에서 제외할 컬럼 제거
+            user_input.pop("GroupIndex", None)
+            user_input["pulseVoltage"] = user_input.get("profTxVoltageVolt", 0)
+            user_inputs.append(user_input)
+
+        # 배치로 한 번에 처리
+        if user_inputs:
+            results = find_prr_for_temprise_batch(user_inputs, target_tr=target_tr)
+            ai_params[predict_rows] = [
+                np.nan if res["best_prr"] is None else res["best_prr"] for res in results
+            ]
+        return ai_params
+
     def temperature_PRF_est(self, target_tr: float = 15.0):
         ## predict PRF by ML model.
-        from pkg_MeasSetGen.Temp_Prr_predict import find_prr_for_temprise_batch
 
         estParams = self._paramForTemperature()
         estParams["pulseRepetRate"] = 0  # 초기값 설정
@@ -304,30 +333,18 @@ class PredictML:
             if c in estParams.columns:
                 estParams[c] = estParams[c].fillna(0).astype(int)
 
-        # iterrows 대신 to_dict('records')로 변환 (100x+ 빠름)
-        user_inputs = []
-        used_voltages = []
-
-        for user_input in estParams.to_dict("records"):
-            # ML 모델 입력에서 제외할 컬럼 제거
-            user_input.pop("GroupIndex", None)
-
-            V = user_input.get("profTxVoltageVolt", 0)
-            user_input["pulseVoltage"] = V
-            used_voltages.append(V)
-            user_inputs.append(user_input)
-
-        # 배치로 한 번에 처리
-        results = find_prr_for_temprise_batch(user_inputs, target_tr=target_tr)
-        ai_params = [res["best_prr"] for res in results]
-
-        # estParams에 결과 할당 (self.temp_df가 아닌)
-        estParams["AI_param"] = ai_params
-
         # scanRange 기준으로 DataFrame 분리
         estParams_full = estParams[estParams["scanRange"] > 0].copy()
         estParams_zero = estParams[estParams["scanRange"] == 0].copy()
 
+        # zero 행 예측 (증분 재생성: 이전 예측값이 있는 행은 예측 생략)
+        estParams_zero["AI_param"] = self._predict_prr(
+            estParams_zero, target_tr, reused=self._reused("temperature", self.temp_df)
+        )
+        # 재사용 값은 저장 시 소수 둘째 자리로 반올림되어 있으므로 새 예측값도 같이 반올림한 뒤
+        # 아래 대표 행(idxmax)을 선택 (증분/전체 재생성의 선택 결과가 같도록)
+        estParams_zero["AI_param"] = estParams_zero["AI_param"].round(2)
+
         result_df = self.temp_df.copy()
         result_df["AI_param"] = estParams_zero["AI_param"].values
         result_df["AI_param"] = result_df["AI_param"].round(2)
@@ -346,12 +363,14 @@ class PredictML:
         )["AI_param"].idxmax()
 
         # Step 2: 선택된 zero 행의 GroupIndex로 paired full 행 찾기
+        #   full(scanRange) 예측은 선택된 그룹에만 필요하므로 해당 행만 예측
         selected_group_indices = estParams_zero.loc[selected_zero_idx][
             "GroupIndex"
         ].values
         selected_full = estParams_full[
             estParams_full["GroupIndex"].isin(selected_group_indices)
         ].sort_values("GroupIndex")
+        selected_full["AI_param"] = self._predict_prr(selected_full, target_tr)
 
         # Step 3: self.temp_df에서 동일 GroupIndex의 원본 행 가져오기
         full_result_rows = (
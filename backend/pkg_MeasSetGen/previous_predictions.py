@@ -0,0 +1,142 @@
+"""
+증분 재생성용 이전 예측값 조회
+- 프로브의 meas_setting 에서 키별 최신 Intensity / temperature 행의 AI_param 조회
+- 키 = RemoveDuplicate 중복 판단 컬럼 (meas_setting 에는 SysTxFreqIndex 대신 TxFrequencyHz 저장)
+- temperature 는 키 외의 모델 입력(profTxVoltageVolt, VTxIndex)까지 같아야 재사용
+  → 키가 없으면 신규, 키는 같고 입력이 다르면 변경으로 보고 다시 예측
+
+모델이 바뀐 뒤에는 저장된 예측값이 현재 모델과 다를 수 있으므로 전체 재생성을 사용합니다.
+프로브 형상(probe_geo)도 모델 입력이지만 meas_setting 에 저장되지 않아 재사용 판단에 포함할 수 없습니다.
+→ probe_geo 를 수정한 프로브는 전체 재생성을 사용해야 합니다 (증분 재생성은 이전 형상 기준 예측값을 재사용).
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+
+from pkg_SQL.compiled_query import compile_query
+from pkg_MeasSetGen.dedupe_group import DEDUPE_COLUMNS
+
+logger = logging.getLogger("PreviousPredictions")
+
+## 비교 키 (생성 DataFrame 컬럼명 기준)
+KEY_COLUMNS = [
+    "TxFrequencyHz" if column == "SysTxFreqIndex" else column for column in DEDUPE_COLUMNS
+]
+
+## 예측 종류 → (measSetComments 접미어, 재사용 판단 컬럼)
+PREDICTION_KINDS = {
+    "intensity": ("_Intensity", KEY_COLUMNS),
+    "temperature": ("_temperature", KEY_COLUMNS + ["profTxVoltageVolt", "VTxIndex"]),
+}
+
+## meas_setting 컬럼 → 생성 DataFrame 컬럼 (DataOut renameColumns 의 역방향)
+_STORED_COLUMNS = {
+    "TxFrequencyHz": "TxFrequencyHz",
+    "TxpgWaveformStyle": "TxpgWaveformStyle",
+    "numTxCycles": "ProbeNumTxCycles",
+    "IsTxAperModulationEn": "IsTxChannelModulationEn",
+    "IsCPAEn": "IsPresetCpaEn",
+    "ElevAperIndex": "ElevAperIndex",
+    "focusRangeCm": "TxFocusLocCm",
+    "NumTxElements": "NumTxElements",
+    "profTxVoltageVolt": "profTxVoltageVolt",
+    "VTxIndex": "VTxIndex",
+}
+
+_SELECT_COLUMNS = ", ".join(
+    f"[{stored}] AS [{generated}]" for stored, generated in _STORED_COLUMNS.items()
+)
+_PARTITION_COLUMNS = ", ".join(f"[{stored}]" for stored in _STORED_COLUMNS)
+
+# 결측 예측값(-1)은 재사용하지 않음 / 같은 키는 최신(measSetId 최대) 행만
+_PREVIOUS_QUERY = compile_query(
+    f"""
+    SELECT measSetId, measSetComments, {_SELECT_COLUMNS}, AI_param
+    FROM (
+        SELECT *, ROW_NUMBER() OVER (
+            PARTITION BY measSetComments, {_PARTITION_COLUMNS}
+            ORDER BY measSetId DESC
+        ) AS RankNo
+        FROM meas_setting
+        WHERE probeid = ?
+          AND (measSetComments LIKE '%[_]Intensity' OR measSetComments LIKE '%[_]temperature')
+          AND AI_param IS NOT NULL AND AI_param <> -1
+    ) T
+    WHERE RankNo = 1
+    ORDER BY measSetId DESC
+    """
+)
+
+
+def _normalize(df, columns):
+    """비교용 키 값 (저장 시 fillna(-1) 과 동일하게 결측은 -1, 부동소수 오차는 반올림)"""
+    return pd.DataFrame(
+        {
+            column: pd.to_numeric(df[column], errors="coerce")
+            .astype("float64")
+            .fillna(-1)
+            .round(6)
+            .to_numpy()
+            for column in columns
+        }
+    )
+
+
+class PreviousPredictions:
+    """프로브의 이전 예측값 (종류별 비교 키 → AI_param)"""
+
+    def __init__(self, rows=None):
+        self._frames = {}
+        self.stats = {kind: {"reused": 0, "predicted": 0} for kind in PREDICTION_KINDS}
+
+        if rows is None or rows.empty:
+            return
+        comments = rows["measSetComments"].astype(str)
+        for kind, (suffix, columns) in PREDICTION_KINDS.items():
+            kind_rows = rows[comments.str.endswith(suffix).to_numpy()]
+            if kind_rows.empty:
+                continue
+            frame = _normalize(kind_rows, columns)
+            frame["AI_param"] = pd.to_numeric(kind_rows["AI_param"], errors="coerce").to_numpy()
+            # 조회 결과는 최신순 → 같은 키는 가장 최근 예측값 사용
+            self._frames[kind] = frame.dropna(subset=["AI_param"]).drop_duplicates(
+                subset=columns, keep="first"
+            )
+
+    @property
+    def empty(self):
+        return not self._frames
+
+    def lookup(self, kind, df):
+        """
+        df 각 행의 재사용 가능한 AI_param (없으면 NaN) — 행 순서 유지
+        """
+        reused = np.full(len(df), np.nan)
+        frame = self._frames.get(kind)
+        if frame is not None and len(df):
+            columns = PREDICTION_KINDS[kind][1]
+            merged = _normalize(df, columns).merge(frame, on=columns, how="left", sort=False)
+            reused = merged["AI_param"].to_numpy(dtype="float64")
+
+        hit = int(np.count_nonzero(~np.isnan(reused)))
+        self.stats[kind]["reused"] += hit
+        self.stats[kind]["predicted"] += len(df) - hit
+        return reused
+
+
+def load_previous_predictions(database, probe_id, connection=None):
+    """
+    프로브의 이전 예측값 조회 (조회 실패 시 빈 객체 → 전체 예측)
+    connection: SQL 객체 (None이면 세션 자격증명으로 get_db_connection)
+    """
+    try:
+        if connection is None:
+            from utils.database_manager import get_db_connection
+
+            connection = get_db_connection(database)
+        rows = connection.execute_query(_PREVIOUS_QUERY, (probe_id,))
+    except Exception as e:
+        logger.warning(f"이전 예측값 조회 실패, 전체 예측으로 진행 (probeId={probe_id}): {e}")
+        rows = None
+    return PreviousPredictions(rows)
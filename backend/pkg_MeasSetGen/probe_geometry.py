@@ -0,0 +1,138 @@
+"""
+프로브 형상(probe_geo) 조회 객체 및 요청 간 공유 캐시
+- 생성 1회당 probe_geo 조회 1회 (기존: 예측 타입별 3회)
+- (database, probeId) 단위 TTL 캐시: MEASSET_GEOMETRY_TTL 초 (기본 300, 0이면 비활성)
+- 단일 행 형상은 스칼라로 broadcast 하여 행 수만큼 DataFrame을 복제하지 않음
+"""
+
+import os
+import time
+import threading
+import logging
+
+from pkg_SQL.compiled_query import compile_query
+
+logger = logging.getLogger("ProbeGeometry")
+
+GEOMETRY_COLUMNS = [
+    "probePitchCm",
+    "probeRadiusCm",
+    "probeElevAperCm0",
+    "probeElevAperCm1",
+    "probeElevFocusRangCm",
+    "probeElevFocusRangCm1",
+    "probeNumElements",
+]
+
+_GEOMETRY_QUERY = compile_query(
+    f"""
+    SELECT {", ".join(f"[{c}]" for c in GEOMETRY_COLUMNS)}
+    FROM probe_geo
+    WHERE probeid = ?
+    ORDER BY 1
+    """
+)
+
+
+class ProbeGeometry:
+    """단일 프로브의 probe_geo 조회 결과"""
+
+    def __init__(self, database, probe_id, rows):
+        self.database = database
+        self.probe_id = probe_id
+        self.rows = rows  # 원본 조회 결과 (결측 유지)
+        self._filled = None
+
+    @property
+    def empty(self):
+        return self.rows.empty
+
+    @property
+    def filled(self):
+        """결측을 0으로 채운 형상 (ML 입력용)"""
+        if self._filled is None:
+            self._filled = self.rows.fillna(0).infer_objects()
+        return self._filled
+
+    def first(self, column, filled=True):
+        """첫 행의 값"""
+        frame = self.filled if filled else self.rows
+        return frame[column].iloc[0]
+
+    def broadcast(self, columns):
+        """
+        feature 행렬에 assign 할 컬럼 값 dict
+        - 단일 행: 스칼라 (assign 시 pandas가 컬럼 단위로 채움, 행 복제 없음)
+        - 여러 행: 기존과 동일하게 값 배열 그대로 (행 수가 다르면 assign에서 오류)
+        """
+        frame = self.filled
+        if frame.empty:
+            raise ValueError(
+                f"probe_geo 정보가 없습니다 (probeId={self.probe_id}, database={self.database})"
+            )
+        if len(frame) == 1:
+            return {column: frame[column].iloc[0] for column in columns}
+        return {column: frame[column].values for column in columns}
+
+
+class ProbeGeometryRepository:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @staticmethod
+    def ttl():
+        try:
+            return int(os.environ.get("MEASSET_GEOMETRY_TTL", 300))
+        except ValueError:
+            return 300
+
+    def get(self, database, probe_id, connection=None):
+        """
+        캐시된 형상 반환 (없거나 만료 시 DB 조회)
+        connection: SQL 객체 (None이면 세션 자격증명으로 get_db_connection)
+        """
+        key = (str(database), str(probe_id))
+        ttl = self.ttl()
+        now = time.monotonic()
+        if ttl > 0:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None and now - entry[1] < ttl:
+                return entry[0]
+
+        if connection is None:
+            from utils.database_manager import get_db_connection
+
+            connection = get_db_connection(database)
+        rows = connection.execute_query(_GEOMETRY_QUERY, (probe_id,))
+        geometry = ProbeGeometry(database, probe_id, rows)
+
+        if ttl > 0:
+            with self._lock:
+                self._entries[key] = (geometry, now)
+        return geometry
+
+    def prime(self, geometries):
+        """미리 조회한 형상을 캐시에 등록 (일괄 생성 워커 프로세스 공유용)"""
+        now = time.monotonic()
+        with self._lock:
+            for geometry in geometries:
+                key = (str(geometry.database), str(geometry.probe_id))
+                self._entries[key] = (geometry, now)
+
+    def invalidate(self, database=None, probe_id=None):
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if (database is None or key[0] == str(database))
+                and (probe_id is None or key[1] == str(probe_id))
+            ]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+
+# 전역 싱글톤 인스턴스
+probe_geometry_repository = ProbeGeometryRepository()
@@ -0,0 +1,126 @@
+"""
+MeasSetGen.generate 단계별 계측
+- 단계마다 wall time, CPU time, 메모리 피크 증가량, 입력/출력 행 수 기록
+- 메모리 측정 시 단계 출력 DataFrame 의 메모리 사용량(frame_mb, 타입 스키마 효과 확인용)도 기록
+- 실행이 끝나면 "MeasSetProfile" 로거에 JSON 한 줄로 기록
+
+CPU time은 프로세스 기준(time.process_time)이므로 XGBoost/pandas 내부 스레드를 포함하며,
+동시에 실행 중인 다른 작업이 있으면 함께 합산됩니다.
+메모리 피크는 tracemalloc 기반으로 오버헤드가 있어 MEASSET_PROFILE_MEMORY=true 일 때만 측정합니다.
+tracemalloc 은 프로세스 전역이므로 메모리 측정 실행은 모듈 락으로 한 번에 하나씩만 진행되며
+(다른 측정 실행은 첫 단계에서 대기), 피크에는 같은 시간에 다른 스레드가 할당한 메모리도 포함됩니다.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+profile_logger = logging.getLogger("MeasSetProfile")
+
+# tracemalloc 시작/reset_peak/중지를 한 실행만 하도록 (동시 작업끼리 피크 초기화/중지 방지)
+_tracing_lock = threading.Lock()
+
+
+def memory_profiling_enabled():
+    return os.environ.get("MEASSET_PROFILE_MEMORY", "false").lower() == "true"
+
+
+class StageProfiler:
+    """
+    사용 예:
+        profiler = StageProfiler(progress)
+        with profiler.stage("load") as st:
+            df = loadfile(...)
+            profiler.output(st, df)   # rows_out (+ 메모리 측정 시 frame_mb)
+        profiler.log(probeId=...)
+    """
+
+    def __init__(self, progress=None, trace_memory=None):
+        self.progress = progress
+        self.trace_memory = memory_profiling_enabled() if trace_memory is None else trace_memory
+        self.records = []
+        self.status = "running"
+        self._started = time.perf_counter()
+        self._holds_lock = False
+        self._owns_tracing = False
+
+    def _begin_tracing(self):
+        """첫 측정 단계에서 락 획득 후 tracemalloc 시작 (이미 실행 중이면 그대로 사용)"""
+        if self._holds_lock:
+            return
+        _tracing_lock.acquire()
+        self._holds_lock = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+
+    @contextmanager
+    def stage(self, name, rows_in=None):
+        """단계 계측 (진입 시 progress(name) 호출). yield 된 dict에 rows_out 등을 기록"""
+        if self.progress is not None:
+            self.progress(name)
+
+        if self.trace_memory:
+            self._begin_tracing()
+            tracemalloc.reset_peak()
+            mem_start = tracemalloc.get_traced_memory()[0]
+
+        record = {
+            "stage": name,
+            "status": "running",
+            "wall_s": None,
+            "cpu_s": None,
+            "peak_mem_mb": None,
+            "rows_in": rows_in,
+            "rows_out": None,
+            "frame_mb": None,
+        }
+        self.records.append(record)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+            record["status"] = "done"
+        except BaseException:
+            record["status"] = "failed"
+            raise
+        finally:
+            record["wall_s"] = round(time.perf_counter() - wall_start, 4)
+            record["cpu_s"] = round(time.process_time() - cpu_start, 4)
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                record["peak_mem_mb"] = round(max(peak - mem_start, 0) / (1024 * 1024), 2)
+
+    def output(self, record, df):
+        """단계 출력 DataFrame 기록: 행 수, 메모리 측정 시 DataFrame 메모리 사용량"""
+        record["rows_out"] = len(df)
+        if self.trace_memory:
+            from pkg_MeasSetGen.frame_schema import frame_memory_mb
+
+            record["frame_mb"] = frame_memory_mb(df)
+
+    def finish(self, status):
+        self.status = status
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        if self._holds_lock:
+            self._holds_lock = False
+            _tracing_lock.release()
+
+    def summary(self):
+        return {
+            "status": self.status,
+            "total_wall_s": round(time.perf_counter() - self._started, 4),
+            "memory_traced": self.trace_memory,
+            "stages": [dict(record) for record in self.records],
+        }
+
+    def log(self, **context):
+        """구조화 로그 기록 (JSON 한 줄)"""
+        payload = {"event": "measset_generate_profile", **context, **self.summary()}
+        profile_logger.info(json.dumps(payload, ensure_ascii=False, default=str))
@@ -0,0 +1,96 @@
+"""
+컴파일된 쿼리 객체 및 모듈 전역 레지스트리
+SQL 문 분류(SELECT/DML, INSERT, OUTPUT 절)를 한 번만 수행하고,
+파라미터 슬롯별 변환 함수(numpy 스칼라 → Python, bytes 유지)를 캐싱합니다.
+"""
+
+import threading
+from collections import OrderedDict
+
+# 레지스트리 최대 항목 수 (동적 WHERE 절 등으로 쿼리 문자열이 무한히 늘어나는 것 방지)
+MAX_REGISTRY_SIZE = 512
+
+
+def _identity(value):
+    return value
+
+
+def _numpy_item(value):
+    return value.item()
+
+
+def _converter_for(value_type):
+    """값 타입에 맞는 변환 함수 선택 (바이너리 데이터는 유지)"""
+    if issubclass(value_type, (bytes, bytearray, memoryview)):
+        return _identity
+    if hasattr(value_type, "item"):  # numpy 타입
+        return _numpy_item
+    return _identity
+
+
+class CompiledQuery:
+    """
+    분류 결과와 파라미터 변환 함수를 보관하는 쿼리 객체
+    - is_select: SELECT / WITH 로 시작하는 조회 쿼리
+    - is_insert: INSERT 쿼리
+    - has_output: OUTPUT 절 포함 여부 (INSERT ... OUTPUT INSERTED.id)
+    """
+
+    __slots__ = ("sql", "is_select", "is_insert", "has_output", "_slot_converters")
+
+    def __init__(self, sql):
+        self.sql = sql
+        query_upper = sql.strip().upper()
+        self.is_select = query_upper.startswith("SELECT") or query_upper.startswith("WITH")
+        self.is_insert = query_upper.startswith("INSERT")
+        self.has_output = "OUTPUT" in query_upper
+        # 슬롯 index → {타입: 변환 함수}
+        self._slot_converters = []
+
+    def convert(self, params):
+        """파라미터를 Python 기본 타입 tuple로 변환"""
+        converters = self._slot_converters
+        converted = []
+        for idx, param in enumerate(params):
+            if idx >= len(converters):
+                converters.append({})
+            slot = converters[idx]
+            value_type = type(param)
+            func = slot.get(value_type)
+            if func is None:
+                func = slot[value_type] = _converter_for(value_type)
+            converted.append(func(param))
+        return tuple(converted)
+
+    def __str__(self):
+        return self.sql
+
+    def __repr__(self):
+        kind = "SELECT" if self.is_select else "DML"
+        return f"<CompiledQuery {kind} {self.sql.strip()[:40]!r}>"
+
+
+_registry = OrderedDict()
+_registry_lock = threading.Lock()
+
+
+def compile_query(query):
+    """쿼리 문자열을 CompiledQuery로 변환 (레지스트리에 LRU 캐싱)"""
+    if isinstance(query, CompiledQuery):
+        return query
+
+    with _registry_lock:
+        compiled = _registry.get(query)
+        if compiled is not None:
+            _registry.move_to_end(query)
+            return compiled
+
+        compiled = CompiledQuery(query)
+        _registry[query] = compiled
+        if len(_registry) > MAX_REGISTRY_SIZE:
+            _registry.popitem(last=False)
+        return compiled
+
+
+def registry_size():
+    return len(_registry)
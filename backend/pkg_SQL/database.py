@@ -1,25 +1,91 @@
 import os
+import time
+import decimal
 import pyodbc
+import numpy as np
 import pandas as pd
 from sqlalchemy import create_engine, text
 import logging
 from urllib.parse import quote_plus
+from pkg_SQL.engine_registry import engine_registry
+from pkg_SQL.compiled_query import compile_query
+from pkg_SQL.query_stats import query_stats, approx_frame_bytes, approx_rows_bytes
 
 logger = logging.getLogger("SQL")
 
 
+# 커서 description의 type_code(pyodbc: Python 타입) → numpy dtype
+_CURSOR_TYPE_DTYPES = {
+    int: np.dtype(np.int64),
+    float: np.dtype(np.float64),
+    decimal.Decimal: np.dtype(np.float64),
+    bool: np.dtype(np.bool_),
+}
+
+
+# insert_data 로 행을 넣을 수 있는 테이블 (/api/insert-sql 과 동일 목록)
+INSERT_TABLES = ("meas_setting",)
+
+
+def quote_table_name(table_name, allowed_tables=INSERT_TABLES):
+    """
+    [db.][schema.]table 이름을 부분별로 [ ] 인용 (']' 는 ']]' 로 이스케이프)
+    마지막 부분(테이블명)이 allowed_tables 에 없으면 ValueError
+    """
+    parts = str(table_name).split(".")
+    if len(parts) > 3 or not all(parts) or parts[-1] not in allowed_tables:
+        raise ValueError(f"Table not allowed for insert: {table_name!r}")
+    return ".".join(f"[{part.replace(']', ']]')}]" for part in parts)
+
+
+def _is_numpy_dtype(dtype):
+    try:
+        return isinstance(np.dtype(dtype), np.dtype)
+    except TypeError:
+        return False
+
+
+def _resolve_dtype(declared, type_code):
+    """선언된 dtype 우선, 없으면 커서 타입 코드로 결정 (확장 dtype은 object로 수집)"""
+    if declared is not None:
+        return np.dtype(declared) if _is_numpy_dtype(declared) else np.dtype(object)
+    return _CURSOR_TYPE_DTYPES.get(type_code, np.dtype(object))
+
+
 class SQL:
-    def __init__(self, username, password, database=None):
+    def __init__(self, username, password, database=None, engine=None):
         self.username = username
         self.password = password
         self.database = database
 
+        # 엔진을 직접 받은 경우 (from_url): 공유 레지스트리를 거치지 않음
+        if engine is not None:
+            self.server = engine.url.host
+            self.connection_string = engine.url.render_as_string(hide_password=True)
+            self.engine = engine
+            return
+
         # 서버 주소 환경 변수
         self.server = os.environ.get("SERVER_ADDRESS_ADDRESS")
         self.connection_string = self.create_connection_string()
 
-        # SQLAlchemy 엔진을 초기화 시점에 한 번만 생성
-        self.engine = create_engine(self.connection_string)
+        # 프로세스 전역 레지스트리에서 공유 엔진(연결 풀) 재사용
+        self.engine = engine_registry.get_engine(
+            self.server,
+            self.database,
+            self.username,
+            self.password,
+            self.connection_string,
+        )
+
+    @classmethod
+    def from_url(cls, url, **engine_options):
+        """
+        SQLAlchemy URL 로 SQL 객체 생성 (벤치마크/도구용 — 세션 자격증명, 엔진 레지스트리 미사용)
+        예: SQL.from_url("sqlite:///bench.db")
+        """
+        engine = create_engine(url, **engine_options)
+        return cls(engine.url.username, None, engine.url.database, engine=engine)
 
     def create_connection_string(self):
         """연결 문자열을 생성합니다."""
@@ -67,33 +133,62 @@ class SQL:
             logger.error(f"Query execution error: {str(e)}")
             raise
 
-    def authenticate_user(self, username, password):
-        """사용자 인증 함수. 계정이 활성화되어 있고 비밀번호가 일치하는지 확인합니다."""
-        user_info = self.get_user_info(username)
-
-        if not user_info:
-            logger.warning("User does not exist.")
-            return False
-
-        if user_info["is_disabled"]:
-            logger.warning("User account is disabled.")
-            return False
+    @staticmethod
+    def authenticate_user(username, password, server=None):
+        """
+        사용자 인증 함수. 단일 ODBC 연결로 비밀번호를 검증하고(연결 성공 = 비밀번호 일치)
+        같은 연결에서 sys.sql_logins를 조회하여 계정 활성 여부를 확인합니다.
+        공유 엔진(연결 풀)을 만들지 않으므로 SQL 인스턴스 없이 호출할 수 있습니다.
 
+        Returns:
+            dict: 인증 성공 시 사용자 정보 (get_user_info와 동일 구조), 실패 시 None
+        """
+        server = server or os.environ.get("SERVER_ADDRESS_ADDRESS")
+        connection_string = (
+            f"DRIVER={{ODBC Driver 17 for SQL Server}};"
+            f"SERVER={server};"
+            f"DATABASE=master;"
+            f"UID={username};"
+            f"PWD={password};"
+            "TrustServerCertificate=yes;"
+        )
         try:
-            connection_string = (
-                f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-                f"SERVER={self.server};"
-                f"DATABASE=master;"
-                f"UID={username};"
-                f"PWD={password};"
-            )
             connection = pyodbc.connect(connection_string)
-            connection.close()
-            logger.info("Authentication successful.")
-            return True
         except pyodbc.Error as e:
             logger.error(f"Authentication failed: {e}")
-            return False
+            return None
+
+        try:
+            cursor = connection.cursor()
+            cursor.execute(
+                """
+                SELECT name, sid, is_disabled, create_date, modify_date
+                FROM sys.sql_logins
+                WHERE name = ?
+                """,
+                (username,),
+            )
+            user = cursor.fetchone()
+            cursor.close()
+        finally:
+            connection.close()
+
+        if not user:
+            logger.warning("User does not exist.")
+            return None
+
+        if user.is_disabled:
+            logger.warning("User account is disabled.")
+            return None
+
+        logger.info("Authentication successful.")
+        return {
+            "username": user.name,
+            "sid": user.sid,
+            "is_disabled": user.is_disabled,
+            "create_date": user.create_date,
+            "modify_date": user.modify_date,
+        }
 
     def _sanitize_params_for_log(self, params):
         """로그에 출력할 때 바이너리 데이터를 안전하게 표시"""
@@ -105,47 +200,40 @@ class SQL:
                 sanitized.append(str(param)[:50])
         return sanitized
 
-    def _convert_params(self, params):
-        """파라미터를 Python 기본 타입으로 변환 (바이너리 데이터는 유지)"""
-        converted = []
-        for param in params:
-            if isinstance(param, bytes):
-                converted.append(param)
-            elif hasattr(param, "item"):  # numpy 타입
-                converted.append(param.item())
-            else:
-                converted.append(param)
-        return converted
-
     def execute_query(self, query, params=None, return_type=None):
-        """SQL 쿼리를 실행하고 결과를 pandas DataFrame으로 반환합니다."""
+        """
+        SQL 쿼리를 실행하고 결과를 pandas DataFrame으로 반환합니다.
+        query는 문자열 또는 CompiledQuery이며, 문자열은 레지스트리에서 분류 결과를 재사용합니다.
+        """
+        compiled = compile_query(query)
+        sql_text = compiled.sql
         try:
-            if params:
-                logger.info(f"With params: {self._sanitize_params_for_log(params)}")
+            if params and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"With params: {self._sanitize_params_for_log(params)}")
 
-            with self.connect() as connection:
-                query_upper = query.strip().upper()
-                is_select = query_upper.startswith("SELECT") or query_upper.startswith("WITH")
+            converted_params = compiled.convert(params) if params else None
 
-                if is_select:
-                    return pd.read_sql(query, connection, params=params) if params else pd.read_sql(query, connection)
+            with query_stats.track("query", sql_text, self.database) as stat, self.connect() as connection:
+                if compiled.is_select:
+                    df = pd.read_sql(sql_text, connection, params=converted_params) if params else pd.read_sql(sql_text, connection)
+                    stat["rows"] = len(df)
+                    stat["bytes"] = approx_frame_bytes(df)
+                    return df
 
                 # INSERT/UPDATE/DELETE 쿼리
                 raw_conn = connection.connection
                 cursor = raw_conn.cursor()
 
+                insert_id = None
                 if params:
-                    converted_params = self._convert_params(params)
-
-                    insert_id = None
-                    if return_type == "insert" and query_upper.startswith("INSERT"):
-                        if "OUTPUT" in query_upper:
-                            cursor.execute(query, tuple(converted_params))
+                    if return_type == "insert" and compiled.is_insert:
+                        if compiled.has_output:
+                            cursor.execute(sql_text, converted_params)
                             result = cursor.fetchone()
                             if result and result[0] is not None:
                                 insert_id = int(result[0])
                         else:
-                            cursor.execute(query, tuple(converted_params))
+                            cursor.execute(sql_text, converted_params)
                             cursor.execute("SELECT SCOPE_IDENTITY() AS insert_id")
                             result = cursor.fetchone()
                             if result and result[0] is not None:
@@ -153,69 +241,288 @@ class SQL:
                             else:
                                 logger.warning("SCOPE_IDENTITY returned None")
                     else:
-                        cursor.execute(query, tuple(converted_params))
+                        cursor.execute(sql_text, converted_params)
                 else:
-                    cursor.execute(query)
+                    cursor.execute(sql_text)
 
+                stat["rows"] = max(cursor.rowcount, 0)
                 raw_conn.commit()
                 cursor.close()
 
                 if return_type == "insert":
                     return {"insert_id": insert_id}
 
-                logger.info("Non-SELECT query executed successfully")
+                logger.debug("Non-SELECT query executed successfully")
                 return pd.DataFrame()
         except Exception as e:
             logger.error(f"Query execution error: {str(e)}")
-            logger.error(f"Query was: {query}")
+            logger.error(f"Query was: {sql_text}")
             if params:
                 logger.error(f"Params were: {self._sanitize_params_for_log(params)}")
             raise
 
-    def execute_procedure(self, procedure_name, parameters=None):
+    def execute_output(self, query, params=None):
         """
-        MS-SQL 저장 프로시저를 실행하고 결과를 pandas DataFrame으로 반환합니다.
+        변경 쿼리(배치)를 하나의 트랜잭션으로 실행하고 첫 결과셋(OUTPUT 절 등)을 DataFrame으로 반환합니다.
+        오류 시 롤백합니다.
         """
+        compiled = compile_query(query)
         raw_conn = self.engine.raw_connection()
+        cursor = None
         try:
-            cursor = raw_conn.cursor()
-
-            if parameters:
-                param_placeholders = ",".join(["?" for _ in range(len(parameters))])
-                query = f"EXEC {procedure_name} {param_placeholders}"
-
-                param_values = []
-                for param in parameters:
-                    if isinstance(param, tuple) and len(param) == 2:
-                        value, param_type = param
-                        if param_type == int:
-                            param_values.append(int(value) if value is not None else None)
-                        elif param_type == float:
-                            param_values.append(float(value) if value is not None else None)
-                        elif param_type == bool:
-                            param_values.append(bool(value) if value is not None else None)
-                        else:
-                            param_values.append(value)
-                    else:
-                        param_values.append(param)
+            with query_stats.track("query", compiled.sql, self.database) as stat:
+                cursor = raw_conn.cursor()
+                if params:
+                    cursor.execute(compiled.sql, compiled.convert(params))
+                else:
+                    cursor.execute(compiled.sql)
+
+                # 행 수 메시지 등 결과셋이 아닌 항목은 건너뜀
+                while cursor.description is None and cursor.nextset():
+                    pass
+                columns, rows = [], []
+                if cursor.description is not None:
+                    columns = [column[0] for column in cursor.description]
+                    rows = cursor.fetchall()
+                raw_conn.commit()
+                stat["rows"] = len(rows)
+            return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+        except Exception as e:
+            try:
+                raw_conn.rollback()
+            except Exception:
+                pass
+            logger.error(f"Query execution error: {str(e)}")
+            logger.error(f"Query was: {compiled.sql}")
+            raise
+        finally:
+            try:
+                if cursor is not None:
+                    cursor.close()
+                raw_conn.close()
+            except Exception:
+                pass
 
-                cursor.execute(query, param_values)
+    def _iter_cursor(self, query, params=None, chunksize=None):
+        """
+        raw 커서에서 fetchmany 단위로 (description, rows)를 반환하는 내부 제너레이터.
+        결과 행이 없으면 description 확인용으로 (description, [])를 한 번 반환합니다.
+        """
+        if chunksize is None:
+            chunksize = int(os.environ.get("DB_FETCH_CHUNKSIZE", 5000))
+
+        compiled = compile_query(query)
+        if params and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"With params: {self._sanitize_params_for_log(params)}")
+
+        raw_conn = self.engine.raw_connection()
+        cursor = None
+        try:
+            # 스트리밍 구간 전체(소비 시간 포함)를 하나의 기록으로 측정
+            with query_stats.track("stream", compiled.sql, self.database) as stat:
+                cursor = raw_conn.cursor()
+                if params:
+                    cursor.execute(compiled.sql, compiled.convert(params))
+                else:
+                    cursor.execute(compiled.sql)
+
+                if not cursor.description:
+                    return
+                description = cursor.description
+
+                first = True
+                while True:
+                    rows = cursor.fetchmany(chunksize)
+                    if not rows:
+                        if first:
+                            yield description, []
+                        break
+                    first = False
+                    stat["rows"] += len(rows)
+                    stat["bytes"] += approx_rows_bytes(rows, len(description))
+                    yield description, rows
+        except Exception as e:
+            logger.error(f"Query execution error: {str(e)}")
+            logger.error(f"Query was: {compiled.sql}")
+            raise
+        finally:
+            try:
+                if cursor is not None:
+                    cursor.close()
+                raw_conn.close()
+            except Exception:
+                pass
+
+    def iter_query(self, query, params=None, chunksize=None, as_frame=True):
+        """
+        SELECT 결과를 fetchmany 단위로 나누어 반환하는 제너레이터.
+        전체 결과를 한 번에 DataFrame으로 만들지 않으므로 메모리 사용량이 chunksize로 제한됩니다.
+
+        Args:
+            query (str): SELECT 쿼리
+            params (tuple/list, optional): 쿼리 매개변수
+            chunksize (int, optional): fetchmany 크기 (기본: DB_FETCH_CHUNKSIZE 또는 5000)
+            as_frame (bool): True면 DataFrame 청크, False면 (columns, rows) 튜플을 반환
+        """
+        for description, rows in self._iter_cursor(query, params, chunksize):
+            if not rows:
+                continue
+            columns = [column[0] for column in description]
+            if as_frame:
+                yield pd.DataFrame.from_records(
+                    rows, columns=columns, coerce_float=True
+                )
             else:
-                query = f"EXEC {procedure_name}"
-                cursor.execute(query)
+                yield columns, rows
 
-            if cursor.description:
-                columns = [column[0] for column in cursor.description]
-                rows = cursor.fetchall()
-                df = pd.DataFrame.from_records(rows, columns=columns)
+    def fetch_columnar(self, query, params=None, schema=None, chunksize=None, as_arrow=False):
+        """
+        SELECT 결과를 컬럼 단위 numpy 버퍼로 직접 채워 반환합니다 (pd.read_sql 대체).
+        행 튜플을 DataFrame으로 변환하며 object dtype을 추론하는 과정을 생략하므로
+        숫자 위주의 넓은 결과셋에서 메모리/변환 시간이 줄어듭니다.
+
+        Args:
+            query (str): SELECT 쿼리
+            params (tuple/list, optional): 쿼리 매개변수
+            schema (dict, optional): {컬럼명: dtype} 선언. 미선언 컬럼은 커서 타입으로 결정
+                (int → int64, float/Decimal → float64, bool → bool, 그 외 object).
+                NULL이 포함된 정수/불리언 컬럼은 float64로 승격됩니다.
+            chunksize (int, optional): fetchmany 크기
+            as_arrow (bool): True면 pyarrow.Table 반환 (pyarrow 필요)
+
+        Returns:
+            pd.DataFrame 또는 pyarrow.Table
+        """
+        schema = schema or {}
+        columns = None
+        dtypes = None
+        buffers = None
+
+        for description, rows in self._iter_cursor(query, params, chunksize):
+            if columns is None:
+                columns = [column[0] for column in description]
+                dtypes = [
+                    _resolve_dtype(schema.get(name), column[1])
+                    for name, column in zip(columns, description)
+                ]
+                buffers = [[] for _ in columns]
+            if not rows:
+                continue
+
+            for idx, values in enumerate(zip(*rows)):
+                try:
+                    if dtypes[idx].kind in "iub" and None in values:
+                        raise TypeError("NULL in integer/bool column")
+                    buffers[idx].append(np.asarray(values, dtype=dtypes[idx]))
+                except (TypeError, ValueError):
+                    # NULL 포함 정수/불리언 → float64, 그 외 변환 실패 → object
+                    fallback = np.float64 if dtypes[idx].kind in "iub" else object
+                    try:
+                        array = np.asarray(values, dtype=fallback)
+                    except (TypeError, ValueError):
+                        fallback = object
+                        array = np.asarray(values, dtype=object)
+                    dtypes[idx] = np.dtype(fallback)
+                    buffers[idx] = [b.astype(fallback) for b in buffers[idx]]
+                    buffers[idx].append(array)
+
+        if columns is None:
+            return pd.DataFrame()
+
+        data = {}
+        for name, dtype, chunks in zip(columns, dtypes, buffers):
+            array = np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+            declared = schema.get(name)
+            if declared is not None and not _is_numpy_dtype(declared):
+                # category 등 pandas 확장 dtype은 마지막에 한 번만 변환
+                data[name] = pd.Series(array, copy=False).astype(declared)
             else:
-                df = pd.DataFrame()
+                data[name] = array
 
-            cursor.close()
-            raw_conn.commit()
+        if as_arrow:
+            try:
+                import pyarrow as pa
+            except ImportError as e:
+                raise ImportError("as_arrow=True 사용 시 pyarrow 패키지가 필요합니다.") from e
+            return pa.table(
+                {
+                    name: pa.array(value.to_numpy() if isinstance(value, pd.Series) else value)
+                    for name, value in data.items()
+                }
+            )
+
+        return pd.DataFrame(data, copy=False)
+
+    @staticmethod
+    def _build_procedure_call(procedure_name, parameters=None):
+        """EXEC 문과 (타입 변환된) 파라미터 목록을 생성합니다."""
+        if not parameters:
+            return f"EXEC {procedure_name}", None
+
+        param_placeholders = ",".join(["?" for _ in range(len(parameters))])
+        query = f"EXEC {procedure_name} {param_placeholders}"
+
+        param_values = []
+        for param in parameters:
+            if isinstance(param, tuple) and len(param) == 2:
+                value, param_type = param
+                if param_type == int:
+                    param_values.append(int(value) if value is not None else None)
+                elif param_type == float:
+                    param_values.append(float(value) if value is not None else None)
+                elif param_type == bool:
+                    param_values.append(bool(value) if value is not None else None)
+                else:
+                    param_values.append(value)
+            else:
+                param_values.append(param)
+        return query, param_values
+
+    def iter_procedure(self, procedure_name, parameters=None, chunksize=None):
+        """
+        저장 프로시저의 모든 결과셋을 nextset으로 순회하며 fetchmany 단위로 반환하는 제너레이터.
+        (result_index, columns, rows) 튜플을 반환하며, 행이 없는 결과셋은 rows=[]로 한 번 반환합니다.
+        모든 결과셋을 소비한 뒤 커밋하며, 중간에 종료되면 커밋 없이 연결을 반환합니다.
+        """
+        if chunksize is None:
+            chunksize = int(os.environ.get("DB_FETCH_CHUNKSIZE", 5000))
+
+        query, param_values = self._build_procedure_call(procedure_name, parameters)
+        raw_conn = self.engine.raw_connection()
+        try:
+            with query_stats.track("procedure", query, self.database) as stat:
+                cursor = raw_conn.cursor()
+                if param_values is not None:
+                    cursor.execute(query, param_values)
+                else:
+                    cursor.execute(query)
 
-            logger.info(f"Stored procedure '{procedure_name}' executed successfully")
-            return df
+                result_index = 0
+                while True:
+                    # 행 수 메시지 등 컬럼이 없는 결과는 건너뜀
+                    if cursor.description:
+                        columns = [column[0] for column in cursor.description]
+                        first = True
+                        while True:
+                            rows = cursor.fetchmany(chunksize)
+                            if not rows:
+                                if first:
+                                    yield result_index, columns, []
+                                break
+                            first = False
+                            stat["rows"] += len(rows)
+                            stat["bytes"] += approx_rows_bytes(rows, len(columns))
+                            yield result_index, columns, rows
+                        result_index += 1
+                    if not cursor.nextset():
+                        break
+
+                cursor.close()
+                raw_conn.commit()
+            logger.info(
+                f"Stored procedure '{procedure_name}' executed successfully "
+                f"({result_index} result sets)"
+            )
         except Exception as e:
             logger.error(f"Stored procedure execution error: {str(e)}")
             raise
@@ -225,12 +532,86 @@ class SQL:
             except Exception:
                 pass
 
-    def insert_data(self, table_name, data):
-        """MS-SQL 테이블에 데이터를 삽입합니다."""
+    def execute_procedure(self, procedure_name, parameters=None, all_results=False):
+        """
+        MS-SQL 저장 프로시저를 실행하고 결과를 pandas DataFrame으로 반환합니다.
+        all_results=True면 모든 결과셋을 DataFrame 리스트로 반환합니다.
+        """
+        results = []
+        current_index = None
+        columns = None
+        rows = []
+
+        for result_index, result_columns, chunk in self.iter_procedure(
+            procedure_name, parameters
+        ):
+            if result_index != current_index:
+                if current_index is not None:
+                    results.append(pd.DataFrame.from_records(rows, columns=columns))
+                current_index, columns, rows = result_index, result_columns, []
+            rows.extend(chunk)
+        if current_index is not None:
+            results.append(pd.DataFrame.from_records(rows, columns=columns))
+
+        if all_results:
+            return results
+        return results[0] if results else pd.DataFrame()
+
+    def insert_data(self, table_name, data, batch_size=None, allowed_tables=INSERT_TABLES):
+        """
+        MS-SQL 테이블에 데이터를 삽입합니다.
+        pyodbc fast_executemany로 batch_size 행씩 전송하며, 전체를 하나의 트랜잭션으로 커밋합니다.
+        table_name 은 schema 로 한정할 수 있고 (예: dbo.meas_setting), 테이블명은 allowed_tables 에 있어야 합니다.
+
+        Returns:
+            dict: {"rows": 삽입 행 수, "elapsed_sec": 소요 시간, "rows_per_sec": 처리량}
+        """
+        if batch_size is None:
+            batch_size = int(os.environ.get("DB_INSERT_BATCH_SIZE", 1000))
+        batch_size = max(1, int(batch_size))
+
+        table = quote_table_name(table_name, allowed_tables)
+        columns = ", ".join(f"[{str(col).replace(']', ']]')}]" for col in data.columns)
+        placeholders = ", ".join("?" for _ in data.columns)
+        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+
+        # NaN → NULL, numpy 스칼라 → Python 기본 타입
+        rows = data.astype(object).where(data.notna(), None).values.tolist()
+
+        start_time = time.perf_counter()
+        raw_conn = self.engine.raw_connection()
         try:
-            with self.connect() as connection:
-                data.to_sql(table_name, connection, if_exists="append", index=False)
-                logger.info(f"Data inserted into [{table_name}] table")
+            with query_stats.track("insert", query, self.database) as stat:
+                stat["rows"] = len(rows)
+                stat["bytes"] = approx_frame_bytes(data)
+                cursor = raw_conn.cursor()
+                if hasattr(cursor, "fast_executemany"):
+                    cursor.fast_executemany = True
+                for offset in range(0, len(rows), batch_size):
+                    cursor.executemany(query, rows[offset : offset + batch_size])
+                raw_conn.commit()
+                cursor.close()
         except Exception as e:
+            try:
+                raw_conn.rollback()
+            except Exception:
+                pass
             logger.error(f"Data insertion error: {str(e)}")
             raise
+        finally:
+            try:
+                raw_conn.close()
+            except Exception:
+                pass
+
+        elapsed = time.perf_counter() - start_time
+        rows_per_sec = len(rows) / elapsed if elapsed > 0 else float(len(rows))
+        logger.info(
+            f"Data inserted into {table} table: {len(rows)} rows "
+            f"in {elapsed:.3f}s ({rows_per_sec:,.0f} rows/s, batch_size={batch_size})"
+        )
+        return {
+            "rows": len(rows),
+            "elapsed_sec": round(elapsed, 4),
+            "rows_per_sec": round(rows_per_sec, 1),
+        }
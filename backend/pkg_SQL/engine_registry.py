@@ -0,0 +1,157 @@
+"""
+프로세스 전역 SQLAlchemy 엔진 레지스트리
+(server, database, user) 단위로 엔진(연결 풀)을 공유하여 요청마다 발생하던
+create_engine + ODBC 핸드셰이크 비용을 제거합니다.
+"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from sqlalchemy import create_engine
+
+logger = logging.getLogger("EngineRegistry")
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class EngineRegistry:
+    """
+    공유 엔진 레지스트리
+    - 키: (server, database, username) + 비밀번호 fingerprint (비밀번호가 다르면 다른 엔진)
+    - 풀 설정: DB_POOL_SIZE / DB_POOL_MAX_OVERFLOW / DB_POOL_RECYCLE (AOP_config.cfg [DB_Pool])
+    - 유휴 엔진 정리: DB_POOL_IDLE_TIMEOUT 초 동안 사용되지 않고 대여 중인 연결이 없으면 dispose
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._engines = {}
+        self._last_sweep = time.monotonic()
+
+    # ----- 설정 -----
+    @staticmethod
+    def pool_options():
+        """환경변수 기반 풀 설정 (Config.load_config 이후 값 반영)"""
+        return {
+            "pool_size": _env_int("DB_POOL_SIZE", 5),
+            "max_overflow": _env_int("DB_POOL_MAX_OVERFLOW", 10),
+            "pool_recycle": _env_int("DB_POOL_RECYCLE", 1800),
+            "pool_timeout": _env_int("DB_POOL_TIMEOUT", 30),
+            "pool_pre_ping": True,
+        }
+
+    @staticmethod
+    def idle_timeout():
+        return _env_int("DB_POOL_IDLE_TIMEOUT", 900)
+
+    @staticmethod
+    def _fingerprint(password):
+        return hashlib.sha256(str(password).encode("utf-8")).hexdigest()[:16]
+
+    # ----- 엔진 조회/생성 -----
+    def get_engine(self, server, database, username, password, connection_string):
+        """키에 해당하는 공유 엔진을 반환합니다. 없으면 생성합니다."""
+        key = (server, database, username, self._fingerprint(password))
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._engines.get(key)
+            if entry is None:
+                engine = create_engine(connection_string, **self.pool_options())
+                entry = {
+                    "engine": engine,
+                    "created_at": time.time(),
+                    "last_used": now,
+                    "hits": 0,
+                }
+                self._engines[key] = entry
+                logger.info(f"Engine created: {database} for user {username}")
+            entry["last_used"] = now
+            entry["hits"] += 1
+
+        self.evict_idle()
+        return entry["engine"]
+
+    # ----- 정리 -----
+    def evict_idle(self, force=False):
+        """유휴 시간이 idle_timeout을 넘은 엔진을 dispose 합니다 (최대 60초마다 1회)."""
+        now = time.monotonic()
+        timeout = self.idle_timeout()
+        with self._lock:
+            if not force and now - self._last_sweep < 60:
+                return 0
+            self._last_sweep = now
+
+            expired = [
+                key
+                for key, entry in self._engines.items()
+                if now - entry["last_used"] > timeout
+                and self._checkedout(entry["engine"]) == 0
+            ]
+            for key in expired:
+                self._dispose_key(key)
+
+        if expired:
+            logger.info(f"Idle engines evicted: {len(expired)}")
+        return len(expired)
+
+    def dispose_user(self, username):
+        """특정 사용자의 엔진을 모두 정리합니다 (로그아웃 등, SQL Server 로그인명은 대소문자 무시)."""
+        with self._lock:
+            keys = [key for key in self._engines if str(key[2]).lower() == str(username).lower()]
+            for key in keys:
+                self._dispose_key(key)
+        return len(keys)
+
+    def dispose_all(self):
+        with self._lock:
+            for key in list(self._engines):
+                self._dispose_key(key)
+
+    def _dispose_key(self, key):
+        entry = self._engines.pop(key, None)
+        if entry is None:
+            return
+        try:
+            entry["engine"].dispose()
+        except Exception as e:
+            logger.warning(f"Engine dispose failed for {key[1]}/{key[2]}: {e}")
+
+    # ----- 통계 -----
+    @staticmethod
+    def _checkedout(engine):
+        pool = engine.pool
+        return pool.checkedout() if hasattr(pool, "checkedout") else 0
+
+    def stats(self):
+        """엔진별 풀 통계 (비밀번호 fingerprint 제외)"""
+        now = time.monotonic()
+        result = []
+        with self._lock:
+            for (server, database, username, _), entry in self._engines.items():
+                pool = entry["engine"].pool
+                result.append(
+                    {
+                        "server": server,
+                        "database": database,
+                        "username": username,
+                        "pool_size": pool.size() if hasattr(pool, "size") else None,
+                        "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else None,
+                        "checked_out": self._checkedout(entry["engine"]),
+                        "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+                        "hits": entry["hits"],
+                        "idle_seconds": round(now - entry["last_used"], 1),
+                        "created_at": entry["created_at"],
+                    }
+                )
+        return result
+
+
+# 전역 싱글톤 인스턴스
+engine_registry = EngineRegistry()
@@ -0,0 +1,207 @@
+"""
+SQL 계층 쿼리 계측 (실행 시간, 반환 행 수, 대략적 바이트, 호출 라우트, 데이터베이스)
+- 라우트/DB/쿼리별 집계 및 백분위수(p50/p95/p99), 구간 히스토그램
+- DB_SLOW_QUERY_MS 초과 쿼리는 "SQL.slow" 로거로 경고 기록
+- 쿼리별 집계 키는 DB_QUERY_STATS_MAX_KEYS 개까지 유지 (초과 시 가장 오래 사용되지 않은 키 제거)
+"""
+
+import os
+import re
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+slow_logger = logging.getLogger("SQL.slow")
+
+# 히스토그램 구간 상한 (ms)
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000, 10000)
+# 키별 백분위수 계산용 최근 샘플 수
+SAMPLE_SIZE = 1000
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _current_route():
+    """요청 컨텍스트가 있으면 Flask endpoint, 없으면 '-' (백그라운드 스레드 등)"""
+    try:
+        from flask import has_request_context, request
+
+        if has_request_context():
+            return request.endpoint or request.path
+    except Exception:
+        pass
+    return "-"
+
+
+def _fingerprint(sql_text):
+    """정규화한 쿼리 앞 120자 + 전체 텍스트 해시 (앞부분이 같은 긴 쿼리끼리 섞이지 않도록)"""
+    normalized = _WHITESPACE.sub(" ", str(sql_text)).strip()
+    digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:8]
+    return f"{normalized[:120]} #{digest}"
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    idx = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return round(sorted_values[idx], 2)
+
+
+class _Stat:
+    __slots__ = ("count", "errors", "total_ms", "max_ms", "rows", "bytes", "samples", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+
+    def add(self, elapsed_ms, rows, nbytes, error):
+        self.count += 1
+        self.errors += int(error)
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += rows or 0
+        self.bytes += nbytes or 0
+        self.samples.append(elapsed_ms)
+        for idx, upper in enumerate(HISTOGRAM_BUCKETS_MS):
+            if elapsed_ms <= upper:
+                self.buckets[idx] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def to_dict(self):
+        ordered = sorted(self.samples)
+        labels = [f"<={b}ms" for b in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": _percentile(ordered, 50),
+            "p95_ms": _percentile(ordered, 95),
+            "p99_ms": _percentile(ordered, 99),
+            "rows": self.rows,
+            "approx_bytes": self.bytes,
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+class QueryStats:
+    """프로세스 전역 쿼리 통계 수집기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_query = OrderedDict()
+        self._by_route = {}
+        self.evicted = 0
+        self.started_at = time.time()
+
+    @staticmethod
+    def slow_threshold_ms():
+        try:
+            return float(os.environ.get("DB_SLOW_QUERY_MS", 1000))
+        except ValueError:
+            return 1000.0
+
+    @staticmethod
+    def max_keys():
+        try:
+            return max(1, int(os.environ.get("DB_QUERY_STATS_MAX_KEYS", 2000)))
+        except ValueError:
+            return 2000
+
+    def record(self, kind, sql_text, database, elapsed_ms, rows=0, nbytes=0, error=False, route=None):
+        route = route or _current_route()
+        fingerprint = _fingerprint(sql_text)
+        with self._lock:
+            key = (route, database, kind, fingerprint)
+            stat = self._by_query.get(key)
+            if stat is None:
+                stat = self._by_query[key] = _Stat()
+                while len(self._by_query) > self.max_keys():
+                    self._by_query.popitem(last=False)
+                    self.evicted += 1
+            else:
+                self._by_query.move_to_end(key)
+            stat.add(elapsed_ms, rows, nbytes, error)
+
+            route_stat = self._by_route.get(route)
+            if route_stat is None:
+                route_stat = self._by_route[route] = _Stat()
+            route_stat.add(elapsed_ms, rows, nbytes, error)
+
+        if elapsed_ms >= self.slow_threshold_ms():
+            slow_logger.warning(
+                f"Slow query {elapsed_ms:.0f}ms [{kind}] route={route} db={database} "
+                f"rows={rows} bytes~{nbytes}: {fingerprint}"
+            )
+
+    @contextmanager
+    def track(self, kind, sql_text, database):
+        """
+        쿼리 실행 구간을 측정하는 컨텍스트 매니저.
+        yield 되는 dict에 rows / bytes를 채우면 함께 기록됩니다.
+        """
+        info = {"rows": 0, "bytes": 0}
+        start = time.perf_counter()
+        error = False
+        try:
+            yield info
+        except Exception:
+            error = True
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.record(kind, sql_text, database, elapsed_ms, info["rows"], info["bytes"], error)
+
+    def snapshot(self, limit=50):
+        """라우트별 집계와 총 소요 시간 상위 쿼리 목록"""
+        with self._lock:
+            routes = {route: stat.to_dict() for route, stat in self._by_route.items()}
+            queries = [
+                {"route": route, "database": database, "kind": kind, "query": fingerprint, **stat.to_dict()}
+                for (route, database, kind, fingerprint), stat in self._by_query.items()
+            ]
+        queries.sort(key=lambda q: q["total_ms"], reverse=True)
+        return {
+            "since": self.started_at,
+            "slow_query_ms": self.slow_threshold_ms(),
+            "tracked_queries": len(queries),
+            "evicted_queries": self.evicted,
+            "routes": dict(sorted(routes.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)),
+            "queries": queries[:limit],
+        }
+
+    def reset(self):
+        with self._lock:
+            self._by_query.clear()
+            self._by_route.clear()
+            self.evicted = 0
+            self.started_at = time.time()
+
+
+def approx_frame_bytes(df):
+    """DataFrame 대략적 메모리 크기 (object 컬럼은 포인터 크기만 계산)"""
+    try:
+        return int(df.memory_usage(index=False, deep=False).sum())
+    except Exception:
+        return 0
+
+
+def approx_rows_bytes(rows, num_columns):
+    """행 튜플 배치의 대략적 크기 (컬럼당 8바이트 가정)"""
+    return len(rows) * num_columns * 8
+
+
+# 전역 싱글톤 인스턴스
+query_stats = QueryStats()
@@ -0,0 +1,64 @@
+from flask import Blueprint, request, jsonify
+from utils.decorators import handle_exceptions, require_auth, require_admin
+from pkg_SQL.query_stats import query_stats
+from pkg_SQL.engine_registry import engine_registry
+from utils.database_manager import connection_budget
+from pkg_MeasSetGen.Temp_Prr_predict import (
+    artifact_fingerprint,
+    reload_artifacts,
+    temperature_artifact_cache,
+)
+
+admin_bp = Blueprint("admin", __name__, url_prefix="/api/admin")
+
+
+@admin_bp.route("/query-stats", methods=["GET"])
+@handle_exceptions
+@require_auth
+@require_admin
+def get_query_stats():
+    """
+    SQL 계층 쿼리 통계 조회 (라우트별 / 쿼리별 집계, 백분위수, 히스토그램, 풀 상태)
+
+    Query Parameters:
+        - limit (optional): 반환할 상위 쿼리 수 (기본: 50)
+    """
+    limit = request.args.get("limit", 50, type=int)
+    stats = query_stats.snapshot(limit=limit)
+    stats["pools"] = engine_registry.stats()
+    stats["connection_budget"] = connection_budget.stats()
+    return jsonify({"status": "success", "data": stats})
+
+
+@admin_bp.route("/query-stats/reset", methods=["POST"])
+@handle_exceptions
+@require_auth
+@require_admin
+def reset_query_stats():
+    """SQL 계층 쿼리 통계 초기화"""
+    query_stats.reset()
+    return jsonify({"status": "success"})
+
+
+@admin_bp.route("/temperature-artifacts", methods=["GET"])
+@handle_exceptions
+@require_auth
+@require_admin
+def get_temperature_artifacts():
+    """온도 모델 아티팩트 캐시 상태 (로드 횟수, 경로별 sha256 / 크기 / 로드 시각)"""
+    return jsonify({"status": "success", "data": temperature_artifact_cache.stats()})
+
+
+@admin_bp.route("/temperature-artifacts/reload", methods=["POST"])
+@handle_exceptions
+@require_auth
+@require_admin
+def reload_temperature_artifacts():
+    """온도 모델 아티팩트 강제 재로드 (이 프로세스 기준, 일괄 생성 워커는 다음 실행 시 반영)"""
+    _, feature_columns = reload_artifacts()
+    return jsonify(
+        {
+            "status": "success",
+            "data": {"feature_columns": len(feature_columns), "sha256": artifact_fingerprint()},
+        }
+    )
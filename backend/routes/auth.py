@@ -2,16 +2,59 @@ from flask import Blueprint, request, jsonify, session
 from datetime import datetime, timedelta, timezone
 import jwt
 import sqlalchemy.exc
+import os
+import uuid
 import pyodbc
 from config import Config
-from utils.database_manager import DatabaseManager
-from utils.decorators import handle_exceptions
+from pkg_SQL.database import SQL
+from utils.database_manager import session_tracker
+from utils.credential_cache import credential_cache
+from utils.token_cache import token_cache
+from utils.decorators import handle_exceptions, release_token
 from utils.error_handler import error_response
 from utils.logger import logger
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
 
+def _refresh_max_age():
+    """최초 로그인 이후 토큰 갱신이 허용되는 최대 시간 (초)"""
+    try:
+        return int(os.environ.get("AUTH_REFRESH_MAX_AGE", 43200))
+    except ValueError:
+        return 43200
+
+
+def _issue_token(username, sid, orig_iat=None, sess=None):
+    """
+    JWT 발급 (orig_iat: 최초 로그인 시각, sess: 로그인 세션 ID — 갱신 시 둘 다 유지)
+    """
+    now = datetime.now(timezone.utc)
+    exp = now + timedelta(seconds=Config.EXPIRE_TIME)
+    sess = sess or uuid.uuid4().hex
+    payload = {
+        "username": username,
+        "id": sid,
+        "sess": sess,
+        "iat": now,
+        "orig_iat": orig_iat if orig_iat is not None else int(now.timestamp()),
+        "exp": exp,
+    }
+    session_tracker.touch(username, sess, exp.timestamp())
+    return jwt.encode(payload, Config.SECRET_KEY, algorithm="HS256")
+
+
+def _set_token_cookie(response, token):
+    response.set_cookie(
+        "auth_token",
+        token,
+        httponly=True,
+        samesite="Lax",
+        secure=Config.COOKIE_SECURE,
+    )
+    return response
+
+
 @auth_bp.route("/login", methods=["POST"])
 @handle_exceptions
 def login():
@@ -25,28 +68,21 @@ def login():
         return error_response("Username and password are required", 400)
 
     try:
-        with DatabaseManager.create_explicit_connection(username, password, "master") as sql:
-            user_info = sql.get_user_info(username=username)
-            if user_info and sql.authenticate_user(username=username, password=password):
-                payload = {
-                    "username": user_info["username"],
-                    "id": str(user_info["sid"]),
-                    "exp": datetime.now(timezone.utc) + timedelta(seconds=Config.EXPIRE_TIME),
-                }
-                token = jwt.encode(payload, Config.SECRET_KEY, algorithm="HS256")
-                # 세션에 로그인 자격증명 저장 — 이후 모든 DB 연결에 사용됨
-                session["username"] = username
-                session["password"] = password
-                session.permanent = False  # 브라우저 종료 시 세션 만료
-                response = jsonify({"status": "success", "message": "Login successful"})
-                response.set_cookie(
-                    "auth_token",
-                    token,
-                    httponly=True,
-                    samesite="Lax",
-                    secure=Config.COOKIE_SECURE,
-                )
-                return response
+        # 최근 검증된 자격증명이면 DB 왕복 생략
+        user_info = credential_cache.get(username, password)
+        if user_info is None:
+            # 단일 ODBC 연결로 비밀번호 검증 + 계정 상태 조회 (master 연결 풀은 만들지 않음)
+            user_info = SQL.authenticate_user(username=username, password=password)
+            if user_info:
+                credential_cache.put(username, password, user_info)
+        if user_info:
+            token = _issue_token(user_info["username"], str(user_info["sid"]))
+            # 세션에 로그인 자격증명 저장 — 이후 모든 DB 연결에 사용됨
+            session["username"] = username
+            session["password"] = password
+            session.permanent = False  # 브라우저 종료 시 세션 만료
+            response = jsonify({"status": "success", "message": "Login successful"})
+            return _set_token_cookie(response, token)
     except (sqlalchemy.exc.InterfaceError, sqlalchemy.exc.OperationalError,
             pyodbc.InterfaceError, pyodbc.OperationalError):
         pass  # 인증 실패 — 아래 공통 응답으로 처리
@@ -65,26 +101,70 @@ def auth_status():
             200,
         )
     try:
-        decoded_token = jwt.decode(token, Config.SECRET_KEY, algorithms=["HS256"])
+        decoded_token = token_cache.verify(token)
         # 세션에 DB 자격증명이 있는지도 확인 (JWT 유효하지만 세션 만료 시 422 방지)
         has_credentials = bool(session.get("username") and session.get("password"))
+        expires_in = max(0, int(decoded_token["exp"] - datetime.now(timezone.utc).timestamp()))
         return (
             jsonify({
                 "authenticated": True,
                 "username": decoded_token["username"],
                 "has_credentials": has_credentials,
+                "expires_in": expires_in,
+                # 남은 시간이 절반 이하면 /api/auth/refresh 호출 권장
+                "refresh_recommended": has_credentials and expires_in <= Config.EXPIRE_TIME // 2,
             }),
             200,
         )
     except jwt.ExpiredSignatureError:
+        release_token(token)
         return jsonify({"authenticated": False, "message": "Token expired"}), 200
     except jwt.InvalidTokenError:
         return jsonify({"authenticated": False, "message": "Invalid token"}), 200
 
 
+@auth_bp.route("/refresh", methods=["POST"])
+@handle_exceptions
+def refresh():
+    """
+    유효한 토큰을 새 만료 시각으로 재발급 (sliding refresh)
+    SQL Server 재인증 없이 처리하며, 최초 로그인 후 AUTH_REFRESH_MAX_AGE 초까지만 허용
+    """
+    token = request.cookies.get("auth_token")
+    if not token:
+        return error_response("Authentication required", 401)
+    try:
+        decoded_token = token_cache.verify(token)
+    except jwt.ExpiredSignatureError:
+        return error_response("Token expired", 401)
+    except jwt.InvalidTokenError:
+        return error_response("Invalid token", 403)
+
+    # DB 자격증명이 없는 세션은 갱신해도 사용할 수 없으므로 재로그인 유도
+    if session.get("username") != decoded_token["username"] or not session.get("password"):
+        return error_response("Session expired, please log in again", 401)
+
+    now = int(datetime.now(timezone.utc).timestamp())
+    orig_iat = decoded_token.get("orig_iat") or int(decoded_token["exp"]) - Config.EXPIRE_TIME
+    if now - orig_iat > _refresh_max_age():
+        return error_response("Refresh window exceeded, please log in again", 401)
+
+    new_token = _issue_token(
+        decoded_token["username"], decoded_token.get("id"), orig_iat, decoded_token.get("sess")
+    )
+    token_cache.discard(token)
+    response = jsonify({"status": "success", "expires_in": Config.EXPIRE_TIME})
+    return _set_token_cookie(response, new_token)
+
+
 @auth_bp.route("/logout", methods=["POST"])
 @handle_exceptions
 def logout():
+    token = request.cookies.get("auth_token")
+    if token:
+        token_cache.discard(token)
+        # 이 세션 종료 — 같은 사용자의 다른 세션이 없을 때만 연결 풀 반환
+        release_token(token)
     session.clear()
     response = jsonify({"status": "success", "message": "Logged out successfully"})
     response.set_cookie("auth_token", "", expires=0)
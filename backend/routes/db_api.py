@@ -1,11 +1,19 @@
-from flask import Blueprint, request, jsonify, g, Response
-import os, io, json
+from flask import Blueprint, request, jsonify, g, Response, current_app, stream_with_context, send_file
+import os, io, json, zlib
 from io import StringIO
 from pathlib import Path
 from docx import Document
 from utils.decorators import handle_exceptions, require_auth, with_db_connection
 from utils.error_handler import error_response
 from utils.logger import logger
+from pkg_MeasSetGen.data_inout import (
+    COLUMNAR_FORMATS,
+    RESULT_DIR,
+    columnar_available,
+    export_columnar,
+)
+from pkg_MeasSetGen.generation_cache import CACHE_DIR
+from pkg_SQL.database import INSERT_TABLES
 import pandas as pd
 import numpy as np
 
@@ -22,9 +30,16 @@ def insert_sql_measset():
     records = data.get("data")
     if not table_name or not records:
         return error_response("Invalid data: table and data fields are required", 400)
-    allowed_insert_tables = ["meas_setting"]
-    if table_name not in allowed_insert_tables:
+    if table_name not in INSERT_TABLES:
         return error_response("유효하지 않은 테이블 이름입니다", 400)
+    batch_size = data.get("batch_size")
+    if batch_size is not None:
+        try:
+            batch_size = int(batch_size)
+        except (TypeError, ValueError):
+            batch_size = 0
+        if batch_size < 1:
+            return error_response("batch_size must be a positive integer", 400)
     try:
         json_str = json.dumps(records)
         df = pd.read_json(StringIO(json_str), orient="records")
@@ -32,9 +47,17 @@ def insert_sql_measset():
         logger.error(f"DataFrame conversion error: {str(e)}")
         return error_response("Failed to parse records into DataFrame", 500)
     try:
-        g.current_db.insert_data(table_name, df)
+        insert_stats = g.current_db.insert_data(
+            table_name, df, batch_size=batch_size
+        )
         return (
-            jsonify({"status": "success", "message": "Data inserted successfully"}),
+            jsonify(
+                {
+                    "status": "success",
+                    "message": "Data inserted successfully",
+                    "insert_stats": insert_stats,
+                }
+            ),
             200,
         )
     except Exception as e:
@@ -42,27 +65,115 @@ def insert_sql_measset():
         return error_response(str(e), 500)
 
 
+# 결과 파일 스트리밍 전송 단위 / 압축 최소 크기
+_STREAM_BLOCK_SIZE = 256 * 1024
+_COMPRESS_MIN_BYTES = 1024
+# Content-Encoding별 zlib wbits (gzip 헤더 / zlib 헤더)
+_ZLIB_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def _resolve_result_path(csv_key):
+    """
+    csv_key → 결과 CSV 경로 (MeasSetGen 결과 디렉토리의 .csv 만 허용, 캐시 디렉토리 제외)
+    Returns: (Path, None) 또는 (None, error_response)
+    """
+    # 경로 탐색 공격 방지: 절대 경로로 변환 후 결과 디렉토리 내에 있는지 검증
+    # (format=parquet|feather 는 같은 위치에 파일을 쓰므로 임의 경로를 받지 않음)
+    try:
+        file_path = Path(csv_key).resolve()
+        file_path.relative_to(Path(RESULT_DIR).resolve())
+        if file_path.suffix.lower() != ".csv" or file_path.is_relative_to(
+            Path(CACHE_DIR).resolve()
+        ):
+            raise ValueError(csv_key)
+    except ValueError:
+        logger.warning(f"Path traversal attempt blocked: {csv_key!r}")
+        return None, error_response("Invalid file path", 400)
+    except Exception:
+        return None, error_response("Invalid file path", 400)
+
+    if not file_path.is_file():
+        return None, error_response("CSV data not found", 404)
+    return file_path, None
+
+
+def _stream_compressed(file_path, encoding):
+    """파일을 블록 단위로 읽어 gzip/deflate로 압축하며 전송 (전체 파일을 메모리에 올리지 않음)"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, _ZLIB_WBITS[encoding])
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(_STREAM_BLOCK_SIZE), b""):
+            data = compressor.compress(block)
+            if data:
+                yield data
+    yield compressor.flush()
+
+
+def _send_csv(file_path):
+    """
+    결과 CSV를 디스크에서 바로 전송
+    - Range 요청: 원본 바이트 구간 (206 / If-Range / ETag 는 send_file이 처리)
+    - 그 외: Accept-Encoding에 따라 gzip/deflate 스트리밍 압축
+    """
+    encoding = None
+    if "Range" not in request.headers and file_path.stat().st_size >= _COMPRESS_MIN_BYTES:
+        encoding = request.accept_encodings.best_match(["gzip", "deflate", "identity"])
+
+    if encoding in _ZLIB_WBITS:
+        response = Response(
+            _stream_compressed(file_path, encoding), mimetype="text/csv"
+        )
+        response.headers["Content-Encoding"] = encoding
+        response.headers.set("Content-Disposition", "inline", filename=file_path.name)
+    else:
+        response = send_file(
+            file_path,
+            mimetype="text/csv",
+            download_name=file_path.name,
+            conditional=True,
+            max_age=0,
+        )
+        response.headers["Accept-Ranges"] = "bytes"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
 @db_api_bp.route("/csv-data", methods=["GET"])
 @handle_exceptions
 @require_auth
 def get_csv_data():
+    """
+    생성 결과 조회
+    - format 미지정/json: {"status", "data": CSV 문자열} (기존 형식)
+    - format=csv: CSV 파일 스트리밍 (gzip/deflate, Range 지원)
+    - format=parquet|feather: 같은 결과의 컬럼 포맷 파일 (pyarrow 필요)
+    """
     csv_key = request.args.get("csv_key")
     if not csv_key:
         return error_response("csv_key is required", 400)
+    fmt = request.args.get("format", "json").lower()
+    if fmt not in ("json", "csv", *COLUMNAR_FORMATS):
+        return error_response(f"Unsupported format: {fmt}", 400)
 
-    # 경로 탐색 공격 방지: 절대 경로로 변환 후 프로젝트 루트 내에 있는지 검증
-    try:
-        file_path = Path(csv_key).resolve()
-        project_root = Path(os.getcwd()).resolve()
-        file_path.relative_to(project_root)
-    except ValueError:
-        logger.warning(f"Path traversal attempt blocked: {csv_key!r}")
-        return error_response("Invalid file path", 400)
-    except Exception:
-        return error_response("Invalid file path", 400)
+    file_path, error = _resolve_result_path(csv_key)
+    if error:
+        return error
+
+    if fmt == "csv":
+        return _send_csv(file_path)
+
+    if fmt in COLUMNAR_FORMATS:
+        if not columnar_available():
+            return error_response(f"{fmt} format requires pyarrow on the server", 501)
+        target = Path(export_columnar(file_path, fmt))
+        return send_file(
+            target,
+            mimetype=COLUMNAR_FORMATS[fmt][1],
+            as_attachment=True,
+            download_name=target.name,
+            conditional=True,
+            max_age=0,
+        )
 
-    if not file_path.exists():
-        return error_response("CSV data not found", 404)
     with open(file_path, "r", encoding="utf-8") as f:
         csv_data = f.read()
     return jsonify({"status": "success", "data": csv_data}), 200
@@ -222,7 +333,16 @@ def run_tx_compare():
         f"TxCompare 실행 요청: probeId={probeid}, Tx_SW={tx_sw}, WCS_SW={wcs_sw}, SSid_Temp={ssid_temp}, SSid_MI={ssid_mi}, SSid_Ispta3={ssid_ispta3}"
     )
     params = (probeid, tx_sw, wcs_sw, ssid_temp, ssid_mi, ssid_ispta3)
-    result_df = g.current_db.execute_procedure("TxCompare", params)
+
+    # stream=true: 결과셋을 fetchmany 단위로 JSON 응답에 바로 기록 (메모리 일정, 첫 행 응답 단축)
+    if data.get("stream"):
+        return Response(
+            stream_with_context(_stream_tx_compare(g.current_db, params)),
+            mimetype="application/json",
+        )
+
+    result_sets = g.current_db.execute_procedure("TxCompare", params, all_results=True)
+    result_df = result_sets[0] if result_sets else pd.DataFrame()
 
     result_df = result_df.replace({np.nan: None})
     if result_df is None or result_df.empty:
@@ -231,6 +351,7 @@ def run_tx_compare():
                 {
                     "status": "success",
                     "message": "비교 보고서 데이터가 없습니다.",
+                    "columns": [],
                     "reportData": [],
                 }
             ),
@@ -238,17 +359,78 @@ def run_tx_compare():
         )
     report_data = result_df.to_dict(orient="records")
     columns = list(result_df.columns)
-    return (
-        jsonify(
+    response_data = {
+        "status": "success",
+        "message": "비교 보고서 데이터를 성공적으로 추출했습니다.",
+        "reportData": report_data,
+        "columns": columns,
+    }
+    # 두 번째 이후 결과셋이 있으면 함께 반환
+    if len(result_sets) > 1:
+        response_data["additionalReports"] = [
             {
-                "status": "success",
-                "message": "비교 보고서 데이터를 성공적으로 추출했습니다.",
-                "reportData": report_data,
-                "columns": columns,
+                "columns": list(df.columns),
+                "reportData": df.replace({np.nan: None}).to_dict(orient="records"),
             }
-        ),
-        200,
+            for df in result_sets[1:]
+        ]
+    return jsonify(response_data), 200
+
+
+def _stream_tx_compare(db, params):
+    """
+    TxCompare 결과를 run_tx_compare 응답과 같은 JSON 구조로 청크 단위 출력
+    - 결과셋이 없어도 "columns": [], "reportData": [] 포함
+    - status 는 마지막에 기록: 출력 도중 오류가 나면 열린 배열을 닫고 "status": "error", "error" 로 끝냄
+      (응답 코드는 이미 200으로 전송되었으므로 클라이언트는 status 로 성공 여부 판단)
+    """
+    dumps = current_app.json.dumps
+    current_index = None
+    row_count = 0
+    first_row = True
+    error = None
+
+    yield "{"
+    try:
+        for result_index, columns, rows in db.iter_procedure("TxCompare", params):
+            if result_index != current_index:
+                if current_index == 0:
+                    yield "]"
+                elif current_index is not None:
+                    yield "]}"
+                if result_index == 0:
+                    yield f'"columns": {dumps(columns)}, "reportData": ['
+                elif result_index == 1:
+                    yield f', "additionalReports": [{{"columns": {dumps(columns)}, "reportData": ['
+                else:
+                    yield f', {{"columns": {dumps(columns)}, "reportData": ['
+                current_index = result_index
+                first_row = True
+            for row in rows:
+                record = dumps(dict(zip(columns, row)))
+                yield record if first_row else "," + record
+                first_row = False
+                if result_index == 0:
+                    row_count += 1
+    except Exception as e:
+        logger.error(f"TxCompare streaming failed: {e}", exc_info=True)
+        error = str(e)
+
+    if current_index is None:
+        yield '"columns": [], "reportData": []'
+    elif current_index == 0:
+        yield "]"
+    else:
+        yield "]}]"
+    if error is not None:
+        yield f', "status": "error", "error": {dumps(error)}}}'
+        return
+    message = (
+        "비교 보고서 데이터를 성공적으로 추출했습니다."
+        if row_count
+        else "비교 보고서 데이터가 없습니다."
     )
+    yield f', "message": {dumps(message)}, "status": "success"}}'
 
 
 @db_api_bp.route("/export_table_to_word", methods=["GET"])
@@ -274,22 +456,27 @@ def export_table_to_word():
             return error_response("measSSIds 파라미터가 올바르지 않습니다", 400)
         placeholders = ",".join(["?" for _ in id_list])
         query = f"SELECT * FROM [{selected_table}] WHERE measSSId IN ({placeholders})"
-        df = g.current_db.execute_query(query, params=id_list)
+        params = id_list
     else:
         query = f"SELECT * FROM [{selected_table}]"
-        df = g.current_db.execute_query(query)
-    if df is None or df.empty:
+        params = None
+    # 전체 테이블을 한 번에 DataFrame으로 올리지 않고 청크 단위로 문서에 기록
+    doc = None
+    table = None
+    for chunk in g.current_db.iter_query(query, params=params):
+        if table is None:
+            doc = Document()
+            doc.add_heading(f"Table: {selected_table}", 0)
+            table = doc.add_table(rows=1, cols=len(chunk.columns))
+            hdr_cells = table.rows[0].cells
+            for i, col in enumerate(chunk.columns):
+                hdr_cells[i].text = str(col)
+        for row_values in chunk.fillna("").astype(str).values.tolist():
+            row_cells = table.add_row().cells
+            for i, value in enumerate(row_values):
+                row_cells[i].text = value
+    if table is None:
         return error_response("해당 테이블에 데이터가 없습니다", 404)
-    doc = Document()
-    doc.add_heading(f"Table: {selected_table}", 0)
-    table = doc.add_table(rows=1, cols=len(df.columns))
-    hdr_cells = table.rows[0].cells
-    for i, col in enumerate(df.columns):
-        hdr_cells[i].text = str(col)
-    for row_values in df.fillna("").astype(str).values.tolist():
-        row_cells = table.add_row().cells
-        for i, value in enumerate(row_values):
-            row_cells[i].text = value
     buf = io.BytesIO()
     doc.save(buf)
     buf.seek(0)
@@ -0,0 +1,37 @@
+from flask import Blueprint, jsonify
+from utils.warmup import warmup_state
+from pkg_SQL.engine_registry import engine_registry
+
+health_bp = Blueprint("health", __name__, url_prefix="/api/health")
+
+
+@health_bp.route("/ready", methods=["GET"])
+def readiness():
+    """
+    로드밸런서용 readiness 체크 (인증 불필요)
+    warm-up이 완료되고 연결 풀/모델이 준비되면 200, 아니면 503을 반환합니다.
+    """
+    ready = warmup_state.ready
+    pools = [
+        {
+            "database": p["database"],
+            "checked_in": p["checked_in"],
+            "checked_out": p["checked_out"],
+        }
+        for p in engine_registry.stats()
+    ]
+    if ready:
+        status = "ready"
+    elif warmup_state.finished:
+        status = "not_ready"
+    else:
+        status = "warming_up"
+    body = {
+        "status": status,
+        "ready": ready,
+        "pools_ready": warmup_state.step_ok("pool:") if warmup_state.enabled else None,
+        "models_ready": warmup_state.step_ok("models") if warmup_state.enabled else None,
+        "warmup": warmup_state.to_dict(),
+        "pools": pools,
+    }
+    return jsonify(body), 200 if ready else 503
@@ -1,45 +1,275 @@
-from flask import Blueprint, request, jsonify, current_app as app
+from flask import Blueprint, request, jsonify, session, current_app as app
 import os
+import json
+import uuid
 from werkzeug.utils import secure_filename
 from utils.decorators import handle_exceptions, require_auth
 from utils.error_handler import error_response
-from pkg_MeasSetGen.meas_generation import MeasSetGen
+from utils.job_manager import job_manager, JobQueueFull
+from pkg_MeasSetGen.meas_generation import MeasSetGen, GENERATION_STAGES
+from pkg_MeasSetGen import batch_generation
 
 measset_gen_bp = Blueprint("measset_gen", __name__, url_prefix="/api")
 
 
+def _save_upload():
+    """
+    업로드 파일 저장 및 폼 필드 검증
+    Returns: (file_path, database, probeId, probeName) 또는 (None, error_response)
+    """
+    if "file" not in request.files:
+        return None, error_response("No file part", 400)
+    file = request.files["file"]
+    if not file or file.filename == "":
+        return None, error_response("No selected file", 400)
+
+    database = request.form.get("database")
+    probeId = request.form.get("probeId")
+    probeName = request.form.get("probeName")
+    if not all([database, probeId, probeName]):
+        return None, error_response(
+            "Missing required fields: database, probeId, or probeName", 400
+        )
+
+    # 동시 업로드 시 같은 파일명이 서로 덮어쓰지 않도록 고유 접두어 부여
+    file_path = _store_file(file)
+    return (file_path, database, probeId, probeName), None
+
+
+def _store_file(file):
+    """업로드 파일을 고유 이름으로 저장 후 경로 반환"""
+    if not os.path.exists(app.config["UPLOAD_FOLDER"]):
+        os.makedirs(app.config["UPLOAD_FOLDER"])
+    filename = f"{uuid.uuid4().hex[:8]}_{secure_filename(file.filename)}"
+    file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
+    file.save(file_path)
+    return file_path
+
+
+def _remove_file(file_path):
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
+
+def _is_incremental(value):
+    """incremental 폼 필드/항목 값 → 증분 재생성 여부"""
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
 @measset_gen_bp.route("/measset-generation", methods=["POST"])
 @handle_exceptions
 @require_auth
 def upload_file():
-    if not os.path.exists(app.config["UPLOAD_FOLDER"]):
-        os.makedirs(app.config["UPLOAD_FOLDER"])
-    if "file" not in request.files:
-        return error_response("No file part", 400)
-    file = request.files["file"]
-    if file.filename == "":
-        return error_response("No selected file", 400)
-    if file and file.filename:
-        filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-        file.save(file_path)
-        database = request.form.get("database")
-        probeId = request.form.get("probeId")
-        probeName = request.form.get("probeName")
-        if not all([database, probeId, probeName]):
+    upload, error = _save_upload()
+    if error:
+        return error
+    file_path, database, probeId, probeName = upload
+    try:
+        meas_gen = MeasSetGen(database, probeId, probeName, file_path)
+        result_file_path = meas_gen.generate(
+            incremental=_is_incremental(request.form.get("incremental"))
+        )
+        if result_file_path:
+            return jsonify({"status": "success", "csv_key": result_file_path}), 200
+        else:
             return error_response(
-                "Missing required fields: database, probeId, or probeName", 400
+                "Generation failed. Please check input data or file integrity.", 500
             )
-        try:
-            meas_gen = MeasSetGen(database, probeId, probeName, file_path)
-            result_file_path = meas_gen.generate()
-            if result_file_path:
-                return jsonify({"status": "success", "csv_key": result_file_path}), 200
-            else:
-                return error_response(
-                    "Generation failed. Please check input data or file integrity.", 500
-                )
-        finally:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-    return error_response("File handling issue", 400)
+    finally:
+        _remove_file(file_path)
+
+
+def _run_generation(job, database, probeId, probeName, file_path, incremental=False):
+    """워커 스레드에서 실행되는 MeasSetGen 작업"""
+    meas_gen = MeasSetGen(database, probeId, probeName, file_path)
+    try:
+        csv_key = meas_gen.generate(progress=job.report, incremental=incremental)
+    finally:
+        # 실패한 작업도 어느 단계까지 얼마나 걸렸는지 확인할 수 있도록 기록
+        job.metadata["profile"] = meas_gen.profile
+    if not csv_key:
+        raise RuntimeError("Generation failed. Please check input data or file integrity.")
+    return {"csv_key": csv_key}
+
+
+@measset_gen_bp.route("/measset-generation/jobs", methods=["POST"])
+@handle_exceptions
+@require_auth
+def submit_generation_job():
+    """
+    MeasSetGen 작업 제출 (비동기) — 즉시 202와 job_id 반환
+    - incremental: true 이면 신규/변경 beamstyle 만 예측 (증분 재생성)
+                   probe_geo 를 수정한 프로브는 false (전체 재생성) 로 요청
+    진행 상황: GET /api/measset-generation/jobs/<job_id>
+    """
+    upload, error = _save_upload()
+    if error:
+        return error
+    file_path, database, probeId, probeName = upload
+
+    try:
+        job = job_manager.submit(
+            app._get_current_object(),
+            "measset-generation",
+            _run_generation,
+            database,
+            probeId,
+            probeName,
+            file_path,
+            _is_incremental(request.form.get("incremental")),
+            stages=GENERATION_STAGES,
+            cleanup=lambda: _remove_file(file_path),
+        )
+    except JobQueueFull as e:
+        _remove_file(file_path)
+        response, status = error_response(str(e), 503)
+        response.headers["Retry-After"] = str(e.retry_after)
+        return response, status
+
+    return (
+        jsonify(
+            {
+                "status": "accepted",
+                "job_id": job.id,
+                "status_url": f"/api/measset-generation/jobs/{job.id}",
+            }
+        ),
+        202,
+    )
+
+
+@measset_gen_bp.route("/measset-generation/jobs", methods=["GET"])
+@handle_exceptions
+@require_auth
+def list_generation_jobs():
+    """현재 사용자의 작업 목록"""
+    jobs = job_manager.list(owner=session.get("username"))
+    return jsonify({"status": "success", "jobs": [job.to_dict() for job in jobs]}), 200
+
+
+@measset_gen_bp.route("/measset-generation/jobs/<job_id>", methods=["GET"])
+@handle_exceptions
+@require_auth
+def get_generation_job(job_id):
+    """작업 상태 / 단계별 진행률 조회"""
+    job = job_manager.get(job_id, owner=session.get("username"))
+    if job is None:
+        return error_response("Job not found", 404)
+    return jsonify({"status": "success", "job": job.to_dict()}), 200
+
+
+@measset_gen_bp.route("/measset-generation/jobs/<job_id>/result", methods=["GET"])
+@handle_exceptions
+@require_auth
+def get_generation_job_result(job_id):
+    """
+    작업 결과 조회
+    - 완료: 200 + csv_key (기존 /api/measset-generation 응답과 동일한 형식)
+    - 진행 중: 202, 실패: 500
+    """
+    job = job_manager.get(job_id, owner=session.get("username"))
+    if job is None:
+        return error_response("Job not found", 404)
+    if job.status == "succeeded":
+        return jsonify({"status": "success", **job.result}), 200
+    if job.status == "failed":
+        return error_response(job.error or "Generation failed", 500)
+    return jsonify({"status": job.status, "stage": job.stage, "progress": job.progress}), 202
+
+
+def _run_batch(job, items, username, password):
+    """워커 스레드에서 실행되는 일괄 생성 작업 (프로세스 풀로 분산)"""
+    job.report("generate", 0.0)
+    manifest = batch_generation.run_batch(
+        items,
+        username,
+        password,
+        progress=lambda done, total: job.update_progress(done / total),
+    )
+    succeeded = sum(1 for entry in manifest if entry["status"] == "succeeded")
+    return {"total": len(manifest), "succeeded": succeeded, "manifest": manifest}
+
+
+@measset_gen_bp.route("/measset-generation/batch", methods=["POST"])
+@handle_exceptions
+@require_auth
+def submit_batch_generation():
+    """
+    다중 프로브 일괄 생성 작업 제출 (multipart/form-data)
+    - files: 시퀀스 파일 목록 (여러 개)
+    - items: files 와 같은 순서의 JSON 배열
+             [{"probeId", "probeName", "database"(선택), "incremental"(선택)}, ...]
+    - database: items 에 database 가 없을 때 사용할 기본값
+    - incremental: items 에 incremental 이 없을 때 사용할 기본값 (증분 재생성)
+    결과: GET /api/measset-generation/jobs/<job_id>/result → manifest
+    """
+    files = request.files.getlist("files")
+    try:
+        specs = json.loads(request.form.get("items", "[]"))
+    except ValueError:
+        return error_response("items must be a JSON array", 400)
+    if not files or not isinstance(specs, list) or len(files) != len(specs):
+        return error_response("files and items must be non-empty and of equal length", 400)
+    if len(files) > batch_generation.max_items():
+        return error_response(
+            f"Too many items (max {batch_generation.max_items()})", 400
+        )
+
+    default_database = request.form.get("database")
+    default_incremental = request.form.get("incremental")
+    allowed_dbs = [d.strip() for d in os.environ.get("DATABASE_NAME", "").split(",") if d.strip()]
+    for spec in specs:
+        if not isinstance(spec, dict) or not all(
+            [spec.get("database") or default_database, spec.get("probeId"), spec.get("probeName")]
+        ):
+            return error_response(
+                "Each item requires probeId, probeName and database", 400
+            )
+        if (spec.get("database") or default_database) not in allowed_dbs:
+            return error_response("유효하지 않은 데이터베이스입니다", 400)
+
+    items = []
+    for file, spec in zip(files, specs):
+        items.append(
+            {
+                "file_path": _store_file(file),
+                "filename": file.filename,
+                "database": spec.get("database") or default_database,
+                "probeId": str(spec["probeId"]),
+                "probeName": str(spec["probeName"]),
+                "incremental": _is_incremental(spec.get("incremental", default_incremental)),
+            }
+        )
+
+    def cleanup():
+        for item in items:
+            _remove_file(item["file_path"])
+
+    try:
+        job = job_manager.submit(
+            app._get_current_object(),
+            "measset-generation-batch",
+            _run_batch,
+            items,
+            session.get("username"),
+            session.get("password"),
+            stages=["generate"],
+            cleanup=cleanup,
+        )
+    except JobQueueFull as e:
+        cleanup()
+        response, status = error_response(str(e), 503)
+        response.headers["Retry-After"] = str(e.retry_after)
+        return response, status
+
+    return (
+        jsonify(
+            {
+                "status": "accepted",
+                "job_id": job.id,
+                "items": len(items),
+                "status_url": f"/api/measset-generation/jobs/{job.id}",
+            }
+        ),
+        202,
+    )
@@ -6,6 +6,13 @@ from utils.error_handler import error_response
 
 ml_bp = Blueprint("ml", __name__, url_prefix="/api")
 
+# 산점도 포인트 조회 결과의 컬럼 dtype 선언 (컬럼 단위 fetch 사용)
+PREDICTION_POINTS_SCHEMA = {
+    "target_value": "float64",
+    "estimation_value": "float64",
+    "data_index": "float64",
+}
+
 
 @ml_bp.route("/get_ml_models", methods=["GET"])
 @handle_exceptions
@@ -249,7 +256,9 @@ def get_prediction_points():
                 WHERE pp.model_version_id = ?
                 ORDER BY pp.data_index
             """
-            result_df = db.execute_query(query, (int(version_id),))
+            result_df = db.fetch_columnar(
+                query, (int(version_id),), schema=PREDICTION_POINTS_SCHEMA
+            )
         else:
             # 동적 WHERE 절 구성
             where_conditions = ["mv.prediction_type = ?"]
@@ -313,7 +322,9 @@ def get_prediction_points():
                     ORDER BY rm.model_name, mv.version_number DESC, pp.data_index
                 """
 
-            result_df = db.execute_query(query, tuple(params))
+            result_df = db.fetch_columnar(
+                query, tuple(params), schema=PREDICTION_POINTS_SCHEMA
+            )
 
         logger.info(
             f"Query returned {len(result_df)} rows"
@@ -0,0 +1,80 @@
+"""
+검증된 로그인 자격증명 단기 캐시
+- 키: 프로세스별 랜덤 salt로 HMAC-SHA256 한 (username, password) 해시 (평문 미보관)
+- TTL: AUTH_CREDENTIAL_CACHE_TTL 초 (기본 300, 0이면 비활성)
+반복 로그인/재인증 시 SQL Server 왕복을 생략합니다.
+"""
+
+import os
+import hmac
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+MAX_ENTRIES = 1024
+
+
+class CredentialCache:
+    def __init__(self):
+        self._salt = os.urandom(16)
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def ttl():
+        try:
+            return int(os.environ.get("AUTH_CREDENTIAL_CACHE_TTL", 300))
+        except ValueError:
+            return 300
+
+    def _key(self, username, password):
+        message = f"{username}\0{password}".encode("utf-8")
+        return hmac.new(self._salt, message, hashlib.sha256).hexdigest()
+
+    def get(self, username, password):
+        """캐시된 사용자 정보 반환 (없거나 만료 시 None)"""
+        if self.ttl() <= 0:
+            return None
+        key = self._key(username, password)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["expires_at"] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry["user_info"])
+
+    def put(self, username, password, user_info):
+        ttl = self.ttl()
+        if ttl <= 0:
+            return
+        key = self._key(username, password)
+        with self._lock:
+            self._entries[key] = {
+                "username": username,
+                "user_info": dict(user_info),
+                "expires_at": time.monotonic() + ttl,
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > MAX_ENTRIES:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, username):
+        """해당 사용자의 캐시 항목 제거 (로그아웃 등)"""
+        with self._lock:
+            keys = [k for k, e in self._entries.items() if e["username"] == username]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 전역 싱글톤 인스턴스
+credential_cache = CredentialCache()
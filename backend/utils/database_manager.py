@@ -4,12 +4,202 @@
 """
 
 import os
+import time
 import logging
+import threading
+from collections import deque
 from contextlib import contextmanager
 from flask import session, g
 from pkg_SQL.database import SQL
+from pkg_SQL.engine_registry import engine_registry
 from typing import Optional
-from utils.error_handler import CredentialsRequired
+from utils.credential_cache import credential_cache
+from utils.error_handler import CredentialsRequired, ConnectionBudgetExceeded
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class ConnectionBudget:
+    """
+    프로세스 전역 DB 연결 예산 (admission control)
+    - 전역 상한: DB_BUDGET_GLOBAL_LIMIT, 사용자별 상한: DB_BUDGET_PER_USER_LIMIT
+    - 상한 초과 시 FIFO 대기열에서 최대 DB_BUDGET_WAIT_TIMEOUT 초 대기
+      (앞선 대기자 중 사용자 상한에 걸린 경우는 건너뛰고 다음 대기자에게 기회 부여)
+    - 대기 시간 초과 시 ConnectionBudgetExceeded → 503 + Retry-After
+
+    DB 연결은 DatabaseManager.get_connection (get_db_connection / get_mlflow_db) 으로 얻어 예산을 거치고,
+    요청 컨텍스트 밖의 스레드(fetch_selectFeature, warm-up)는 slot() 으로 직접 점유합니다.
+    의도적으로 예산 밖에 두는 경로:
+    - 로그인 인증 (SQL.authenticate_user / create_explicit_connection): 세션이 생기기 전이고
+      시도당 짧은 연결 1개 — 예산 대기열에 넣으면 혼잡 시 로그인 자체가 503 이 됨
+    - benchmarks (SQL.from_url 등): 서버 프로세스 밖에서 실행하는 CLI
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._in_use = 0
+        self._per_user = {}
+        self._waiters = deque()
+        self._peak = 0
+        self._rejected = 0
+
+    # ----- 설정 -----
+    @staticmethod
+    def global_limit():
+        return _env_number("DB_BUDGET_GLOBAL_LIMIT", 64)
+
+    @staticmethod
+    def per_user_limit():
+        return _env_number("DB_BUDGET_PER_USER_LIMIT", 8)
+
+    @staticmethod
+    def wait_timeout():
+        return _env_number("DB_BUDGET_WAIT_TIMEOUT", 10.0, float)
+
+    @staticmethod
+    def retry_after():
+        return _env_number("DB_BUDGET_RETRY_AFTER", 5)
+
+    # ----- 획득/반환 -----
+    def _admissible(self, username):
+        return (
+            self._in_use < self.global_limit()
+            and self._per_user.get(username, 0) < self.per_user_limit()
+        )
+
+    def _next_eligible(self):
+        """대기열 순서대로 지금 입장 가능한 첫 대기자"""
+        for ticket in self._waiters:
+            if self._admissible(ticket[0]):
+                return ticket
+        return None
+
+    def acquire(self, username, database=None, timeout=None):
+        """연결 슬롯 1개 획득 (반환값을 release에 전달)"""
+        timeout = self.wait_timeout() if timeout is None else timeout
+        ticket = (username, database, object())
+        deadline = time.monotonic() + timeout
+
+        with self._cond:
+            self._waiters.append(ticket)
+            try:
+                while self._next_eligible() is not ticket:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._rejected += 1
+                        raise ConnectionBudgetExceeded(
+                            f"DB 연결 한도 초과 (사용 중 {self._in_use}/{self.global_limit()}, "
+                            f"{username}: {self._per_user.get(username, 0)}/{self.per_user_limit()}). "
+                            "잠시 후 다시 시도해 주세요.",
+                            retry_after=self.retry_after(),
+                        )
+                    self._cond.wait(remaining)
+            finally:
+                self._waiters.remove(ticket)
+                # 대기열 순서가 바뀌었으므로 다른 대기자 재평가
+                self._cond.notify_all()
+
+            self._in_use += 1
+            self._per_user[username] = self._per_user.get(username, 0) + 1
+            self._peak = max(self._peak, self._in_use)
+        return ticket
+
+    def release(self, ticket):
+        username = ticket[0]
+        with self._cond:
+            self._in_use = max(0, self._in_use - 1)
+            count = self._per_user.get(username, 0) - 1
+            if count > 0:
+                self._per_user[username] = count
+            else:
+                self._per_user.pop(username, None)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, username, database=None, timeout=None):
+        """with 블록 동안 연결 슬롯 점유 (백그라운드 스레드용)"""
+        ticket = self.acquire(username, database, timeout)
+        try:
+            yield
+        finally:
+            self.release(ticket)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "in_use": self._in_use,
+                "global_limit": self.global_limit(),
+                "per_user_limit": self.per_user_limit(),
+                "per_user": dict(self._per_user),
+                "waiting": len(self._waiters),
+                "peak": self._peak,
+                "rejected": self._rejected,
+            }
+
+
+# 전역 연결 예산 인스턴스
+connection_budget = ConnectionBudget()
+
+
+class SessionTracker:
+    """
+    사용자별 살아 있는 로그인 세션 (토큰 sess 클레임 → exp)
+    - 인증된 요청/로그인/갱신 시 touch, 로그아웃/토큰 만료 시 end
+    - 같은 사용자의 엔진(연결 풀)은 모든 세션이 공유하므로 마지막 세션이 끝날 때만 정리
+      (브라우저를 닫아 end 가 오지 않는 세션은 EngineRegistry 유휴 정리가 처리)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions = {}
+
+    @staticmethod
+    def _prune(sessions, now):
+        for sess in [s for s, exp in sessions.items() if exp is not None and exp <= now]:
+            del sessions[sess]
+
+    def touch(self, username, sess, exp=None):
+        if not username or not sess:
+            return
+        with self._lock:
+            sessions = self._sessions.setdefault(username, {})
+            self._prune(sessions, time.time())
+            sessions[sess] = exp
+
+    def end(self, username, sess):
+        """
+        세션 종료 기록. 이 호출로 사용자의 마지막 세션이 끝났으면 True
+        (이미 끝난 세션의 반복 호출, sess 가 없는 토큰은 False)
+        """
+        if not username or not sess:
+            return False
+        with self._lock:
+            sessions = self._sessions.get(username)
+            if not sessions or sess not in sessions:
+                return False
+            del sessions[sess]
+            self._prune(sessions, time.time())
+            if sessions:
+                return False
+            del self._sessions[username]
+            return True
+
+    def stats(self):
+        now = time.time()
+        with self._lock:
+            return {
+                username: sum(1 for exp in sessions.values() if exp is None or exp > now)
+                for username, sessions in self._sessions.items()
+            }
+
+
+# 전역 세션 추적 인스턴스
+session_tracker = SessionTracker()
 
 
 class DatabaseManager:
@@ -76,11 +266,19 @@ class DatabaseManager:
         if hasattr(g, "db_connections") and connection_key in g.db_connections:
             return g.db_connections[connection_key]
 
-        connection = SQL(username=username, password=password, database=database)
+        # 전역/사용자별 연결 예산 확인 (요청 종료 시 close_connections에서 반환)
+        ticket = connection_budget.acquire(username, database)
+        try:
+            connection = SQL(username=username, password=password, database=database)
+        except Exception:
+            connection_budget.release(ticket)
+            raise
 
         if not hasattr(g, "db_connections"):
             g.db_connections = {}
+            g.db_budget_tickets = []
         g.db_connections[connection_key] = connection
+        g.db_budget_tickets.append(ticket)
 
         self.logger.info(
             f"Database connection created: {database} for user {username}"
@@ -116,6 +314,19 @@ class DatabaseManager:
         """환경변수에서 기본 데이터베이스명 가져오기"""
         return os.environ.get("DEFAULT_DATABASE", "AOP_Database")
 
+    def release_user(self, username: str, sess: Optional[str] = None):
+        """
+        로그인 세션 종료 처리 (로그아웃/토큰 만료 시)
+        사용자의 마지막 세션이 끝난 경우에만 공유 연결 풀과 자격증명 캐시를 정리합니다.
+        """
+        if not session_tracker.end(username, sess):
+            return 0
+        disposed = engine_registry.dispose_user(username)
+        credential_cache.invalidate_user(username)
+        if disposed:
+            self.logger.info(f"Released {disposed} engine(s) for user {username}")
+        return disposed
+
     @staticmethod
     def close_connections():
         """Flask 요청 종료 시 연결 정리"""
@@ -127,6 +338,9 @@ class DatabaseManager:
                 except Exception as e:
                     logging.error(f"Failed to close connection {connection_key}: {e}")
             g.db_connections = {}
+        for ticket in getattr(g, "db_budget_tickets", []):
+            connection_budget.release(ticket)
+        g.db_budget_tickets = []
 
 
 # 전역 싱글톤 인스턴스
@@ -3,8 +3,9 @@ from flask import request, g
 import os
 import jwt
 from config import Config
-from utils.database_manager import db_manager
-from .error_handler import error_response, CredentialsRequired
+from utils.database_manager import db_manager, session_tracker
+from utils.token_cache import token_cache
+from .error_handler import error_response, CredentialsRequired, ConnectionBudgetExceeded
 from .logger import logger
 
 
@@ -16,6 +17,11 @@ def handle_exceptions(f):
         except CredentialsRequired as e:
             logger.warning(f"Credentials required: {str(e)}")
             return error_response("Username and password are required", 422)
+        except ConnectionBudgetExceeded as e:
+            logger.warning(f"Connection budget exhausted: {str(e)}")
+            response, status = error_response(str(e), 503)
+            response.headers["Retry-After"] = str(e.retry_after)
+            return response, status
         except Exception as e:
             logger.error(f"Error occurred: {str(e)}", exc_info=True)
             return error_response(str(e), 500)
@@ -23,6 +29,22 @@ def handle_exceptions(f):
     return decorated_function
 
 
+def release_token(token):
+    """토큰의 로그인 세션 종료 (서명은 검증, exp만 무시) — 사용자의 마지막 세션이면 연결 풀 정리"""
+    try:
+        payload = jwt.decode(
+            token,
+            Config.SECRET_KEY,
+            algorithms=["HS256"],
+            options={"verify_exp": False},
+        )
+    except jwt.InvalidTokenError:
+        return
+    username = payload.get("username")
+    if username:
+        db_manager.release_user(username, payload.get("sess"))
+
+
 def require_auth(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -30,11 +52,37 @@ def require_auth(f):
         if not token:
             return error_response("Authentication required", 401)
         try:
-            jwt.decode(token, Config.SECRET_KEY, algorithms=["HS256"])
+            # 검증된 토큰은 exp까지 캐시에서 바로 확인
+            g.auth_payload = token_cache.verify(token)
         except jwt.ExpiredSignatureError:
+            release_token(token)
             return error_response("Token expired", 401)
         except jwt.InvalidTokenError:
             return error_response("Invalid token", 403)
+        session_tracker.touch(
+            g.auth_payload.get("username"), g.auth_payload.get("sess"), g.auth_payload.get("exp")
+        )
+        return f(*args, **kwargs)
+
+    return decorated_function
+
+
+def admin_usernames():
+    """관리자 사용자 목록 (AOP_config.cfg [Admin] USERNAMES, 쉼표 구분, 대소문자 무시)"""
+    raw = os.environ.get("ADMIN_USERNAMES", "")
+    return {name.strip().lower() for name in raw.split(",") if name.strip()}
+
+
+def require_admin(f):
+    """require_auth 뒤에 사용 — 토큰 사용자가 관리자 목록에 없으면 403 (목록이 비어 있으면 모두 거부)"""
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        payload = getattr(g, "auth_payload", None) or {}
+        username = str(payload.get("username") or "").lower()
+        if not username or username not in admin_usernames():
+            logger.warning(f"Admin access denied: {payload.get('username')!r} {request.path}")
+            return error_response("Admin privileges required", 403)
         return f(*args, **kwargs)
 
     return decorated_function
@@ -6,5 +6,13 @@ class CredentialsRequired(Exception):
     pass
 
 
+class ConnectionBudgetExceeded(Exception):
+    """연결 예산 대기 시간 초과 — handle_exceptions 가 503 + Retry-After 로 변환합니다."""
+
+    def __init__(self, message, retry_after=5):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 def error_response(message: str, status_code: int):
     return jsonify({"status": "error", "message": message}), status_code
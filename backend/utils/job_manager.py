@@ -0,0 +1,212 @@
+"""
+백그라운드 작업(job) 관리자
+- 제한된 크기의 워커 풀(JOBS_MAX_WORKERS)과 대기열 상한(JOBS_MAX_QUEUE)
+- 작업별 상태(queued/running/succeeded/failed), 단계별 진행률과 소요 시간
+- 완료된 작업은 JOBS_RESULT_TTL 초 후 정리
+
+워커 스레드에는 요청 컨텍스트가 없으므로, 제출한 사용자의 세션 자격증명을 담은
+요청 컨텍스트를 새로 만들어 실행합니다 (기존 session / g 기반 DB 연결 코드 그대로 사용).
+"""
+
+import os
+import time
+import uuid
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import session
+
+logger = logging.getLogger("JobManager")
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업이 상한에 도달 — 503 + Retry-After 로 응답"""
+
+    def __init__(self, message, retry_after=10):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class Job:
+    """단일 작업 상태"""
+
+    def __init__(self, kind, owner, stages=None):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.owner = owner
+        self.status = "queued"
+        self.stage = None
+        self.progress = 0.0
+        self.stages = {name: {"status": "pending", "seconds": None} for name in (stages or [])}
+        self.result = None
+        self.error = None
+        self.metadata = {}  # 작업 함수가 남기는 부가 정보 (예: 단계별 계측 결과)
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._stage_started = None
+        self._lock = threading.Lock()
+
+    def report(self, stage, progress=None):
+        """단계 시작 보고 (이전 단계는 완료 처리)"""
+        now = time.perf_counter()
+        with self._lock:
+            self._finish_stage(now)
+            self.stage = stage
+            self._stage_started = now
+            self.stages.setdefault(stage, {"status": "pending", "seconds": None})
+            self.stages[stage]["status"] = "running"
+            if progress is not None:
+                self.progress = round(min(max(progress, 0.0), 1.0), 3)
+            else:
+                done = sum(1 for s in self.stages.values() if s["status"] == "done")
+                self.progress = round(done / max(len(self.stages), 1), 3)
+
+    def update_progress(self, progress):
+        """현재 단계의 진행률만 갱신 (단계 시작 시각/소요 시간은 유지)"""
+        with self._lock:
+            self.progress = round(min(max(progress, 0.0), 1.0), 3)
+
+    def _finish_stage(self, now):
+        if self.stage is not None and self.stages[self.stage]["status"] == "running":
+            self.stages[self.stage]["status"] = "done"
+            self.stages[self.stage]["seconds"] = round(now - self._stage_started, 3)
+
+    def _complete(self, result=None, error=None):
+        with self._lock:
+            if error is None:
+                self._finish_stage(time.perf_counter())
+                self.status = "succeeded"
+                self.progress = 1.0
+                self.result = result
+            else:
+                if self.stage is not None:
+                    self.stages[self.stage]["status"] = "failed"
+                self.status = "failed"
+                self.error = error
+            self.finished_at = time.time()
+
+    @property
+    def finished(self):
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "job_id": self.id,
+                "kind": self.kind,
+                "status": self.status,
+                "stage": self.stage,
+                "progress": self.progress,
+                "stages": {name: dict(stage) for name, stage in self.stages.items()},
+                "result": self.result,
+                "error": self.error,
+                "metadata": dict(self.metadata),
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+            }
+
+
+class JobManager:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._executor = None
+
+    @staticmethod
+    def max_workers():
+        return max(1, _env_int("JOBS_MAX_WORKERS", 2))
+
+    @staticmethod
+    def max_queue():
+        return _env_int("JOBS_MAX_QUEUE", 20)
+
+    @staticmethod
+    def result_ttl():
+        return _env_int("JOBS_RESULT_TTL", 3600)
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers(), thread_name_prefix="aop-job"
+            )
+        return self._executor
+
+    def submit(self, app, kind, func, *args, stages=None, cleanup=None, **kwargs):
+        """
+        작업 제출 (요청 처리 중에 호출)
+        func(job, *args, **kwargs)는 워커 스레드에서 제출자 세션 자격증명으로 실행되며,
+        반환값이 job.result가 됩니다. cleanup은 성공/실패와 무관하게 마지막에 호출됩니다.
+        """
+        username = session.get("username")
+        password = session.get("password")
+
+        with self._lock:
+            self._purge_expired()
+            pending = sum(1 for j in self._jobs.values() if not j.finished)
+            if pending >= self.max_queue():
+                raise JobQueueFull(
+                    f"작업 대기열이 가득 찼습니다 ({pending}/{self.max_queue()}). "
+                    "잠시 후 다시 시도해 주세요."
+                )
+            job = Job(kind, username, stages)
+            self._jobs[job.id] = job
+
+        def run():
+            job.started_at = time.time()
+            job.status = "running"
+            try:
+                with app.test_request_context():
+                    session["username"] = username
+                    session["password"] = password
+                    result = func(job, *args, **kwargs)
+                job._complete(result=result)
+                logger.info(f"Job {job.id} ({kind}) succeeded")
+            except Exception as e:
+                job._complete(error=str(e))
+                logger.error(f"Job {job.id} ({kind}) failed: {e}", exc_info=True)
+            finally:
+                if cleanup is not None:
+                    try:
+                        cleanup()
+                    except Exception as e:
+                        logger.warning(f"Job {job.id} cleanup failed: {e}")
+
+        self._get_executor().submit(run)
+        return job
+
+    def get(self, job_id, owner=None):
+        """작업 조회 (owner 지정 시 제출자가 다르면 None)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or (owner is not None and job.owner != owner):
+            return None
+        return job
+
+    def list(self, owner=None):
+        with self._lock:
+            jobs = [j for j in self._jobs.values() if owner is None or j.owner == owner]
+        return sorted(jobs, key=lambda j: j.created_at, reverse=True)
+
+    def _purge_expired(self):
+        now = time.time()
+        ttl = self.result_ttl()
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished and now - job.finished_at > ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+# 전역 싱글톤 인스턴스
+job_manager = JobManager()
@@ -0,0 +1,72 @@
+"""
+검증된 JWT 토큰 LRU 캐시
+- 한 번 서명 검증에 성공한 토큰은 exp 시각까지 jwt.decode 없이 payload 반환
+- 크기: AUTH_TOKEN_CACHE_SIZE (기본 4096, 0이면 비활성)
+- SECRET_KEY가 바뀌면 캐시 전체 무효화
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+
+import jwt
+
+from config import Config
+
+
+class TokenCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._secret = None
+
+    @staticmethod
+    def max_entries():
+        try:
+            return int(os.environ.get("AUTH_TOKEN_CACHE_SIZE", 4096))
+        except ValueError:
+            return 4096
+
+    def verify(self, token):
+        """
+        토큰 검증 후 payload(dict 복사본) 반환
+        실패 시 jwt.ExpiredSignatureError / jwt.InvalidTokenError 발생 (jwt.decode와 동일)
+        """
+        limit = self.max_entries()
+        if limit <= 0:
+            return jwt.decode(token, Config.SECRET_KEY, algorithms=["HS256"])
+
+        now = time.time()
+        with self._lock:
+            if self._secret != Config.SECRET_KEY:
+                self._entries.clear()
+                self._secret = Config.SECRET_KEY
+            payload = self._entries.get(token)
+            if payload is not None:
+                if payload.get("exp") is not None and payload["exp"] <= now:
+                    del self._entries[token]
+                    raise jwt.ExpiredSignatureError("Signature has expired")
+                self._entries.move_to_end(token)
+                return dict(payload)
+
+        payload = jwt.decode(token, Config.SECRET_KEY, algorithms=["HS256"])
+        with self._lock:
+            self._entries[token] = payload
+            self._entries.move_to_end(token)
+            while len(self._entries) > limit:
+                self._entries.popitem(last=False)
+        return dict(payload)
+
+    def discard(self, token):
+        """캐시에서 토큰 제거 (로그아웃/갱신 시)"""
+        with self._lock:
+            self._entries.pop(token, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 전역 싱글톤 인스턴스
+token_cache = TokenCache()
@@ -0,0 +1,169 @@
+"""
+애플리케이션 시작 시 연결 사전 준비 (warm-up)
+1) ODBC 드라이버 매니저 초기화
+2) DB 서버 주소 DNS 해석
+3) 서비스 계정으로 DATABASE_NAME 각 DB의 연결 풀 생성 (SELECT 1)
+4) 온도 예측 모델 아티팩트 로드
+결과는 /api/health/ready 에서 조회합니다.
+
+설정 (AOP_config.cfg [Warmup] 또는 환경변수):
+    WARMUP_ENABLED=true
+    WARMUP_USERNAME / WARMUP_PASSWORD  (서비스 계정, 환경변수로만 지정 권장)
+"""
+
+import os
+import time
+import socket
+import logging
+import threading
+
+logger = logging.getLogger("Warmup")
+
+
+class WarmupState:
+    """warm-up 진행 상태 및 단계별 소요 시간"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.enabled = False
+        self.running = False
+        self.finished = False
+        self.started_at = None
+        self.finished_at = None
+        self.steps = {}
+
+    def set_step(self, name, ok, seconds, detail=None):
+        with self._lock:
+            self.steps[name] = {
+                "ok": ok,
+                "seconds": round(seconds, 3),
+                "detail": detail,
+            }
+
+    def step_ok(self, prefix):
+        with self._lock:
+            matched = [s["ok"] for name, s in self.steps.items() if name.startswith(prefix)]
+        return bool(matched) and all(matched)
+
+    @property
+    def ready(self):
+        if not self.enabled:
+            return True
+        return self.finished and self.step_ok("pool:") and self.step_ok("models")
+
+    def to_dict(self):
+        with self._lock:
+            steps = {name: dict(step) for name, step in self.steps.items()}
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "finished": self.finished,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "total_seconds": (
+                round(self.finished_at - self.started_at, 3)
+                if self.finished_at and self.started_at
+                else None
+            ),
+            "steps": steps,
+        }
+
+
+warmup_state = WarmupState()
+
+
+def _timed(name, func):
+    start = time.perf_counter()
+    try:
+        detail = func()
+        warmup_state.set_step(name, True, time.perf_counter() - start, detail)
+        return True
+    except Exception as e:
+        warmup_state.set_step(name, False, time.perf_counter() - start, str(e))
+        logger.warning(f"Warm-up step '{name}' failed: {e}")
+        return False
+
+
+def _init_odbc_driver():
+    import pyodbc
+
+    drivers = pyodbc.drivers()
+    if "ODBC Driver 17 for SQL Server" not in drivers:
+        raise RuntimeError(f"ODBC Driver 17 for SQL Server not installed ({drivers})")
+    return "ODBC Driver 17 for SQL Server"
+
+
+def _resolve_server():
+    server = os.environ.get("SERVER_ADDRESS_ADDRESS")
+    if not server:
+        raise RuntimeError("SERVER_ADDRESS_ADDRESS is not configured")
+    host = server.split(",")[0].split("\\")[0]
+    infos = socket.getaddrinfo(host, 1433, proto=socket.IPPROTO_TCP)
+    return sorted({info[4][0] for info in infos})
+
+
+def _warm_pool(username, password, database):
+    from sqlalchemy import text
+    from pkg_SQL.database import SQL
+    from utils.database_manager import connection_budget
+
+    # 요청 컨텍스트가 없는 백그라운드 스레드라 db_manager 대신 예산 슬롯을 직접 점유
+    with connection_budget.slot(username, database):
+        sql = SQL(username=username, password=password, database=database)
+        with sql.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    return "connected"
+
+
+def _load_models():
+    # 프로세스 캐시에 올려 두어 첫 생성 요청에서 로드하지 않도록 함
+    from pkg_MeasSetGen.Temp_Prr_predict import load_artifacts, artifact_fingerprint
+
+    _, feature_columns = load_artifacts()
+    return f"{len(feature_columns)} feature columns (sha256 {artifact_fingerprint()[:12]})"
+
+
+def run_warmup():
+    """warm-up 전체 단계를 순서대로 실행 (백그라운드 스레드에서 호출)"""
+    warmup_state.running = True
+    warmup_state.started_at = time.time()
+    try:
+        _timed("odbc_driver", _init_odbc_driver)
+        _timed("dns", _resolve_server)
+
+        username = os.environ.get("WARMUP_USERNAME")
+        password = os.environ.get("WARMUP_PASSWORD")
+        databases = [
+            d.strip() for d in os.environ.get("DATABASE_NAME", "").split(",") if d.strip()
+        ]
+        databases.append("AOP_MLflow_Tracking")
+        if username and password:
+            for database in databases:
+                _timed(
+                    f"pool:{database}",
+                    lambda db=database: _warm_pool(username, password, db),
+                )
+        else:
+            warmup_state.set_step(
+                "pool:skipped", True, 0.0, "WARMUP_USERNAME/WARMUP_PASSWORD not set"
+            )
+
+        _timed("models", _load_models)
+    finally:
+        warmup_state.finished_at = time.time()
+        warmup_state.running = False
+        warmup_state.finished = True
+        logger.info(
+            f"Warm-up finished in {warmup_state.finished_at - warmup_state.started_at:.2f}s "
+            f"(ready={warmup_state.ready})"
+        )
+
+
+def start_warmup():
+    """WARMUP_ENABLED=true 일 때 백그라운드 스레드로 warm-up 시작"""
+    if os.environ.get("WARMUP_ENABLED", "false").lower() != "true":
+        return None
+    warmup_state.enabled = True
+    thread = threading.Thread(target=run_warmup, name="aop-warmup", daemon=True)
+    thread.start()
+    return thread
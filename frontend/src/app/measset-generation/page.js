@@ -3,6 +3,19 @@
 import { useState, useEffect, useRef } from 'react';
 import DataPreviewModal from '../../components/DataPreviewModal';
 
+// 생성 작업 결과 조회 주기 / 최대 대기 시간
+const JOB_POLL_INTERVAL_MS = 1500;
+const JOB_POLL_TIMEOUT_MS = 10 * 60 * 1000;
+
+// signal 이 중단되면 즉시 AbortError 로 끝나는 대기
+const wait = (ms, signal) => new Promise((resolve, reject) => {
+  const timer = setTimeout(resolve, ms);
+  signal.addEventListener('abort', () => {
+    clearTimeout(timer);
+    reject(new DOMException('Polling aborted', 'AbortError'));
+  }, { once: true });
+});
+
 export default function MeasSetGen() {
   // 기본 상태 변수 선언
   const [probeList, setProbeList] = useState([]);                // 프로브 목록
@@ -18,6 +31,10 @@ export default function MeasSetGen() {
   const [dataWindowReference, setDataWindowReference] = useState(null); // 데이터 창 참조
   const [updatedCount, setUpdatedCount] = useState(0);           // 업데이트된 데이터 수
   const [showPreviewModal, setShowPreviewModal] = useState(false); // Data Preview 모달
+  const pollControllerRef = useRef(null);                        // 작업 결과 조회 중단용
+
+  // 언마운트 시 진행 중인 작업 결과 조회 중단
+  useEffect(() => () => pollControllerRef.current?.abort(), []);
 
   const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL || 'http://localhost:5000';
 
@@ -288,13 +305,51 @@ export default function MeasSetGen() {
     formData.append('probeId', probeId);
     formData.append('probeName', probeName);
 
-    // 파일 업로드 및 처리 요청
-    const response = await fetch(`${API_BASE_URL}/api/measset-generation`, {
+    // 파일 업로드 및 생성 작업 제출 (비동기 job)
+    const submitResponse = await fetch(`${API_BASE_URL}/api/measset-generation/jobs`, {
       method: 'POST',
       body: formData,
       credentials: 'include',
     });
-    
+
+    if (!submitResponse.ok) {
+      const errorText = await submitResponse.text();
+      throw new Error(`파일 처리 실패: ${errorText}`);
+    }
+
+    const { job_id: jobId } = await submitResponse.json();
+
+    // 작업 완료까지 결과 조회 (진행 중이면 202, 최대 JOB_POLL_TIMEOUT_MS)
+    pollControllerRef.current?.abort();
+    const controller = new AbortController();
+    pollControllerRef.current = controller;
+    const deadline = Date.now() + JOB_POLL_TIMEOUT_MS;
+    let response;
+    try {
+      for (;;) {
+        try {
+          response = await fetch(`${API_BASE_URL}/api/measset-generation/jobs/${jobId}/result`, {
+            method: 'GET',
+            credentials: 'include',
+            signal: controller.signal,
+          });
+        } catch (err) {
+          if (err.name === 'AbortError') throw err;
+          throw new Error(`작업 상태 조회 실패 (네트워크 오류): ${err.message}`);
+        }
+        if (response.status === 404) {
+          throw new Error('생성 작업을 찾을 수 없습니다 (만료되었거나 서버가 재시작됨). 다시 실행해 주세요.');
+        }
+        if (response.status !== 202) break;
+        if (Date.now() + JOB_POLL_INTERVAL_MS > deadline) {
+          throw new Error(`생성 작업이 ${JOB_POLL_TIMEOUT_MS / 60000}분 안에 끝나지 않았습니다 (작업 ID: ${jobId}).`);
+        }
+        await wait(JOB_POLL_INTERVAL_MS, controller.signal);
+      }
+    } finally {
+      if (pollControllerRef.current === controller) pollControllerRef.current = null;
+    }
+
     if (!response.ok) {
       const errorText = await response.text();
       throw new Error(`파일 처리 실패: ${errorText}`);
@@ -305,17 +360,20 @@ export default function MeasSetGen() {
     if (data.status === 'success' && data.data) {
       return data.data;
     } else if (data.status === 'success' && data.csv_key) {
-      // CSV 데이터 요청
-      const csvResponse = await fetch(`${API_BASE_URL}/api/csv-data?csv_key=${data.csv_key}`, {
-        method: 'GET',
-        credentials: 'include',
-      });
+      // CSV 파일 스트리밍 요청 (gzip 압축 전송, JSON 래핑 없음)
+      const csvResponse = await fetch(
+        `${API_BASE_URL}/api/csv-data?csv_key=${encodeURIComponent(data.csv_key)}&format=csv`,
+        {
+          method: 'GET',
+          credentials: 'include',
+        }
+      );
       
       if (!csvResponse.ok) throw new Error('CSV 데이터를 가져오는데 실패했습니다');
       
-      const csvResult = await csvResponse.json();
-      if (csvResult.status === 'success' && csvResult.data) {
-        return csvResult.data;
+      const csvText = await csvResponse.text();
+      if (csvText) {
+        return csvText;
       }
     }
     
@@ -362,6 +420,8 @@ export default function MeasSetGen() {
       setError(null);
       return filteredData; // 필터링된 데이터 반환
     } catch (err) {
+      // 화면을 벗어나 조회를 중단한 경우는 오류로 표시하지 않음
+      if (err.name === 'AbortError') return null;
       console.error('오류:', err);
       setError(err.message);
       return null;
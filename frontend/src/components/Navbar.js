@@ -55,6 +55,11 @@ const Navbar = () => {
         } else {
           setIsAuthenticated(true);
           setUsername(data.username);
+          // 만료가 가까우면 재로그인 없이 토큰 갱신
+          if (data.refresh_recommended) {
+            fetch(`${API_BASE_URL}/api/auth/refresh`, { method: 'POST', credentials: 'include' })
+              .catch((err) => console.error('Token refresh failed:', err));
+          }
         }
       } else {
         setIsAuthenticated(false);